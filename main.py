@@ -16,6 +16,7 @@ from pathlib import Path
 import anthropic
 
 from src.python.orchestration.coordinator import ClinicalPipelineCoordinator
+from src.python.orchestration.state import WorkflowStatus
 from src.python.utils.config import settings
 
 
@@ -90,7 +91,7 @@ Examples:
 
     elif args.output == "summary":
         print(f"Workflow ID: {state.workflow_id}")
-        print(f"Status:      {state.status.value}")
+        print(f"Status:      {state.status.label}")
         duration = state.total_duration_seconds
         if duration is not None:
             print(f"Duration:    {duration:.1f}s")
@@ -105,22 +106,22 @@ Examples:
                 "skipped": "-",
                 "running": "~",
                 "pending": ".",
-            }.get(phase.status.value, "?")
+            }.get(phase.status.label, "?")
             dur = f"{phase.duration_seconds:.1f}s" if phase.duration_seconds else "--"
-            print(f"  [{status_icon}] {phase.phase_name:<20} {phase.status.value:<12} {dur}")
+            print(f"  [{status_icon}] {phase.phase_name:<20} {phase.status.label:<12} {dur}")
             if phase.error:
                 print(f"      Error: {phase.error}")
 
     elif args.output == "full":
         print(f"Workflow ID: {state.workflow_id}")
-        print(f"Status:      {state.status.value}")
+        print(f"Status:      {state.status.label}")
         duration = state.total_duration_seconds
         if duration is not None:
             print(f"Duration:    {duration:.1f}s")
         print()
         for phase in state.all_phases:
             print(f"{'=' * 60}")
-            print(f"Phase: {phase.phase_name} ({phase.status.value})")
+            print(f"Phase: {phase.phase_name} ({phase.status.label})")
             if phase.duration_seconds:
                 print(f"Duration: {phase.duration_seconds:.1f}s")
             if phase.usage:
@@ -132,7 +133,7 @@ Examples:
             print()
 
     # Exit with appropriate code
-    sys.exit(0 if state.status.value == "completed" else 1)
+    sys.exit(0 if state.status == WorkflowStatus.COMPLETED else 1)
 
 
 if __name__ == "__main__":
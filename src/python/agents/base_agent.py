@@ -5,6 +5,7 @@ Provides shared functionality for all clinical sub-agents including
 skill loading, structured output, and timeout management.
 """
 
+import asyncio
 from typing import Any
 
 import anthropic
@@ -21,7 +22,7 @@ class BaseAgent:
     Base class for all clinical sub-agents.
 
     Provides:
-    - Anthropic client initialization
+    - Anthropic client initialization (sync, plus optional async)
     - Skill loading into system prompts
     - Structured message handling
     - Timeout and error handling
@@ -31,17 +32,24 @@ class BaseAgent:
     agent_description: str = "Base clinical agent"
     required_skills: tuple[str, ...] = ()
 
-    def __init__(self, client: anthropic.Anthropic | None = None):
+    def __init__(
+        self,
+        client: anthropic.Anthropic | None = None,
+        async_client: anthropic.AsyncAnthropic | None = None,
+    ):
         """
         Initialize the agent.
 
         Args:
             client: Optional pre-configured Anthropic client.
                     If None, creates one from settings.
+            async_client: Optional pre-configured AsyncAnthropic client used by arun().
+                    If None, arun() runs the sync client in a worker thread.
         """
         self.client = client or anthropic.Anthropic(
             api_key=settings.anthropic_api_key,
         )
+        self.async_client = async_client
         self.model = settings.claude_model
 
         # Load skills into system prompt
@@ -89,8 +97,111 @@ class BaseAgent:
         Returns:
             Dictionary with 'content' (str) and 'usage' (dict) keys
         """
-        messages = self._build_messages(prompt, context)
+        params = self._message_params(prompt, context)
+        self._log_run_started(prompt, context)
 
+        try:
+            response = self.client.messages.create(**params)
+        except anthropic.APIError as e:
+            return self._error_result(e)
+
+        return self._build_result(response)
+
+    async def arun(self, prompt: str, context: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Async variant of run() for concurrent pipeline phases.
+
+        Uses the AsyncAnthropic client when one was provided; otherwise the
+        sync client call is moved off the event loop with asyncio.to_thread.
+
+        Args:
+            prompt: The user/orchestrator prompt
+            context: Optional context dict (patient data, prior results, etc.)
+
+        Returns:
+            Dictionary with 'content' (str) and 'usage' (dict) keys
+        """
+        if self.async_client is None:
+            return await asyncio.to_thread(self.run, prompt, context)
+
+        params = self._message_params(prompt, context)
+        self._log_run_started(prompt, context)
+
+        try:
+            response = await self.async_client.messages.create(**params)
+        except anthropic.APIError as e:
+            return self._error_result(e)
+
+        return self._build_result(response)
+
+    def batch_request(
+        self, custom_id: str, prompt: str, context: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Build a Message Batches request equivalent to run(prompt, context).
+
+        Args:
+            custom_id: Identifier used to match the batch result back to its caller
+            prompt: The user/orchestrator prompt
+            context: Optional context dict (patient data, prior results, etc.)
+
+        Returns:
+            Request dict for client.messages.batches.create
+        """
+        return {"custom_id": custom_id, "params": self._message_params(prompt, context)}
+
+    def batch_result(self, result: Any | None) -> dict[str, Any]:
+        """
+        Convert a Message Batches result into the agent result dict.
+
+        Args:
+            result: The ``result`` of a batch results entry, or None if the batch
+                returned no entry for this agent's request
+
+        Returns:
+            Dictionary with 'content' (str) and 'usage' (dict) keys, or an 'error' key
+        """
+        if result is not None and result.type == "succeeded":
+            return self._build_result(result.message)
+
+        if result is None:
+            error = "Batch result missing"
+        elif result.type == "errored":
+            error = f"API error: {result.error.error.message}"
+        else:
+            error = f"Batch request {result.type}"
+
+        logger.error(
+            "agent_batch_error",
+            agent_name=self.agent_name,
+            error=error,
+        )
+        return {
+            "content": "",
+            "agent": self.agent_name,
+            "error": error,
+        }
+
+    def _message_params(self, prompt: str, context: dict[str, Any] | None) -> dict[str, Any]:
+        """
+        Build the Messages API parameters shared by run(), arun(), and batch requests.
+
+        Args:
+            prompt: The user prompt
+            context: Optional context to prepend
+
+        Returns:
+            Keyword arguments for messages.create
+        """
+        return {
+            "model": self.model,
+            "max_tokens": 4096,
+            "system": self._system_prompt,
+            "messages": self._build_messages(prompt, context),
+        }
+
+    def _log_run_started(self, prompt: str, context: dict[str, Any] | None) -> None:
+        """Log the start of an agent run."""
         logger.info(
             "agent_run_started",
             agent_name=self.agent_name,
@@ -98,38 +209,50 @@ class BaseAgent:
             has_context=context is not None,
         )
 
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,
-                system=self._system_prompt,
-                messages=messages,
-            )
+    def _build_result(self, response: Any) -> dict[str, Any]:
+        """
+        Convert an Anthropic Messages API response into the agent result dict.
 
-            content = response.content[0].text if response.content else ""
+        Args:
+            response: Response returned by messages.create
 
-            result = {
-                "content": content,
-                "agent": self.agent_name,
-                "model": response.model,
-                "usage": {
-                    "input_tokens": response.usage.input_tokens,
-                    "output_tokens": response.usage.output_tokens,
-                },
-                "stop_reason": response.stop_reason,
-            }
+        Returns:
+            Dictionary with 'content' (str) and 'usage' (dict) keys
+        """
+        content = response.content[0].text if response.content else ""
+
+        result = {
+            "content": content,
+            "agent": self.agent_name,
+            "model": response.model,
+            "usage": {
+                "input_tokens": response.usage.input_tokens,
+                "output_tokens": response.usage.output_tokens,
+            },
+            "stop_reason": response.stop_reason,
+        }
 
-            logger.info(
-                "agent_run_success",
-                agent_name=self.agent_name,
-                input_tokens=response.usage.input_tokens,
-                output_tokens=response.usage.output_tokens,
-                stop_reason=response.stop_reason,
-            )
+        logger.info(
+            "agent_run_success",
+            agent_name=self.agent_name,
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+            stop_reason=response.stop_reason,
+        )
+
+        return result
+
+    def _error_result(self, error: anthropic.APIError) -> dict[str, Any]:
+        """
+        Convert an Anthropic API error into an agent error result dict.
 
-            return result
+        Args:
+            error: The raised API error
 
-        except anthropic.APITimeoutError:
+        Returns:
+            Dictionary with empty 'content' and an 'error' message
+        """
+        if isinstance(error, anthropic.APITimeoutError):
             logger.error(
                 "agent_run_timeout",
                 agent_name=self.agent_name,
@@ -140,17 +263,16 @@ class BaseAgent:
                 "error": "Request timed out",
             }
 
-        except anthropic.APIError as e:
-            logger.error(
-                "agent_run_error",
-                agent_name=self.agent_name,
-                error=str(e),
-            )
-            return {
-                "content": "",
-                "agent": self.agent_name,
-                "error": f"API error: {str(e)}",
-            }
+        logger.error(
+            "agent_run_error",
+            agent_name=self.agent_name,
+            error=str(error),
+        )
+        return {
+            "content": "",
+            "agent": self.agent_name,
+            "error": f"API error: {str(error)}",
+        }
 
     def _build_messages(
         self, prompt: str, context: dict[str, Any] | None = None
@@ -105,10 +105,25 @@ Return structured documentation as a JSON object:
         Returns:
             Structured result with SOAP documentation
         """
-        prompt = f"""Structure the following physician note into a complete SOAP note \
+        return self.run(self._structure_note_prompt(raw_note), context)
+
+    async def astructure_note(
+        self, raw_note: str, context: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Async variant of structure_note() for concurrent pipeline execution."""
+        return await self.arun(self._structure_note_prompt(raw_note), context)
+
+    def structure_note_request(
+        self, custom_id: str, raw_note: str, context: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Message Batches request for structure_note(), for bulk pipeline execution."""
+        return self.batch_request(custom_id, self._structure_note_prompt(raw_note), context)
+
+    @staticmethod
+    def _structure_note_prompt(raw_note: str) -> str:
+        """Build the user prompt for structure_note()."""
+        return f"""Structure the following physician note into a complete SOAP note \
 with proper medical terminology. Identify documentation gaps and provide coding hints.
 
 ## Physician Note
 {raw_note}"""
-
-        return self.run(prompt, context)
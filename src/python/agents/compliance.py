@@ -108,7 +108,33 @@ Return compliance validation as a JSON object:
         Returns:
             Compliance validation results
         """
-        prompt = f"""Validate the following coding suggestions against the clinical \
+        return self.run(self._validate_prompt(documentation, suggested_codes), context)
+
+    async def avalidate(
+        self,
+        documentation: str,
+        suggested_codes: str,
+        context: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Async variant of validate() for concurrent pipeline execution."""
+        return await self.arun(self._validate_prompt(documentation, suggested_codes), context)
+
+    def validate_request(
+        self,
+        custom_id: str,
+        documentation: str,
+        suggested_codes: str,
+        context: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Message Batches request for validate(), for bulk pipeline execution."""
+        return self.batch_request(
+            custom_id, self._validate_prompt(documentation, suggested_codes), context
+        )
+
+    @staticmethod
+    def _validate_prompt(documentation: str, suggested_codes: str) -> str:
+        """Build the user prompt for validate()."""
+        return f"""Validate the following coding suggestions against the clinical \
 documentation and compliance requirements. Flag any issues.
 
 ## Clinical Documentation
@@ -116,5 +142,3 @@ documentation and compliance requirements. Flag any issues.
 
 ## Suggested Codes
 {suggested_codes}"""
-
-        return self.run(prompt, context)
@@ -102,11 +102,26 @@ Return coding suggestions as a JSON object:
         Returns:
             Coding suggestions with rationale
         """
-        prompt = f"""Analyze the following clinical documentation and suggest \
+        return self.run(self._suggest_codes_prompt(documentation), context)
+
+    async def asuggest_codes(
+        self, documentation: str, context: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Async variant of suggest_codes() for concurrent pipeline execution."""
+        return await self.arun(self._suggest_codes_prompt(documentation), context)
+
+    def suggest_codes_request(
+        self, custom_id: str, documentation: str, context: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Message Batches request for suggest_codes(), for bulk pipeline execution."""
+        return self.batch_request(custom_id, self._suggest_codes_prompt(documentation), context)
+
+    @staticmethod
+    def _suggest_codes_prompt(documentation: str) -> str:
+        """Build the user prompt for suggest_codes()."""
+        return f"""Analyze the following clinical documentation and suggest \
 ICD-10-CM diagnosis codes and CPT procedure codes. Provide rationale for each code \
 and flag any documentation gaps.
 
 ## Clinical Documentation
 {documentation}"""
-
-        return self.run(prompt, context)
@@ -112,7 +112,37 @@ Return prior auth assessment as a JSON object:
         Returns:
             Prior authorization assessment and request package
         """
-        prompt = f"""Assess the prior authorization requirements for the following \
+        return self.run(self._assess_authorization_prompt(procedure, payer, clinical_data), context)
+
+    async def aassess_authorization(
+        self,
+        procedure: str,
+        payer: str,
+        clinical_data: str,
+        context: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Async variant of assess_authorization() for concurrent pipeline execution."""
+        return await self.arun(
+            self._assess_authorization_prompt(procedure, payer, clinical_data), context
+        )
+
+    def assess_authorization_request(
+        self,
+        custom_id: str,
+        procedure: str,
+        payer: str,
+        clinical_data: str,
+        context: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Message Batches request for assess_authorization(), for bulk pipeline execution."""
+        return self.batch_request(
+            custom_id, self._assess_authorization_prompt(procedure, payer, clinical_data), context
+        )
+
+    @staticmethod
+    def _assess_authorization_prompt(procedure: str, payer: str, clinical_data: str) -> str:
+        """Build the user prompt for assess_authorization()."""
+        return f"""Assess the prior authorization requirements for the following \
 procedure and assemble a complete authorization request.
 
 ## Procedure
@@ -123,5 +153,3 @@ procedure and assemble a complete authorization request.
 
 ## Clinical Documentation
 {clinical_data}"""
-
-        return self.run(prompt, context)
@@ -114,7 +114,41 @@ Return quality assessment as a JSON object:
         Returns:
             Quality assessment with scores and issues
         """
-        prompt = f"""Perform a comprehensive quality review of the following clinical \
+        return self.run(
+            self._review_prompt(source_note, documentation, coding, compliance), context
+        )
+
+    async def areview(
+        self,
+        source_note: str,
+        documentation: str,
+        coding: str,
+        compliance: str,
+        context: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Async variant of review() for concurrent pipeline execution."""
+        return await self.arun(
+            self._review_prompt(source_note, documentation, coding, compliance), context
+        )
+
+    def review_request(
+        self,
+        custom_id: str,
+        source_note: str,
+        documentation: str,
+        coding: str,
+        compliance: str,
+        context: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Message Batches request for review(), for bulk pipeline execution."""
+        return self.batch_request(
+            custom_id, self._review_prompt(source_note, documentation, coding, compliance), context
+        )
+
+    @staticmethod
+    def _review_prompt(source_note: str, documentation: str, coding: str, compliance: str) -> str:
+        """Build the user prompt for review()."""
+        return f"""Perform a comprehensive quality review of the following clinical \
 documentation pipeline output. Check for consistency, accuracy, completeness, and \
 hallucinations.
 
@@ -129,5 +163,3 @@ hallucinations.
 
 ## Compliance Validation
 {compliance}"""
-
-        return self.run(prompt, context)
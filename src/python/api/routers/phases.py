@@ -66,14 +66,17 @@ def _run_phase_background(workflow_id: UUID, phase_name: str) -> None:
 
         # Run the phase
         coordinator = ClinicalPipelineCoordinator()
-        result = coordinator.run_single_phase(
-            phase_name=phase_name,
-            raw_note=workflow.raw_note,
-            phase_contents=phase_contents,
-            patient_id=workflow.patient_id,
-            payer=workflow.payer,
-            procedure=workflow.procedure,
-        )
+        try:
+            result = coordinator.run_single_phase(
+                phase_name=phase_name,
+                raw_note=workflow.raw_note,
+                phase_contents=phase_contents,
+                patient_id=workflow.patient_id,
+                payer=workflow.payer,
+                procedure=workflow.procedure,
+            )
+        finally:
+            coordinator.close()
 
         # Update phase result
         now = datetime.now(timezone.utc)
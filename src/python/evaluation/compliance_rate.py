@@ -11,6 +11,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
+from rapidfuzz import fuzz, process
+
 from src.python.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -93,14 +95,25 @@ class ComplianceRateReport:
         return self.mean_detection_rate >= self.target_detection_rate
 
     def to_dict(self) -> dict[str, Any]:
+        # Aggregate every metric in a single pass rather than one per property
+        n = len(self.results)
+        all_detected = 0
+        detection_sum = precision_sum = f1_sum = 0.0
+        for r in self.results:
+            all_detected += r.all_detected
+            detection_sum += r.detection_rate
+            precision_sum += r.precision
+            f1_sum += r.f1_score
+        mean_detection = detection_sum / n if n else 0.0
+
         return {
-            "total_cases": self.total_cases,
-            "all_detected_count": self.all_detected_count,
-            "mean_detection_rate": round(self.mean_detection_rate, 3),
-            "mean_precision": round(self.mean_precision, 3),
-            "mean_f1": round(self.mean_f1, 3),
+            "total_cases": n,
+            "all_detected_count": all_detected,
+            "mean_detection_rate": round(mean_detection, 3),
+            "mean_precision": round(precision_sum / n if n else 0.0, 3),
+            "mean_f1": round(f1_sum / n if n else 0.0, 3),
             "target_detection_rate": self.target_detection_rate,
-            "meets_target": self.meets_target,
+            "meets_target": mean_detection >= self.target_detection_rate,
         }
 
 
@@ -112,9 +125,10 @@ def evaluate_compliance(
     """
     Evaluate compliance issue detection against ground truth.
 
-    Uses keyword-based fuzzy matching: an expected issue is considered
-    detected if any detected issue contains at least one significant keyword
-    from the expected issue description.
+    Matching combines three passes, in order of strictness: abbreviation
+    expansion (e.g. "htn" -> "hypertension"), a whole-phrase fuzzy match
+    (token-set Levenshtein ratio), and a keyword fallback where an expected
+    keyword counts as present if any detected token is a close fuzzy match.
 
     Args:
         case_id: Test case identifier
@@ -127,22 +141,21 @@ def evaluate_compliance(
     # Normalize for comparison
     expected_lower = [e.lower().strip() for e in expected_issues]
     detected_lower = [d.lower().strip() for d in detected_issues]
+    detected_expanded = [_expand_abbreviations(d) for d in detected_lower]
 
     tp = []
-    matched_detected = set()
+    unmatched = dict(enumerate(detected_expanded))
 
     for expected in expected_lower:
-        keywords = _extract_keywords(expected)
-        for idx, detected in enumerate(detected_lower):
-            if idx in matched_detected:
-                continue
-            if _keywords_match(keywords, detected):
-                tp.append(expected)
-                matched_detected.add(idx)
-                break
+        if not unmatched:
+            break
+        idx = _match_issue(_expand_abbreviations(expected), unmatched)
+        if idx is not None:
+            tp.append(expected)
+            del unmatched[idx]
 
     fn = [e for e in expected_lower if e not in tp]
-    fp = [d for idx, d in enumerate(detected_lower) if idx not in matched_detected]
+    fp = [d for idx, d in enumerate(detected_lower) if idx in unmatched]
 
     result = ComplianceRateResult(
         case_id=case_id,
@@ -164,6 +177,22 @@ def evaluate_compliance(
     return result
 
 
+# Minimum rapidfuzz score (0-100) for a phrase or token to count as a match
+_FUZZY_THRESHOLD = 80
+
+# Common clinical abbreviations expanded before matching
+_ABBREVIATIONS = {
+    "htn": "hypertension",
+    "dm": "diabetes mellitus",
+    "cad": "coronary artery disease",
+    "chf": "congestive heart failure",
+    "copd": "chronic obstructive pulmonary disease",
+    "ckd": "chronic kidney disease",
+    "mi": "myocardial infarction",
+    "afib": "atrial fibrillation",
+    "dx": "diagnosis",
+}
+
 # Stop words to exclude from keyword matching
 _STOP_WORDS = frozenset(
     {
@@ -208,10 +237,39 @@ def _extract_keywords(text: str) -> list[str]:
     return [w for w in words if len(w) > 2 and w not in _STOP_WORDS]
 
 
+def _expand_abbreviations(text: str) -> str:
+    """Replace known clinical abbreviations with their full form."""
+    return " ".join(_ABBREVIATIONS.get(w, w) for w in text.split())
+
+
+def _match_issue(expected: str, candidates: dict[int, str]) -> int | None:
+    """Return the index of the detected issue matching ``expected``, if any."""
+    best = process.extractOne(
+        expected,
+        candidates,
+        scorer=fuzz.token_set_ratio,
+        score_cutoff=_FUZZY_THRESHOLD,
+    )
+    if best is not None:
+        return int(best[2])
+
+    keywords = _extract_keywords(expected)
+    for idx, detected in candidates.items():
+        if _keywords_match(keywords, detected):
+            return idx
+    return None
+
+
 def _keywords_match(keywords: list[str], text: str) -> bool:
     """Check if enough keywords from the expected issue appear in the detected text."""
     if not keywords:
         return False
-    matched = sum(1 for kw in keywords if kw in text)
+    tokens = text.split()
+    matched = sum(
+        1
+        for kw in keywords
+        if kw in text
+        or process.extractOne(kw, tokens, scorer=fuzz.ratio, score_cutoff=_FUZZY_THRESHOLD)
+    )
     # At least 50% of keywords must match
     return matched >= max(1, len(keywords) // 2)
@@ -6,6 +6,7 @@ including OAuth authentication, resource queries, and error handling.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
@@ -21,6 +22,17 @@ from src.python.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Resolve the Patient validator once at import so per-resource parsing skips
+# schema construction and the __init__ attribute lookup chain.
+# fhir.resources >= 8 is built on pydantic v2 and exposes a compiled validator;
+# earlier releases fall back to the pydantic v1 parse_obj entry point.
+_validate_patient: Callable[[dict[str, Any]], Patient]
+if hasattr(Patient, "__pydantic_validator__"):
+    Patient.model_rebuild()
+    _validate_patient = Patient.__pydantic_validator__.validate_python
+else:
+    _validate_patient = Patient.parse_obj
+
 
 class BaseFHIRClient(ABC):
     """
@@ -149,7 +161,7 @@ class BaseFHIRClient(ABC):
         logger.info("Fetching patient", patient_id=patient_id)
 
         data = await self._make_request("GET", f"Patient/{patient_id}")
-        patient = Patient(**data)
+        patient = _validate_patient(data)
 
         logger.info(
             "Patient retrieved",
@@ -194,22 +206,15 @@ class BaseFHIRClient(ABC):
         logger.info("Searching patients", params=params)
 
         data = await self._make_request("GET", "Patient", params=params)
-        bundle = Bundle(**data)
 
-        patients = []
-        if bundle.entry:
-            for entry in bundle.entry:
-                if (
-                    entry.resource
-                    and getattr(entry.resource, "__resource_type__", None) == "Patient"
-                ):
-                    # Use model_dump() for Pydantic v2
-                    resource_dict = (
-                        entry.resource.model_dump()
-                        if hasattr(entry.resource, "model_dump")
-                        else entry.resource.dict()
-                    )
-                    patients.append(Patient(**resource_dict))
+        # Filter the raw bundle entries directly (searches may mix in
+        # OperationOutcome resources) and validate each Patient once, instead
+        # of parsing the whole Bundle and round-tripping every entry.
+        patients = [
+            _validate_patient(resource)
+            for entry in data.get("entry") or ()
+            if (resource := entry.get("resource")) and resource.get("resourceType") == "Patient"
+        ]
 
         logger.info("Patient search complete", num_results=len(patients))
         return patients
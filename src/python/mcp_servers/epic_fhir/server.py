@@ -31,6 +31,10 @@ logger = get_logger(__name__)
 # Initialize FastMCP server
 mcp = FastMCP("epic-fhir")
 
+# Patient fields returned by search_patients; restricting the dump avoids
+# walking the full Patient field graph for every entry in a search bundle
+_PATIENT_SEARCH_FIELDS = {"id", "identifier", "name", "birthDate", "gender", "address"}
+
 # Initialize client (lazy loading with thread safety)
 _client: EpicFHIRClient | None = None
 _client_lock = threading.Lock()
@@ -119,12 +123,22 @@ async def search_patients(
         )
 
         # Convert to dict for MCP response (use model_dump for Pydantic v2)
-        results = []
-        for patient in patients:
-            if hasattr(patient, "model_dump"):
-                results.append(patient.model_dump(exclude_none=True))
-            else:
-                results.append(patient.dict(exclude_none=True))
+        if patients and hasattr(patients[0], "model_dump"):
+            results = [
+                p.model_dump(
+                    mode="json",
+                    include=_PATIENT_SEARCH_FIELDS,
+                    by_alias=True,
+                    exclude_none=True,
+                )
+                for p in patients
+            ]
+        else:
+            # fhir.resources < 8 ignores include=, so filter the dump instead
+            results = [
+                {k: v for k, v in p.dict(exclude_none=True).items() if k in _PATIENT_SEARCH_FIELDS}
+                for p in patients
+            ]
 
         logger.info("Patient search completed", num_results=len(results))
         return results
@@ -17,6 +17,10 @@ from src.python.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum number of texts encoded in a single call; larger batches are chunked
+# to prevent OOM errors
+BATCH_CHUNK_SIZE = 10000
+
 
 class MedicalCodeEmbedder:
     """
@@ -83,7 +87,8 @@ class MedicalCodeEmbedder:
 
         try:
             embedding = self.model.encode(text, convert_to_numpy=True, show_progress_bar=False)
-            return embedding.astype(np.float32)
+            # sentence-transformers already returns float32; only cast other dtypes
+            return embedding.astype(np.float32, copy=False)
         except Exception as e:
             logger.error("Failed to generate embedding", text=text[:100], error=str(e))
             raise
@@ -94,8 +99,8 @@ class MedicalCodeEmbedder:
         """
         Generate embeddings for multiple texts in batch.
 
-        For very large batches (>10,000 texts), processing is automatically chunked
-        to prevent memory issues.
+        For very large batches (more than BATCH_CHUNK_SIZE texts), processing is
+        automatically chunked to prevent memory issues.
 
         Args:
             texts: List of input texts to embed
@@ -110,22 +115,20 @@ class MedicalCodeEmbedder:
 
         batch_size = batch_size or settings.embeddings_batch_size
 
-        # Limit total batch size to prevent OOM errors
-        MAX_TOTAL_BATCH = 10000
-        if len(texts) > MAX_TOTAL_BATCH:
+        if len(texts) > BATCH_CHUNK_SIZE:
             logger.warning(
                 "Large batch detected, processing in chunks to prevent memory issues",
                 num_texts=len(texts),
-                chunk_size=MAX_TOTAL_BATCH,
+                chunk_size=BATCH_CHUNK_SIZE,
             )
 
             # Process in chunks
             all_embeddings = []
-            for i in range(0, len(texts), MAX_TOTAL_BATCH):
-                chunk = texts[i : i + MAX_TOTAL_BATCH]
+            for i in range(0, len(texts), BATCH_CHUNK_SIZE):
+                chunk = texts[i : i + BATCH_CHUNK_SIZE]
                 logger.info(
                     "Processing chunk",
-                    chunk_num=i // MAX_TOTAL_BATCH + 1,
+                    chunk_num=i // BATCH_CHUNK_SIZE + 1,
                     chunk_size=len(chunk),
                 )
                 chunk_embeddings = self.model.encode(
@@ -137,7 +140,7 @@ class MedicalCodeEmbedder:
                 all_embeddings.append(chunk_embeddings)
 
             embeddings = np.vstack(all_embeddings)
-            return embeddings.astype(np.float32)
+            return embeddings.astype(np.float32, copy=False)
 
         # Normal batch processing
         logger.info("Generating batch embeddings", num_texts=len(texts), batch_size=batch_size)
@@ -149,7 +152,7 @@ class MedicalCodeEmbedder:
                 batch_size=batch_size,
                 show_progress_bar=len(texts) > 100,  # Show progress for large batches
             )
-            return embeddings.astype(np.float32)
+            return embeddings.astype(np.float32, copy=False)
         except Exception as e:
             logger.error("Failed to generate batch embeddings", num_texts=len(texts), error=str(e))
             raise
@@ -3,6 +3,7 @@
 from src.python.mcp_servers.payer_policy.policy_store import PayerPolicy, PolicyStore
 from src.python.mcp_servers.payer_policy.server import (
     check_auth_requirements,
+    evaluate_policy,
     get_documentation_requirements,
     validate_medical_necessity,
 )
@@ -11,6 +12,7 @@ __all__ = [
     "PolicyStore",
     "PayerPolicy",
     "check_auth_requirements",
+    "evaluate_policy",
     "get_documentation_requirements",
     "validate_medical_necessity",
 ]
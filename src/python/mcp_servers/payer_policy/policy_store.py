@@ -7,6 +7,8 @@ documentation requirements, and medical necessity criteria.
 
 import json
 import sqlite3
+import sys
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 from datetime import datetime
@@ -53,13 +55,60 @@ class PolicyStore:
         Initialize policy store.
 
         Args:
-            db_path: Path to SQLite database file (defaults to settings)
+            db_path: Path to SQLite database file (defaults to settings).
+                Pass ":memory:" for a transient in-memory database.
         """
         self.db_path = db_path or settings.database_url.replace("sqlite:///", "")
+
+        # Bumped on every change to the table seen by this store, whether made
+        # through this store or through another connection or process
+        self._version = 0
+
+        # Flat (payer, cpt_code) -> policy index, built from the table on first
+        # lookup and rebuilt once the store version moves past _index_version.
+        # _index_by_id lets a rebuild reuse the parsed model of every unchanged row.
+        self._index: dict[tuple[str, str], PayerPolicy] | None = None
+        self._index_by_id: dict[int, PayerPolicy] = {}
+        self._index_version = -1
+
+        # An in-memory database only lives as long as its connection, so keep
+        # a single one open instead of connecting per operation. Callers may be
+        # on different threads (MCP tools), so each use holds _memory_lock.
+        self._memory_conn: sqlite3.Connection | None = None
+        self._memory_lock = threading.Lock()
+
+        # A file database can also be written by other connections. One long-lived
+        # connection watches PRAGMA data_version, which changes whenever another
+        # connection commits, so detecting writes never touches the table.
+        self._watch_conn: sqlite3.Connection | None = None
+        self._watch_lock = threading.Lock()
+        self._data_version: int | None = None
+
+        if self.db_path == ":memory:":
+            self._memory_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+
         self._ensure_db_exists()
+        if self._memory_conn is None:
+            self._watch_conn = sqlite3.connect(self.db_path, check_same_thread=False)
 
         logger.info("policy_store_initialized", db_path=self.db_path)
 
+    @property
+    def version(self) -> int:
+        """
+        Change counter for the policies table.
+
+        Bumped by this store's own writes and, for file databases, whenever
+        another connection has committed since the last check.
+        """
+        if self._watch_conn is not None:
+            with self._watch_lock:
+                data_version = self._watch_conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._data_version:
+                self._data_version = data_version
+                self._version += 1
+        return self._version
+
     @contextmanager
     def _get_connection(
         self, row_factory: bool = False
@@ -73,6 +122,12 @@ class PolicyStore:
         Yields:
             SQLite connection
         """
+        if self._memory_conn is not None:
+            with self._memory_lock:
+                self._memory_conn.row_factory = sqlite3.Row if row_factory else None
+                yield self._memory_conn
+            return
+
         conn = sqlite3.connect(self.db_path)
         if row_factory:
             conn.row_factory = sqlite3.Row
@@ -110,8 +165,9 @@ class PolicyStore:
 
     def _ensure_db_exists(self) -> None:
         """Ensure database and tables exist."""
-        db_dir = Path(self.db_path).parent
-        db_dir.mkdir(parents=True, exist_ok=True)
+        if self._memory_conn is None:
+            db_dir = Path(self.db_path).parent
+            db_dir.mkdir(parents=True, exist_ok=True)
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
@@ -176,56 +232,57 @@ class PolicyStore:
         if not policies:
             raise ValueError("No policies found in JSON file")
 
-        loaded_count = 0
         now = datetime.now().isoformat()
 
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            for policy_data in policies:
-                try:
-                    # Validate with Pydantic
-                    policy = PayerPolicy(**policy_data)
-
-                    # Insert or replace policy
-                    cursor.execute(
-                        """
-                        INSERT OR REPLACE INTO policies (
-                            payer, cpt_code, procedure_name, requires_prior_auth,
-                            documentation_requirements, medical_necessity_criteria,
-                            prior_auth_criteria, reimbursement_rate, effective_date,
-                            notes, created_at, updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            policy.payer,
-                            policy.cpt_code,
-                            policy.procedure_name,
-                            policy.requires_prior_auth,
-                            json.dumps(policy.documentation_requirements),
-                            json.dumps(policy.medical_necessity_criteria),
-                            json.dumps(policy.prior_auth_criteria)
-                            if policy.prior_auth_criteria
-                            else None,
-                            policy.reimbursement_rate,
-                            policy.effective_date,
-                            policy.notes,
-                            now,
-                            now,
-                        ),
-                    )
-                    loaded_count += 1
-
-                except Exception as e:
-                    logger.error(
-                        "policy_load_error",
-                        payer=policy_data.get("payer"),
-                        cpt_code=policy_data.get("cpt_code"),
-                        error=str(e),
-                    )
+        # Validate everything up front, then insert all rows in one executemany
+        # call inside a single transaction
+        rows = []
+        for policy_data in policies:
+            try:
+                # Validate with Pydantic
+                policy = PayerPolicy(**policy_data)
+            except Exception as e:
+                logger.error(
+                    "policy_load_error",
+                    payer=policy_data.get("payer"),
+                    cpt_code=policy_data.get("cpt_code"),
+                    error=str(e),
+                )
+                continue
+
+            rows.append(
+                (
+                    policy.payer,
+                    policy.cpt_code,
+                    policy.procedure_name,
+                    policy.requires_prior_auth,
+                    json.dumps(policy.documentation_requirements),
+                    json.dumps(policy.medical_necessity_criteria),
+                    json.dumps(policy.prior_auth_criteria) if policy.prior_auth_criteria else None,
+                    policy.reimbursement_rate,
+                    policy.effective_date,
+                    policy.notes,
+                    now,
+                    now,
+                )
+            )
 
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO policies (
+                    payer, cpt_code, procedure_name, requires_prior_auth,
+                    documentation_requirements, medical_necessity_criteria,
+                    prior_auth_criteria, reimbursement_rate, effective_date,
+                    notes, created_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
             conn.commit()
 
+        loaded_count = len(rows)
+        self._version += 1
         logger.info("policies_loaded", count=loaded_count, source=json_path)
         return loaded_count
 
@@ -240,21 +297,40 @@ class PolicyStore:
         Returns:
             Policy if found, None otherwise
         """
-        with self._get_connection(row_factory=True) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT * FROM policies
-                WHERE payer = ? AND cpt_code = ?
-                """,
-                (payer, cpt_code),
-            )
-            row = cursor.fetchone()
+        return self._policy_index().get((payer, cpt_code))
+
+    def _policy_index(self) -> dict[tuple[str, str], PayerPolicy]:
+        """
+        Get the in-memory policy index, rebuilding it if the table has changed.
 
-        if not row:
-            return None
+        Keys are interned (payer, cpt_code) tuples, so a lookup is a single
+        hash of the composite key instead of a query and model parse per call.
 
-        return self._row_to_policy(row)
+        Returns:
+            Mapping of (payer, cpt_code) to policy
+        """
+        # Version read before the SELECT: a write landing in between only
+        # causes one extra rebuild, never a stale index
+        version = self.version
+        index = self._index
+        if index is None or version != self._index_version:
+            previous = self._index_by_id
+            index = {}
+            by_id = {}
+            with self._get_connection(row_factory=True) as conn:
+                for row in conn.execute("SELECT * FROM policies"):
+                    # INSERT OR REPLACE gives a rewritten row a new id, so a known
+                    # id means the row is unchanged and its model can be reused
+                    policy = previous.get(row["id"]) or self._row_to_policy(row)
+                    by_id[row["id"]] = policy
+                    index[(sys.intern(row["payer"]), sys.intern(row["cpt_code"]))] = policy
+
+            self._index = index
+            self._index_by_id = by_id
+            self._index_version = version
+            logger.info("policy_index_built", count=len(index))
+
+        return index
 
     def search_policies(
         self,
@@ -6,16 +6,41 @@ documentation requirements, and medical necessity criteria for
 various payers and procedure codes.
 """
 
+import re
 import threading
+import weakref
+from functools import lru_cache
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
-from src.python.mcp_servers.payer_policy.policy_store import PolicyStore
+from src.python.mcp_servers.payer_policy.policy_store import PayerPolicy, PolicyStore
 from src.python.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Fraction of a criterion's keywords that must appear in the clinical data
+_CRITERION_MATCH_THRESHOLD = 0.5
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Connective words that carry no clinical meaning for criterion matching
+_STOPWORDS = frozenset(
+    {"a", "an", "and", "as", "by", "for", "if", "in", "of", "on", "or", "the", "to", "with"}
+)
+
+
+def _tokenize(text: str) -> frozenset[str]:
+    """Split text into a set of lowercase keyword tokens, dropping stopwords."""
+    return frozenset(_TOKEN_RE.findall(text.lower())) - _STOPWORDS
+
+
+@lru_cache(maxsize=4096)
+def _criterion_tokens(criterion: str) -> frozenset[str]:
+    """Keyword tokens for a policy criterion (criteria repeat across requests)."""
+    return _tokenize(criterion)
+
+
 # Initialize MCP server
 mcp = FastMCP("payer-policy")
 
@@ -42,6 +67,170 @@ def get_policy_store() -> PolicyStore:
     return _policy_store
 
 
+# Upper bound on memoized (payer, cpt_code) lookups held per store
+_POLICY_MEMO_MAXSIZE = 1024
+
+# Per-store memo of resolved lookups, tagged with the store version it was
+# filled at. Weak keys let replaced stores (e.g. in tests) be collected.
+_PolicyMemo = dict[tuple[str, str], PayerPolicy | None]
+_policy_memo: weakref.WeakKeyDictionary[PolicyStore, tuple[int, _PolicyMemo]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _lookup_policy(payer: str, cpt_code: str) -> PayerPolicy | None:
+    """
+    Look up a policy, memoized per store until the store's version changes.
+
+    Repeated tool calls for the same (payer, cpt_code) pair, such as the
+    auth/documentation/validation steps of one workflow, resolve to a dict
+    hit. Any write to the store bumps its version and drops the memo.
+    """
+    store = get_policy_store()
+    version = store.version
+    cached = _policy_memo.get(store)
+    if cached is None or cached[0] != version:
+        cached = (version, {})
+        _policy_memo[store] = cached
+
+    memo = cached[1]
+    key = (payer, cpt_code)
+    if key in memo:
+        return memo[key]
+
+    policy = store.get_policy(payer=payer, cpt_code=cpt_code)
+    if len(memo) >= _POLICY_MEMO_MAXSIZE:
+        memo.clear()
+    memo[key] = policy
+    return policy
+
+
+def _auth_from_policy(policy: PayerPolicy) -> dict[str, Any]:
+    """Build the check_auth_requirements payload from a resolved policy."""
+    # Policies are shared with the store's index, so payloads get their own
+    # copies of the lists; a caller mutating a result must not change the policy
+    return {
+        "requires_prior_auth": policy.requires_prior_auth,
+        "prior_auth_criteria": (
+            list(policy.prior_auth_criteria) if policy.prior_auth_criteria is not None else None
+        ),
+        "payer": policy.payer,
+        "cpt_code": policy.cpt_code,
+        "procedure_name": policy.procedure_name,
+    }
+
+
+def _auth_unavailable(payer: str, cpt_code: str, error: str) -> dict[str, Any]:
+    """check_auth_requirements payload when no policy could be resolved."""
+    return {
+        "requires_prior_auth": None,
+        "prior_auth_criteria": None,
+        "payer": payer,
+        "cpt_code": cpt_code,
+        "procedure_name": None,
+        "error": error,
+    }
+
+
+def _documentation_from_policy(policy: PayerPolicy) -> dict[str, Any]:
+    """Build the get_documentation_requirements payload from a resolved policy."""
+    return {
+        "documentation_requirements": list(policy.documentation_requirements),
+        "medical_necessity_criteria": list(policy.medical_necessity_criteria),
+        "payer": policy.payer,
+        "cpt_code": policy.cpt_code,
+        "procedure_name": policy.procedure_name,
+    }
+
+
+def _documentation_unavailable(payer: str, cpt_code: str, error: str) -> dict[str, Any]:
+    """get_documentation_requirements payload when no policy could be resolved."""
+    return {
+        "documentation_requirements": [],
+        "medical_necessity_criteria": [],
+        "payer": payer,
+        "cpt_code": cpt_code,
+        "procedure_name": None,
+        "error": error,
+    }
+
+
+def _validation_from_policy(policy: PayerPolicy, clinical_data: dict[str, Any]) -> dict[str, Any]:
+    """Build the validate_medical_necessity payload from a resolved policy."""
+    # Tokenize all clinical evidence once into a single set
+    evidence_tokens = _tokenize(
+        " ".join(
+            item
+            for field in ("diagnoses", "symptoms", "history", "findings")
+            for item in clinical_data.get(field, [])
+        )
+    )
+
+    # A criterion is met when enough of its keywords appear in the evidence
+    criteria_met = []
+    criteria_not_met = []
+
+    for criterion in policy.medical_necessity_criteria:
+        criterion_tokens = _criterion_tokens(criterion)
+        overlap = len(criterion_tokens & evidence_tokens)
+
+        if criterion_tokens and overlap >= len(criterion_tokens) * _CRITERION_MATCH_THRESHOLD:
+            criteria_met.append(criterion)
+        else:
+            criteria_not_met.append(criterion)
+
+    # Determine validation status
+    total_criteria = len(policy.medical_necessity_criteria)
+    met_count = len(criteria_met)
+
+    if met_count == total_criteria:
+        validation_status = "approved"
+    elif met_count >= total_criteria * 0.7:  # 70% threshold
+        validation_status = "needs_review"
+    else:
+        validation_status = "insufficient_data"
+
+    return {
+        "criteria_met": criteria_met,
+        "criteria_not_met": criteria_not_met,
+        "all_criteria": list(policy.medical_necessity_criteria),
+        "validation_status": validation_status,
+        "payer": policy.payer,
+        "cpt_code": policy.cpt_code,
+        "procedure_name": policy.procedure_name,
+    }
+
+
+def _validation_unavailable(payer: str, cpt_code: str, error: str) -> dict[str, Any]:
+    """validate_medical_necessity payload when no policy could be resolved."""
+    return {
+        "criteria_met": [],
+        "criteria_not_met": [],
+        "all_criteria": [],
+        "validation_status": "insufficient_data",
+        "payer": payer,
+        "cpt_code": cpt_code,
+        "procedure_name": None,
+        "error": error,
+    }
+
+
+def _evaluation_unavailable(
+    payer: str, cpt_code: str, clinical_data: dict[str, Any] | None, error: str
+) -> dict[str, Any]:
+    """evaluate_policy payload when no policy could be resolved."""
+    return {
+        "auth": _auth_unavailable(payer, cpt_code, error),
+        "documentation": _documentation_unavailable(payer, cpt_code, error),
+        "validation": (
+            _validation_unavailable(payer, cpt_code, error) if clinical_data is not None else None
+        ),
+        "payer": payer,
+        "cpt_code": cpt_code,
+        "error": error,
+    }
+
+
 @mcp.tool()
 async def check_auth_requirements(payer: str, cpt_code: str) -> dict[str, Any]:
     """
@@ -80,8 +269,7 @@ async def check_auth_requirements(payer: str, cpt_code: str) -> dict[str, Any]:
     )
 
     try:
-        store = get_policy_store()
-        policy = store.get_policy(payer=payer, cpt_code=cpt_code)
+        policy = _lookup_policy(payer, cpt_code)
 
         if not policy:
             logger.warning(
@@ -89,22 +277,9 @@ async def check_auth_requirements(payer: str, cpt_code: str) -> dict[str, Any]:
                 payer=payer,
                 cpt_code=cpt_code,
             )
-            return {
-                "requires_prior_auth": None,
-                "prior_auth_criteria": None,
-                "payer": payer,
-                "cpt_code": cpt_code,
-                "procedure_name": None,
-                "error": f"No policy found for {payer} / {cpt_code}",
-            }
+            return _auth_unavailable(payer, cpt_code, f"No policy found for {payer} / {cpt_code}")
 
-        result = {
-            "requires_prior_auth": policy.requires_prior_auth,
-            "prior_auth_criteria": policy.prior_auth_criteria,
-            "payer": policy.payer,
-            "cpt_code": policy.cpt_code,
-            "procedure_name": policy.procedure_name,
-        }
+        result = _auth_from_policy(policy)
 
         logger.info(
             "check_auth_requirements_success",
@@ -122,14 +297,9 @@ async def check_auth_requirements(payer: str, cpt_code: str) -> dict[str, Any]:
             cpt_code=cpt_code,
             error=str(e),
         )
-        return {
-            "requires_prior_auth": None,
-            "prior_auth_criteria": None,
-            "payer": payer,
-            "cpt_code": cpt_code,
-            "procedure_name": None,
-            "error": f"Error checking authorization requirements: {str(e)}",
-        }
+        return _auth_unavailable(
+            payer, cpt_code, f"Error checking authorization requirements: {str(e)}"
+        )
 
 
 @mcp.tool()
@@ -177,8 +347,7 @@ async def get_documentation_requirements(payer: str, cpt_code: str) -> dict[str,
     )
 
     try:
-        store = get_policy_store()
-        policy = store.get_policy(payer=payer, cpt_code=cpt_code)
+        policy = _lookup_policy(payer, cpt_code)
 
         if not policy:
             logger.warning(
@@ -186,22 +355,11 @@ async def get_documentation_requirements(payer: str, cpt_code: str) -> dict[str,
                 payer=payer,
                 cpt_code=cpt_code,
             )
-            return {
-                "documentation_requirements": [],
-                "medical_necessity_criteria": [],
-                "payer": payer,
-                "cpt_code": cpt_code,
-                "procedure_name": None,
-                "error": f"No policy found for {payer} / {cpt_code}",
-            }
+            return _documentation_unavailable(
+                payer, cpt_code, f"No policy found for {payer} / {cpt_code}"
+            )
 
-        result = {
-            "documentation_requirements": policy.documentation_requirements,
-            "medical_necessity_criteria": policy.medical_necessity_criteria,
-            "payer": policy.payer,
-            "cpt_code": policy.cpt_code,
-            "procedure_name": policy.procedure_name,
-        }
+        result = _documentation_from_policy(policy)
 
         logger.info(
             "get_documentation_requirements_success",
@@ -220,14 +378,9 @@ async def get_documentation_requirements(payer: str, cpt_code: str) -> dict[str,
             cpt_code=cpt_code,
             error=str(e),
         )
-        return {
-            "documentation_requirements": [],
-            "medical_necessity_criteria": [],
-            "payer": payer,
-            "cpt_code": cpt_code,
-            "procedure_name": None,
-            "error": f"Error retrieving documentation requirements: {str(e)}",
-        }
+        return _documentation_unavailable(
+            payer, cpt_code, f"Error retrieving documentation requirements: {str(e)}"
+        )
 
 
 @mcp.tool()
@@ -295,8 +448,7 @@ async def validate_medical_necessity(
     )
 
     try:
-        store = get_policy_store()
-        policy = store.get_policy(payer=payer, cpt_code=cpt_code)
+        policy = _lookup_policy(payer, cpt_code)
 
         if not policy:
             logger.warning(
@@ -304,100 +456,116 @@ async def validate_medical_necessity(
                 payer=payer,
                 cpt_code=cpt_code,
             )
-            return {
-                "criteria_met": [],
-                "criteria_not_met": [],
-                "all_criteria": [],
-                "validation_status": "insufficient_data",
-                "payer": payer,
-                "cpt_code": cpt_code,
-                "procedure_name": None,
-                "error": f"No policy found for {payer} / {cpt_code}",
-            }
-
-        # Extract clinical data fields
-        diagnoses = clinical_data.get("diagnoses", [])
-        symptoms = clinical_data.get("symptoms", [])
-        history = clinical_data.get("history", [])
-        findings = clinical_data.get("findings", [])
-
-        # Combine all clinical text for keyword matching
-        clinical_sources = [
-            ("diagnoses", diagnoses),
-            ("symptoms", symptoms),
-            ("history", history),
-            ("findings", findings),
-        ]
-
-        # Simple keyword matching for validation (can be enhanced with NLP)
-        criteria_met = []
-        criteria_not_met = []
-
-        for criterion in policy.medical_necessity_criteria:
-            criterion_lower = criterion.lower()
-            keywords = criterion_lower.split()[:3]
-
-            # Check if criterion keywords appear in any clinical data source
-            matched = False
-            for _source_name, source_items in clinical_sources:
-                if matched:
-                    break
-                for item in source_items:
-                    if any(keyword in item.lower() for keyword in keywords):
-                        matched = True
-                        break
-
-            if matched:
-                criteria_met.append(criterion)
-            else:
-                criteria_not_met.append(criterion)
-
-        # Determine validation status
-        total_criteria = len(policy.medical_necessity_criteria)
-        met_count = len(criteria_met)
-
-        if met_count == total_criteria:
-            validation_status = "approved"
-        elif met_count >= total_criteria * 0.7:  # 70% threshold
-            validation_status = "needs_review"
-        else:
-            validation_status = "insufficient_data"
+            return _validation_unavailable(
+                payer, cpt_code, f"No policy found for {payer} / {cpt_code}"
+            )
+
+        result = _validation_from_policy(policy, clinical_data)
+
+        logger.info(
+            "validate_medical_necessity_success",
+            payer=payer,
+            cpt_code=cpt_code,
+            validation_status=result["validation_status"],
+            criteria_met=len(result["criteria_met"]),
+            total_criteria=len(result["all_criteria"]),
+        )
+
+        return result
 
+    except Exception as e:
+        logger.error(
+            "validate_medical_necessity_error",
+            payer=payer,
+            cpt_code=cpt_code,
+            error=str(e),
+        )
+        return _validation_unavailable(
+            payer, cpt_code, f"Error validating medical necessity: {str(e)}"
+        )
+
+
+@mcp.tool()
+async def evaluate_policy(
+    payer: str, cpt_code: str, clinical_data: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """
+    Evaluate a payer policy in one call: auth, documentation, and medical necessity.
+
+    Resolves the (payer, cpt_code) policy once and returns the payloads of
+    check_auth_requirements, get_documentation_requirements, and (when
+    clinical_data is given) validate_medical_necessity, saving two tool
+    round-trips per procedure.
+
+    Args:
+        payer: Payer name (e.g., "Aetna", "Medicare")
+        cpt_code: CPT procedure code (e.g., "27447", "99214")
+        clinical_data: Optional clinical information, in the same shape as
+            validate_medical_necessity's clinical_data
+
+    Returns:
+        Dictionary containing:
+        - auth (dict): check_auth_requirements result
+        - documentation (dict): get_documentation_requirements result
+        - validation (dict | None): validate_medical_necessity result, or None
+          when no clinical_data was provided
+        - payer (str): Payer name
+        - cpt_code (str): CPT code
+        - error (str): Present only when the policy could not be resolved
+
+    Examples:
+        >>> result = await evaluate_policy("Aetna", "27447", {"symptoms": ["severe pain"]})
+        >>> result["auth"]["requires_prior_auth"], result["validation"]["validation_status"]
+        (True, "insufficient_data")
+    """
+    logger.info(
+        "evaluate_policy_started",
+        payer=payer,
+        cpt_code=cpt_code,
+        has_clinical_data=clinical_data is not None,
+    )
+
+    try:
+        policy = _lookup_policy(payer, cpt_code)
+
+        if not policy:
+            logger.warning(
+                "policy_not_found",
+                payer=payer,
+                cpt_code=cpt_code,
+            )
+            return _evaluation_unavailable(
+                payer, cpt_code, clinical_data, f"No policy found for {payer} / {cpt_code}"
+            )
+
+        validation = (
+            _validation_from_policy(policy, clinical_data) if clinical_data is not None else None
+        )
         result = {
-            "criteria_met": criteria_met,
-            "criteria_not_met": criteria_not_met,
-            "all_criteria": policy.medical_necessity_criteria,
-            "validation_status": validation_status,
+            "auth": _auth_from_policy(policy),
+            "documentation": _documentation_from_policy(policy),
+            "validation": validation,
             "payer": policy.payer,
             "cpt_code": policy.cpt_code,
-            "procedure_name": policy.procedure_name,
         }
 
         logger.info(
-            "validate_medical_necessity_success",
+            "evaluate_policy_success",
             payer=payer,
             cpt_code=cpt_code,
-            validation_status=validation_status,
-            criteria_met=met_count,
-            total_criteria=total_criteria,
+            requires_prior_auth=policy.requires_prior_auth,
+            validation_status=validation["validation_status"] if validation else None,
         )
 
         return result
 
     except Exception as e:
         logger.error(
-            "validate_medical_necessity_error",
+            "evaluate_policy_error",
             payer=payer,
             cpt_code=cpt_code,
             error=str(e),
         )
-        return {
-            "criteria_met": [],
-            "criteria_not_met": [],
-            "all_criteria": [],
-            "validation_status": "insufficient_data",
-            "payer": payer,
-            "cpt_code": cpt_code,
-            "procedure_name": None,
-            "error": f"Error validating medical necessity: {str(e)}",
-        }
+        return _evaluation_unavailable(
+            payer, cpt_code, clinical_data, f"Error evaluating policy: {str(e)}"
+        )
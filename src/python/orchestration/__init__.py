@@ -7,7 +7,13 @@ from src.python.orchestration.state import (
     WorkflowState,
     WorkflowStatus,
 )
-from src.python.orchestration.workflow import execute_phase, run_with_retry
+from src.python.orchestration.workflow import (
+    aexecute_phase,
+    arun_with_retry,
+    execute_phase,
+    execute_phase_batch,
+    run_with_retry,
+)
 
 __all__ = [
     "ClinicalPipelineCoordinator",
@@ -16,5 +22,8 @@ __all__ = [
     "WorkflowState",
     "WorkflowStatus",
     "execute_phase",
+    "aexecute_phase",
+    "execute_phase_batch",
     "run_with_retry",
+    "arun_with_retry",
 ]
@@ -4,30 +4,60 @@ Clinical Pipeline Coordinator.
 Orchestrates multi-agent execution for processing clinical notes through
 documentation, coding, compliance, prior authorization, and quality assurance.
 
-Supports two execution modes:
+Supports four execution modes:
 1. Full pipeline: process_note() runs all phases sequentially (CLI)
-2. Step-by-step: run_single_phase() runs one phase at a time (HITL UI)
+2. Concurrent pipeline: aprocess_note() overlaps dependency-free phases (async callers)
+3. Bulk pipeline: process_batch() runs many notes through the Message Batches API
+4. Step-by-step: run_single_phase() runs one phase at a time (HITL UI)
 """
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import time
 import uuid
 from typing import Any
 
 import anthropic
+import httpx
 
+from src.python.agents.base_agent import BaseAgent
 from src.python.agents.clinical_documentation import ClinicalDocumentationAgent
 from src.python.agents.compliance import ComplianceAgent
 from src.python.agents.medical_coding import MedicalCodingAgent
 from src.python.agents.prior_authorization import PriorAuthorizationAgent
 from src.python.agents.quality_assurance import QualityAssuranceAgent
-from src.python.orchestration.state import WorkflowState, WorkflowStatus
-from src.python.orchestration.workflow import execute_phase
+from src.python.orchestration.state import PhaseResult, WorkflowState, WorkflowStatus
+from src.python.orchestration.workflow import (
+    BATCH_MAX_WAIT_SECONDS,
+    aexecute_phase,
+    execute_phase,
+    execute_phase_batch,
+)
+from src.python.utils.config import settings
 from src.python.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Keep-alive pool shared by all five agents, so consecutive phases reuse open
+# (HTTP/2-multiplexed) connections instead of each agent paying its own TLS handshake
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
+# httpx only speaks HTTP/2 with the h2 package (httpx[http2]) and raises on
+# http2=True without it, so fall back to pooled HTTP/1.1 connections
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _http_client_options() -> dict[str, Any]:
+    """Keyword arguments for the httpx clients behind coordinator-owned Anthropic clients."""
+    return {
+        "http2": _HTTP2_AVAILABLE,
+        "limits": _HTTP_LIMITS,
+        "timeout": httpx.Timeout(settings.agent_timeout_seconds, connect=5.0),
+    }
+
+
 # Phase execution order
 PHASE_ORDER = ["documentation", "coding", "compliance", "prior_auth", "quality_assurance"]
 
@@ -63,22 +93,86 @@ class ClinicalPipelineCoordinator:
                  -> [Compliance]             -> Validation Results
                  -> [Prior Authorization]    -> Auth Assessment (if needed)
                  -> [Quality Assurance]      -> Final Review
+
+    Compliance and QA need the coding output, while Prior Authorization only
+    needs the documentation, so aprocess_note() runs Prior Authorization
+    concurrently with the Compliance -> QA chain.
     """
 
-    def __init__(self, client: anthropic.Anthropic | None = None):
+    def __init__(
+        self,
+        client: anthropic.Anthropic | None = None,
+        async_client: anthropic.AsyncAnthropic | None = None,
+    ):
         """
         Initialize coordinator with all sub-agents.
 
         Args:
             client: Optional pre-configured Anthropic client shared across agents.
+                If None, the coordinator creates a pooled sync client itself, plus
+                a pooled async client on first aprocess_note(), and releases them
+                in close()/aclose().
+            async_client: Optional AsyncAnthropic client shared across agents for
+                aprocess_note(). Without it, async phases run the sync client in threads.
+        """
+        self._owned_client: anthropic.Anthropic | None = None
+        self._owned_async_client: anthropic.AsyncAnthropic | None = None
+        # Sync-only callers (CLI, per-request API phases) never open an async pool
+        self._create_async_client = client is None and async_client is None
+        if client is None:
+            client = self._owned_client = anthropic.Anthropic(
+                api_key=settings.anthropic_api_key,
+                http_client=anthropic.DefaultHttpxClient(**_http_client_options()),
+            )
+
+        self._client = client
+        self.doc_agent = ClinicalDocumentationAgent(client=client, async_client=async_client)
+        self.coding_agent = MedicalCodingAgent(client=client, async_client=async_client)
+        self.compliance_agent = ComplianceAgent(client=client, async_client=async_client)
+        self.prior_auth_agent = PriorAuthorizationAgent(client=client, async_client=async_client)
+        self.qa_agent = QualityAssuranceAgent(client=client, async_client=async_client)
+
+        logger.info("coordinator_initialized", http2=_HTTP2_AVAILABLE)
+
+    def _ensure_async_client(self) -> None:
+        """Create the owned async pool on first async use and share it with every agent."""
+        if not self._create_async_client or self._owned_async_client is not None:
+            return
+
+        async_client = self._owned_async_client = anthropic.AsyncAnthropic(
+            api_key=settings.anthropic_api_key,
+            http_client=anthropic.DefaultAsyncHttpxClient(**_http_client_options()),
+        )
+        for agent in (
+            self.doc_agent,
+            self.coding_agent,
+            self.compliance_agent,
+            self.prior_auth_agent,
+            self.qa_agent,
+        ):
+            agent.async_client = async_client
+
+    def close(self) -> None:
         """
-        self.doc_agent = ClinicalDocumentationAgent(client=client)
-        self.coding_agent = MedicalCodingAgent(client=client)
-        self.compliance_agent = ComplianceAgent(client=client)
-        self.prior_auth_agent = PriorAuthorizationAgent(client=client)
-        self.qa_agent = QualityAssuranceAgent(client=client)
+        Close the sync HTTP pool if this coordinator created it.
+
+        An async pool is only created by aprocess_note(); callers that used it
+        must release it with aclose() instead.
+        """
+        if self._owned_client is not None:
+            self._owned_client.close()
+
+    async def aclose(self) -> None:
+        """Close every HTTP pool this coordinator created."""
+        self.close()
+        if self._owned_async_client is not None:
+            await self._owned_async_client.close()
 
-        logger.info("coordinator_initialized")
+    async def __aenter__(self) -> ClinicalPipelineCoordinator:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     def run_single_phase(
         self,
@@ -221,32 +315,7 @@ class ClinicalPipelineCoordinator:
         Returns:
             WorkflowState with results from all phases
         """
-        state = WorkflowState(
-            raw_note=note,
-            patient_id=patient_id,
-            payer=payer,
-            workflow_id=str(uuid.uuid4()),
-            skip_prior_auth=skip_prior_auth,
-        )
-
-        state.start()
-
-        logger.info(
-            "workflow_started",
-            workflow_id=state.workflow_id,
-            has_patient_id=patient_id is not None,
-            payer=payer,
-            skip_prior_auth=skip_prior_auth,
-        )
-
-        # Build shared context
-        shared_context = dict(context) if context else {}
-        if patient_id:
-            shared_context["patient_id"] = patient_id
-        if payer:
-            shared_context["payer"] = payer
-
-        ctx = shared_context if shared_context else None
+        state, ctx = self._start_workflow(note, patient_id, payer, skip_prior_auth, context)
 
         try:
             # Phase 1: Clinical Documentation
@@ -321,12 +390,353 @@ class ClinicalPipelineCoordinator:
             )
             state.fail()
 
+        self._log_workflow_finished(state)
+        return state
+
+    async def aprocess_note(
+        self,
+        note: str,
+        patient_id: str | None = None,
+        payer: str | None = None,
+        procedure: str | None = None,
+        skip_prior_auth: bool = False,
+        context: dict[str, Any] | None = None,
+    ) -> WorkflowState:
+        """
+        Process a clinical note through the full pipeline, overlapping independent phases.
+
+        Documentation and Coding run in order. Prior Authorization then runs
+        concurrently with Compliance followed by QA, so wall-clock time is
+        doc + coding + max(compliance + qa, prior_auth) instead of the sum of all phases.
+
+        Args:
+            note: Raw physician note text
+            patient_id: Optional patient identifier
+            payer: Optional payer name (required for prior auth)
+            procedure: Optional procedure description (required for prior auth)
+            skip_prior_auth: Skip prior authorization phase
+            context: Optional additional context passed to all agents
+
+        Returns:
+            WorkflowState with results from all phases
+        """
+        self._ensure_async_client()
+        state, ctx = self._start_workflow(note, patient_id, payer, skip_prior_auth, context)
+
+        try:
+            # Phase 1: Clinical Documentation
+            doc_result = await aexecute_phase(
+                state.documentation,
+                self.doc_agent.astructure_note,
+                note,
+                ctx,
+            )
+            if "error" in doc_result:
+                state.fail()
+                return state
+
+            # Phase 2: Medical Coding
+            coding_result = await aexecute_phase(
+                state.coding,
+                self.coding_agent.asuggest_codes,
+                doc_result["content"],
+                ctx,
+            )
+            if "error" in coding_result:
+                state.fail()
+                return state
+
+            async def compliance_then_qa() -> dict[str, Any] | None:
+                # Phase 3: Compliance Validation
+                compliance_result = await aexecute_phase(
+                    state.compliance,
+                    self.compliance_agent.avalidate,
+                    doc_result["content"],
+                    coding_result["content"],
+                    ctx,
+                )
+                if "error" in compliance_result:
+                    return None
+
+                # Phase 5: Quality Assurance
+                return await aexecute_phase(
+                    state.quality_assurance,
+                    self.qa_agent.areview,
+                    note,
+                    doc_result["content"],
+                    coding_result["content"],
+                    compliance_result["content"],
+                    ctx,
+                )
+
+            async def prior_auth() -> None:
+                # Phase 4: Prior Authorization (conditional, non-fatal)
+                if not skip_prior_auth and payer and procedure:
+                    await aexecute_phase(
+                        state.prior_auth,
+                        self.prior_auth_agent.aassess_authorization,
+                        procedure,
+                        payer,
+                        doc_result["content"],
+                        ctx,
+                    )
+                else:
+                    state.prior_auth.mark_skipped()
+
+            # Let both branches settle before surfacing an exception, so neither
+            # is left running against the state after the workflow has failed.
+            outcomes = await asyncio.gather(
+                compliance_then_qa(), prior_auth(), return_exceptions=True
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    raise outcome
+
+            qa_result = outcomes[0]
+            if qa_result is None:
+                state.fail()
+                return state
+
+            if "error" in qa_result:
+                state.status = WorkflowStatus.NEEDS_REVIEW
+            else:
+                state.complete()
+
+        except Exception as e:
+            logger.error(
+                "workflow_unexpected_error",
+                workflow_id=state.workflow_id,
+                error=str(e),
+            )
+            state.fail()
+
+        self._log_workflow_finished(state)
+        return state
+
+    def process_batch(
+        self,
+        notes: list[dict[str, Any]],
+        poll_interval: float = 10.0,
+        max_wait: float = BATCH_MAX_WAIT_SECONDS,
+    ) -> list[WorkflowState]:
+        """
+        Process many clinical notes through the pipeline with the Message Batches API.
+
+        Intended for offline bulk ingestion, where latency does not matter but
+        per-request overhead and cost do. Each stage submits one batch covering
+        every workflow still in progress, so N notes take four batch round-trips
+        (documentation, coding, compliance + prior auth, QA) instead of up to
+        5 x N API calls. Failed requests are not retried. Request custom_ids are
+        "<workflow_id>-<phase>". process_note() remains the low-latency path.
+
+        Args:
+            notes: One dict per note with a required 'note' key and optional
+                'patient_id', 'payer', 'procedure', 'skip_prior_auth', and
+                'context' keys, as accepted by process_note()
+            poll_interval: Seconds to wait between batch status checks
+            max_wait: Seconds to wait for each stage's batch before cancelling it
+                and failing the workflows still in progress
+
+        Returns:
+            One WorkflowState per note, in input order
+        """
+        workflows = [
+            (
+                item,
+                *self._start_workflow(
+                    item["note"],
+                    item.get("patient_id"),
+                    item.get("payer"),
+                    item.get("skip_prior_auth", False),
+                    item.get("context"),
+                ),
+            )
+            for item in notes
+        ]
+
+        def run_stage(
+            jobs: list[tuple[PhaseResult, BaseAgent, dict[str, Any]]],
+        ) -> list[dict[str, Any]]:
+            return execute_phase_batch(
+                self._client, jobs, poll_interval=poll_interval, max_wait=max_wait
+            )
+
+        try:
+            # Phase 1: Clinical Documentation
+            results = run_stage(
+                [
+                    (
+                        state.documentation,
+                        self.doc_agent,
+                        self.doc_agent.structure_note_request(
+                            _batch_custom_id(state, state.documentation), item["note"], ctx
+                        ),
+                    )
+                    for item, state, ctx in workflows
+                ]
+            )
+            active = _drop_failed(workflows, results)
+
+            # Phase 2: Medical Coding
+            results = run_stage(
+                [
+                    (
+                        state.coding,
+                        self.coding_agent,
+                        self.coding_agent.suggest_codes_request(
+                            _batch_custom_id(state, state.coding),
+                            state.documentation.content,
+                            ctx,
+                        ),
+                    )
+                    for _, state, ctx in active
+                ]
+            )
+            active = _drop_failed(active, results)
+
+            # Phases 3 and 4: Compliance Validation, plus Prior Authorization
+            # (conditional, non-fatal) which only needs the documentation
+            jobs = []
+            for item, state, ctx in active:
+                jobs.append(
+                    (
+                        state.compliance,
+                        self.compliance_agent,
+                        self.compliance_agent.validate_request(
+                            _batch_custom_id(state, state.compliance),
+                            state.documentation.content,
+                            state.coding.content,
+                            ctx,
+                        ),
+                    )
+                )
+                procedure = item.get("procedure")
+                if not state.skip_prior_auth and state.payer and procedure:
+                    jobs.append(
+                        (
+                            state.prior_auth,
+                            self.prior_auth_agent,
+                            self.prior_auth_agent.assess_authorization_request(
+                                _batch_custom_id(state, state.prior_auth),
+                                procedure,
+                                state.payer,
+                                state.documentation.content,
+                                ctx,
+                            ),
+                        )
+                    )
+                else:
+                    state.prior_auth.mark_skipped()
+
+            results = run_stage(jobs)
+            compliance_results = [
+                result
+                for (phase, _, _), result in zip(jobs, results, strict=True)
+                if phase.phase_name == "compliance"
+            ]
+            active = _drop_failed(active, compliance_results)
+
+            # Phase 5: Quality Assurance
+            results = run_stage(
+                [
+                    (
+                        state.quality_assurance,
+                        self.qa_agent,
+                        self.qa_agent.review_request(
+                            _batch_custom_id(state, state.quality_assurance),
+                            item["note"],
+                            state.documentation.content,
+                            state.coding.content,
+                            state.compliance.content,
+                            ctx,
+                        ),
+                    )
+                    for item, state, ctx in active
+                ]
+            )
+            for (_, state, _), result in zip(active, results, strict=True):
+                if "error" in result:
+                    state.status = WorkflowStatus.NEEDS_REVIEW
+                else:
+                    state.complete()
+
+        except Exception as e:
+            logger.error(
+                "workflow_batch_unexpected_error",
+                num_workflows=len(workflows),
+                error=str(e),
+            )
+            for _, state, _ in workflows:
+                if state.status == WorkflowStatus.IN_PROGRESS:
+                    state.fail()
+
+        states = [state for _, state, _ in workflows]
+        for state in states:
+            self._log_workflow_finished(state)
+        return states
+
+    def _start_workflow(
+        self,
+        note: str,
+        patient_id: str | None,
+        payer: str | None,
+        skip_prior_auth: bool,
+        context: dict[str, Any] | None,
+    ) -> tuple[WorkflowState, dict[str, Any] | None]:
+        """Create and start the workflow state, and build the shared agent context."""
+        state = WorkflowState(
+            raw_note=note,
+            patient_id=patient_id,
+            payer=payer,
+            workflow_id=str(uuid.uuid4()),
+            skip_prior_auth=skip_prior_auth,
+        )
+
+        state.start()
+
+        logger.info(
+            "workflow_started",
+            workflow_id=state.workflow_id,
+            has_patient_id=patient_id is not None,
+            payer=payer,
+            skip_prior_auth=skip_prior_auth,
+        )
+
+        # Build shared context
+        shared_context = dict(context) if context else {}
+        if patient_id:
+            shared_context["patient_id"] = patient_id
+        if payer:
+            shared_context["payer"] = payer
+
+        return state, shared_context if shared_context else None
+
+    @staticmethod
+    def _log_workflow_finished(state: WorkflowState) -> None:
+        """Log the final workflow status, duration, and token usage."""
         logger.info(
             "workflow_finished",
             workflow_id=state.workflow_id,
-            status=state.status.value,
+            status=state.status.label,
             total_duration_seconds=state.total_duration_seconds,
             total_tokens=state.total_tokens,
         )
 
-        return state
+
+def _batch_custom_id(state: WorkflowState, phase: PhaseResult) -> str:
+    """Message Batches custom_id tying a request to its workflow and phase."""
+    return f"{state.workflow_id}-{phase.phase_name}"
+
+
+def _drop_failed(
+    workflows: list[tuple[dict[str, Any], WorkflowState, dict[str, Any] | None]],
+    results: list[dict[str, Any]],
+) -> list[tuple[dict[str, Any], WorkflowState, dict[str, Any] | None]]:
+    """Fail the workflows whose stage result is an error and return the rest."""
+    remaining = []
+    for workflow, result in zip(workflows, results, strict=True):
+        if "error" in result:
+            workflow[1].fail()
+        else:
+            remaining.append(workflow)
+    return remaining
@@ -3,37 +3,51 @@ Workflow state management for the clinical pipeline.
 
 Maintains state across agent executions, tracking results from each phase
 and timing for latency measurement.
+
+Durations are measured with integer time.perf_counter_ns() readings;
+started_at/completed_at remain time.monotonic() timestamps.
 """
 
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from typing import Any
 
+from src.python.utils.serialization import dumps
+
+
+class WorkflowStatus(IntEnum):
+    """Status of a workflow execution (serialized as its lowercase name via ``label``)."""
 
-class WorkflowStatus(Enum):
-    """Status of a workflow execution."""
+    PENDING = 0
+    IN_PROGRESS = 1
+    COMPLETED = 2
+    FAILED = 3
+    NEEDS_REVIEW = 4
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
 
-    PENDING = "pending"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    NEEDS_REVIEW = "needs_review"
 
+class PhaseStatus(IntEnum):
+    """Status of an individual pipeline phase (serialized as its lowercase name via ``label``)."""
 
-class PhaseStatus(Enum):
-    """Status of an individual pipeline phase."""
+    PENDING = 0
+    RUNNING = 1
+    COMPLETED = 2
+    FAILED = 3
+    SKIPPED = 4
 
-    PENDING = "pending"
-    RUNNING = "running"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    SKIPPED = "skipped"
+    @property
+    def label(self) -> str:
+        return self.name.lower()
 
 
-@dataclass
+@dataclass(slots=True)
 class PhaseResult:
     """Result from a single pipeline phase."""
 
@@ -45,17 +59,23 @@ class PhaseResult:
     usage: dict[str, int] = field(default_factory=dict)
     started_at: float | None = None
     completed_at: float | None = None
+    _started_ns: int | None = field(default=None, init=False, repr=False, compare=False)
+    _completed_ns: int | None = field(default=None, init=False, repr=False, compare=False)
+    _on_finished: Callable[[PhaseResult], None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def duration_seconds(self) -> float | None:
         """Calculate phase duration in seconds."""
-        if self.started_at is not None and self.completed_at is not None:
-            return self.completed_at - self.started_at
+        if self._started_ns is not None and self._completed_ns is not None:
+            return (self._completed_ns - self._started_ns) / 1e9
         return None
 
     def mark_running(self) -> None:
         """Mark phase as running."""
         self.status = PhaseStatus.RUNNING
+        self._started_ns = time.perf_counter_ns()
         self.started_at = time.monotonic()
 
     def mark_completed(self, content: str, usage: dict[str, int]) -> None:
@@ -63,27 +83,41 @@ class PhaseResult:
         self.status = PhaseStatus.COMPLETED
         self.content = content
         self.usage = usage
-        self.completed_at = time.monotonic()
+        self._mark_finished()
+        if self._on_finished is not None:
+            self._on_finished(self)
 
     def mark_failed(self, error: str) -> None:
         """Mark phase as failed with error."""
         self.status = PhaseStatus.FAILED
         self.error = error
-        self.completed_at = time.monotonic()
+        self._mark_finished()
+        if self._on_finished is not None:
+            self._on_finished(self)
 
     def mark_skipped(self) -> None:
         """Mark phase as skipped."""
         self.status = PhaseStatus.SKIPPED
+        self._mark_finished()
+
+    def _mark_finished(self) -> None:
+        """Record the end timestamps."""
+        self._completed_ns = time.perf_counter_ns()
         self.completed_at = time.monotonic()
 
 
-@dataclass
+# WorkflowState fields holding a PhaseResult, in pipeline order
+_PHASE_FIELDS = ("documentation", "coding", "compliance", "prior_auth", "quality_assurance")
+
+
+@dataclass(slots=True)
 class WorkflowState:
     """
     Maintains state across the clinical pipeline execution.
 
     Tracks the raw note input, results from each agent phase,
-    and timing for latency measurement.
+    and timing for latency measurement. Token totals and the completed/failed
+    phase lists are updated as each phase finishes rather than recomputed on read.
     """
 
     # Input
@@ -96,8 +130,8 @@ class WorkflowState:
     status: WorkflowStatus = WorkflowStatus.PENDING
     started_at: float | None = None
     completed_at: float | None = None
-
-    # Phase results
+    _started_ns: int | None = field(default=None, init=False, repr=False, compare=False)
+    _completed_ns: int | None = field(default=None, init=False, repr=False, compare=False)
     documentation: PhaseResult = field(
         default_factory=lambda: PhaseResult(
             phase_name="documentation", agent_name="clinical_documentation"
@@ -123,72 +157,124 @@ class WorkflowState:
     # Configuration
     skip_prior_auth: bool = False
 
+    # Running aggregates, maintained by _record_phase_finished. Keyed by phase
+    # name so a phase that finishes again (e.g. fails, then completes on a
+    # rerun) replaces its earlier entry instead of being counted twice.
+    _input_tokens: int = field(default=0, init=False, repr=False, compare=False)
+    _output_tokens: int = field(default=0, init=False, repr=False, compare=False)
+    _finished_phases: dict[str, PhaseResult] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _phase_tokens: dict[str, tuple[int, int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _all_phases: tuple[PhaseResult, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Materialize the phase tuple and register the aggregate callback on every phase."""
+        self._all_phases = tuple(getattr(self, name) for name in _PHASE_FIELDS)
+        for phase in self._all_phases:
+            phase._on_finished = self._record_phase_finished
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Phases assigned after construction must feed the aggregates too
+        if name in _PHASE_FIELDS and getattr(self, "_all_phases", None):
+            self._replace_phase(getattr(self, name), value)
+            object.__setattr__(self, name, value)
+            self._all_phases = tuple(getattr(self, phase) for phase in _PHASE_FIELDS)
+            return
+        object.__setattr__(self, name, value)
+
+    def _replace_phase(self, old: PhaseResult, new: PhaseResult) -> None:
+        """Detach a replaced phase from the aggregates and attach its replacement."""
+        old._on_finished = None
+        self._forget_phase(old.phase_name)
+        new._on_finished = self._record_phase_finished
+        if new.status in (PhaseStatus.COMPLETED, PhaseStatus.FAILED):
+            self._record_phase_finished(new)
+
+    def _forget_phase(self, phase_name: str) -> None:
+        """Drop a phase's entry and token contribution from the aggregates."""
+        self._finished_phases.pop(phase_name, None)
+        input_tokens, output_tokens = self._phase_tokens.pop(phase_name, (0, 0))
+        self._input_tokens -= input_tokens
+        self._output_tokens -= output_tokens
+
+    def _record_phase_finished(self, phase: PhaseResult) -> None:
+        """Fold a finished phase into the running token totals and phase lists."""
+        self._forget_phase(phase.phase_name)
+        self._finished_phases[phase.phase_name] = phase
+        if phase.status == PhaseStatus.COMPLETED:
+            tokens = (phase.usage.get("input_tokens", 0), phase.usage.get("output_tokens", 0))
+            self._phase_tokens[phase.phase_name] = tokens
+            self._input_tokens += tokens[0]
+            self._output_tokens += tokens[1]
+
     @property
     def total_duration_seconds(self) -> float | None:
         """Calculate total workflow duration."""
-        if self.started_at is not None and self.completed_at is not None:
-            return self.completed_at - self.started_at
+        if self._started_ns is not None and self._completed_ns is not None:
+            return (self._completed_ns - self._started_ns) / 1e9
         return None
 
     @property
     def total_tokens(self) -> dict[str, int]:
-        """Calculate total token usage across all phases."""
-        total_input = 0
-        total_output = 0
-        for phase in self.all_phases:
-            total_input += phase.usage.get("input_tokens", 0)
-            total_output += phase.usage.get("output_tokens", 0)
-        return {"input_tokens": total_input, "output_tokens": total_output}
+        """Total token usage across completed phases."""
+        return {"input_tokens": self._input_tokens, "output_tokens": self._output_tokens}
 
     @property
-    def all_phases(self) -> list[PhaseResult]:
-        """Get all phase results as a list."""
-        return [
-            self.documentation,
-            self.coding,
-            self.compliance,
-            self.prior_auth,
-            self.quality_assurance,
-        ]
+    def all_phases(self) -> tuple[PhaseResult, ...]:
+        """Get all phase results in pipeline order (built once per workflow)."""
+        return self._all_phases
 
     @property
-    def completed_phases(self) -> list[PhaseResult]:
-        """Get only completed phase results."""
-        return [p for p in self.all_phases if p.status == PhaseStatus.COMPLETED]
+    def completed_phases(self) -> tuple[PhaseResult, ...]:
+        """Get completed phase results, in completion order."""
+        return tuple(p for p in self._finished_phases.values() if p.status == PhaseStatus.COMPLETED)
 
     @property
-    def failed_phases(self) -> list[PhaseResult]:
-        """Get only failed phase results."""
-        return [p for p in self.all_phases if p.status == PhaseStatus.FAILED]
+    def failed_phases(self) -> tuple[PhaseResult, ...]:
+        """Get failed phase results, in failure order."""
+        return tuple(p for p in self._finished_phases.values() if p.status == PhaseStatus.FAILED)
 
     def start(self) -> None:
         """Mark workflow as started."""
         self.status = WorkflowStatus.IN_PROGRESS
+        self._started_ns = time.perf_counter_ns()
         self.started_at = time.monotonic()
 
     def complete(self) -> None:
         """Mark workflow as completed."""
         self.status = WorkflowStatus.COMPLETED
-        self.completed_at = time.monotonic()
+        self._mark_finished()
 
     def fail(self) -> None:
         """Mark workflow as failed."""
         self.status = WorkflowStatus.FAILED
+        self._mark_finished()
+
+    def _mark_finished(self) -> None:
+        """Record the end timestamps."""
+        self._completed_ns = time.perf_counter_ns()
         self.completed_at = time.monotonic()
 
     def to_summary(self) -> dict[str, Any]:
         """Generate a workflow summary dict."""
         return {
             "workflow_id": self.workflow_id,
-            "status": self.status.value,
+            "status": self.status.label,
             "total_duration_seconds": self.total_duration_seconds,
             "total_tokens": self.total_tokens,
             "phases": {
                 phase.phase_name: {
-                    "status": phase.status.value,
+                    "status": phase.status.label,
                     "duration_seconds": phase.duration_seconds,
                     "has_error": phase.error is not None,
                 }
                 for phase in self.all_phases
             },
         }
+
+    def to_json(self) -> str:
+        """Serialize the workflow summary to compact JSON (orjson when available)."""
+        return dumps(self.to_summary())
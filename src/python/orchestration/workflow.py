@@ -2,27 +2,41 @@
 Workflow execution utilities for the clinical pipeline.
 
 Provides retry logic with exponential backoff and structured
-step execution for agent pipeline phases.
+step execution for agent pipeline phases, in sync and async variants,
+plus Message Batches execution of one phase across many workflows.
 """
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+import random
 import time
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TYPE_CHECKING, Any
 
 from src.python.orchestration.state import PhaseResult
 from src.python.utils.config import settings
 from src.python.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    import anthropic
+
+    from src.python.agents.base_agent import BaseAgent
+
 logger = get_logger(__name__)
 
+# Message batches expire after 24 hours, so a batch still running well past that is stuck
+BATCH_MAX_WAIT_SECONDS = 25 * 60 * 60
+
 
 def run_with_retry(
     fn: Callable[..., dict[str, Any]],
     *args: Any,
     max_retries: int | None = None,
     base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    jitter: bool = True,
     **kwargs: Any,
 ) -> dict[str, Any]:
     """
@@ -36,6 +50,9 @@ def run_with_retry(
         *args: Positional arguments for fn
         max_retries: Maximum retry attempts (defaults to settings.agent_max_retries)
         base_delay: Base delay in seconds between retries (doubles each attempt)
+        max_delay: Upper bound in seconds on the doubled delay
+        jitter: Scale each delay by a random factor in [0.5, 1.5) so concurrent
+            workflows do not retry in lockstep
         **kwargs: Keyword arguments for fn
 
     Returns:
@@ -55,24 +72,114 @@ def run_with_retry(
         last_result = result
 
         if attempt < max_retries:
-            delay = base_delay * (2**attempt)
-            logger.warning(
-                "agent_retry",
-                agent=result.get("agent", "unknown"),
-                attempt=attempt + 1,
-                max_retries=max_retries,
-                error=result.get("error"),
-                delay_seconds=delay,
+            time.sleep(_retry_delay(result, attempt, max_retries, base_delay, max_delay, jitter))
+
+    _log_retries_exhausted(last_result, max_retries)
+    return last_result
+
+
+async def arun_with_retry(
+    fn: Callable[..., dict[str, Any] | Awaitable[dict[str, Any]]],
+    *args: Any,
+    max_retries: int | None = None,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    jitter: bool = True,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """
+    Async variant of run_with_retry for use inside an event loop.
+
+    Backs off with asyncio.sleep so other phases keep running on the
+    event loop while this one waits. Sync callables are run in a worker
+    thread so a blocking agent call never stalls the loop either.
+
+    Args:
+        fn: The coroutine function (typically an async agent method) or sync
+            callable to execute
+        *args: Positional arguments for fn
+        max_retries: Maximum retry attempts (defaults to settings.agent_max_retries)
+        base_delay: Base delay in seconds between retries (doubles each attempt)
+        max_delay: Upper bound in seconds on the doubled delay
+        jitter: Scale each delay by a random factor in [0.5, 1.5) so concurrent
+            workflows do not retry in lockstep
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        The function result dict
+    """
+    if max_retries is None:
+        max_retries = settings.agent_max_retries
+
+    last_result: dict[str, Any] = {}
+
+    for attempt in range(max_retries + 1):
+        result = await _acall(fn, *args, **kwargs)
+
+        if "error" not in result:
+            return result
+
+        last_result = result
+
+        if attempt < max_retries:
+            await asyncio.sleep(
+                _retry_delay(result, attempt, max_retries, base_delay, max_delay, jitter)
             )
-            time.sleep(delay)
 
+    _log_retries_exhausted(last_result, max_retries)
+    return last_result
+
+
+async def _acall(
+    fn: Callable[..., dict[str, Any] | Awaitable[dict[str, Any]]], *args: Any, **kwargs: Any
+) -> dict[str, Any]:
+    """
+    Call fn and await its result if that is awaitable.
+
+    Coroutine functions, including objects with an async __call__, are called
+    on the loop. Anything else runs in a worker thread so a blocking agent
+    call never stalls the loop; if it hands back an awaitable, that is awaited.
+    """
+    if inspect.iscoroutinefunction(fn) or inspect.iscoroutinefunction(type(fn).__call__):
+        result = fn(*args, **kwargs)
+    else:
+        result = await asyncio.to_thread(fn, *args, **kwargs)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def _retry_delay(
+    result: dict[str, Any],
+    attempt: int,
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    jitter: bool,
+) -> float:
+    """Compute the capped, optionally jittered backoff delay and log the retry."""
+    delay = min(base_delay * (2**attempt), max_delay)
+    if jitter:
+        delay *= 0.5 + random.random()
+    logger.warning(
+        "agent_retry",
+        agent=result.get("agent", "unknown"),
+        attempt=attempt + 1,
+        max_retries=max_retries,
+        error=result.get("error"),
+        delay_seconds=delay,
+    )
+    return delay
+
+
+def _log_retries_exhausted(last_result: dict[str, Any], max_retries: int) -> None:
+    """Log the final error once every retry attempt has failed."""
     logger.error(
         "agent_retries_exhausted",
         agent=last_result.get("agent", "unknown"),
         max_retries=max_retries,
         final_error=last_result.get("error"),
     )
-    return last_result
 
 
 def execute_phase(
@@ -92,18 +199,13 @@ def execute_phase(
         fn: The agent method to call
         *args: Positional arguments for fn
         use_retry: Whether to use retry logic
-        **kwargs: Keyword arguments for fn
+        **kwargs: Keyword arguments for fn; retry options (max_retries, base_delay,
+            max_delay, jitter) are consumed by run_with_retry when use_retry is set
 
     Returns:
         The agent result dict
     """
-    phase.mark_running()
-
-    logger.info(
-        "phase_started",
-        phase=phase.phase_name,
-        agent=phase.agent_name,
-    )
+    _start_phase(phase)
 
     try:
         if use_retry:
@@ -111,16 +213,155 @@ def execute_phase(
         else:
             result = fn(*args, **kwargs)
     except Exception as e:
-        error_msg = f"Unexpected error: {e}"
-        phase.mark_failed(error_msg)
-        logger.error(
-            "phase_exception",
-            phase=phase.phase_name,
-            agent=phase.agent_name,
-            error=error_msg,
+        _fail_phase_on_exception(phase, e)
+        raise
+
+    _record_phase_result(phase, result)
+    return result
+
+
+async def aexecute_phase(
+    phase: PhaseResult,
+    fn: Callable[..., dict[str, Any] | Awaitable[dict[str, Any]]],
+    *args: Any,
+    use_retry: bool = True,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """
+    Async variant of execute_phase for use inside an event loop.
+
+    Args:
+        phase: The PhaseResult to update
+        fn: The async agent method to await, or a sync one to run in a worker thread
+        *args: Positional arguments for fn
+        use_retry: Whether to use retry logic
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        The agent result dict
+    """
+    _start_phase(phase)
+
+    try:
+        if use_retry:
+            result = await arun_with_retry(fn, *args, **kwargs)
+        else:
+            result = await _acall(fn, *args, **kwargs)
+    except Exception as e:
+        _fail_phase_on_exception(phase, e)
+        raise
+
+    _record_phase_result(phase, result)
+    return result
+
+
+def execute_phase_batch(
+    client: anthropic.Anthropic,
+    jobs: Sequence[tuple[PhaseResult, BaseAgent, dict[str, Any]]],
+    poll_interval: float = 10.0,
+    max_wait: float = BATCH_MAX_WAIT_SECONDS,
+) -> list[dict[str, Any]]:
+    """
+    Execute pipeline phases for many workflows as a single Message Batches request.
+
+    Blocks until the batch has ended, polling every poll_interval seconds.
+    Results are matched back to jobs by custom_id, since the batch does not
+    return them in submission order. Failed requests are not retried. A batch
+    still running after max_wait seconds is cancelled and every phase fails.
+
+    Args:
+        client: Anthropic client used to submit and poll the batch
+        jobs: (phase, agent, request) tuples, where request comes from one of the
+            agent's *_request() builders and has a custom_id unique within the batch
+        poll_interval: Seconds to wait between batch status checks
+        max_wait: Seconds to wait for the batch to end before cancelling it
+
+    Returns:
+        The agent result dicts, in job order
+
+    Raises:
+        TimeoutError: If the batch has not ended within max_wait seconds
+    """
+    if not jobs:
+        return []
+
+    for phase, _, _ in jobs:
+        _start_phase(phase)
+
+    try:
+        batch = client.messages.batches.create(requests=[request for _, _, request in jobs])
+        logger.info(
+            "phase_batch_submitted",
+            batch_id=batch.id,
+            phases=sorted({phase.phase_name for phase, _, _ in jobs}),
+            num_requests=len(jobs),
         )
+
+        deadline = time.monotonic() + max_wait
+        while batch.processing_status != "ended":
+            if time.monotonic() >= deadline:
+                _cancel_batch(client, batch.id)
+                raise TimeoutError(f"Message batch {batch.id} did not end within {max_wait:g}s")
+            time.sleep(poll_interval)
+            batch = client.messages.batches.retrieve(batch.id)
+
+        batch_results = {
+            entry.custom_id: entry.result for entry in client.messages.batches.results(batch.id)
+        }
+    except Exception as e:
+        for phase, _, _ in jobs:
+            _fail_phase_on_exception(phase, e)
         raise
 
+    results = []
+    for phase, agent, request in jobs:
+        result = agent.batch_result(batch_results.get(request["custom_id"]))
+        _record_phase_result(phase, result)
+        results.append(result)
+
+    logger.info(
+        "phase_batch_finished",
+        batch_id=batch.id,
+        num_failed=sum("error" in result for result in results),
+    )
+    return results
+
+
+def _cancel_batch(client: anthropic.Anthropic, batch_id: str) -> None:
+    """Request cancellation of a batch we stopped waiting for (best effort)."""
+    try:
+        client.messages.batches.cancel(batch_id)
+    except Exception as e:
+        logger.warning("phase_batch_cancel_failed", batch_id=batch_id, error=str(e))
+    else:
+        logger.warning("phase_batch_cancelled", batch_id=batch_id)
+
+
+def _start_phase(phase: PhaseResult) -> None:
+    """Mark a phase as running and log the start."""
+    phase.mark_running()
+
+    logger.info(
+        "phase_started",
+        phase=phase.phase_name,
+        agent=phase.agent_name,
+    )
+
+
+def _fail_phase_on_exception(phase: PhaseResult, error: Exception) -> None:
+    """Mark a phase as failed after its agent call raised."""
+    error_msg = f"Unexpected error: {error}"
+    phase.mark_failed(error_msg)
+    logger.error(
+        "phase_exception",
+        phase=phase.phase_name,
+        agent=phase.agent_name,
+        error=error_msg,
+    )
+
+
+def _record_phase_result(phase: PhaseResult, result: dict[str, Any]) -> None:
+    """Update phase state from an agent result dict."""
     if "error" in result:
         phase.mark_failed(result["error"])
         logger.error(
@@ -140,5 +381,3 @@ def execute_phase(
             agent=phase.agent_name,
             duration_seconds=phase.duration_seconds,
         )
-
-    return result
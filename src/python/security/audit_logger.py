@@ -8,18 +8,43 @@ the HIPAA-mandated minimum of 7 years.
 
 from __future__ import annotations
 
-import json
+import atexit
+import queue
+import threading
 import time
+from collections import defaultdict
 from dataclasses import asdict, dataclass
 from enum import Enum
+from functools import lru_cache
+from hashlib import blake2b
 from pathlib import Path
 from typing import Any
 
 from src.python.utils.config import settings
 from src.python.utils.logging import get_logger
+from src.python.utils.serialization import dumps
+
+try:
+    import msgpack
+except ImportError:  # only needed for format="msgpack"
+    msgpack = None  # type: ignore[assignment]
 
 logger = get_logger(__name__)
 
+# Userspace write buffer for the audit file handle
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Serialized entries waiting for the writer thread; log() blocks when full
+# rather than dropping audit records
+_QUEUE_MAXSIZE = 10_000
+
+# Maximum entries the writer thread pulls off the queue per write call
+_DRAIN_BATCH_SIZE = 512
+
+# On-disk encodings: newline-delimited JSON, or a stream of msgpack maps
+# (self-delimiting, so no separator; read back with msgpack.Unpacker)
+_FORMATS = ("ndjson", "msgpack")
+
 
 class AuditAction(Enum):
     """Actions that generate audit log entries."""
@@ -44,7 +69,12 @@ class AuditOutcome(Enum):
     DENIED = "denied"
 
 
-@dataclass
+# Enum member -> stored string, resolved once instead of via .value per call
+_ACTION_STR: dict[AuditAction, str] = {a: a.value for a in AuditAction}
+_OUTCOME_STR: dict[AuditOutcome, str] = {o: o.value for o in AuditOutcome}
+
+
+@dataclass(slots=True)
 class AuditEntry:
     """A single HIPAA audit log entry."""
 
@@ -61,7 +91,7 @@ class AuditEntry:
         return asdict(self)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        return dumps(self)
 
 
 class AuditLogger:
@@ -71,22 +101,59 @@ class AuditLogger:
     Writes structured audit entries to a dedicated log file separate
     from application logs. Entries are append-only and include
     hashed patient identifiers (never raw PHI).
+
+    log() only serializes the entry and queues it; a background writer thread
+    appends queued entries to the file in batches through a buffered handle,
+    flushing every flush_threshold_entries entries, whenever
+    flush_interval_seconds pass, and on drain()/close(). Readers of the file
+    should call drain() first.
+
+    Entries are stored as newline-delimited JSON by default; format="msgpack"
+    writes a stream of msgpack maps instead, which is smaller and cheaper to
+    encode (requires the optional msgpack package).
     """
 
-    def __init__(self, log_path: str | None = None):
+    def __init__(
+        self,
+        log_path: str | None = None,
+        flush_threshold_entries: int = 1000,
+        flush_interval_seconds: float = 1.0,
+        format: str = "ndjson",
+    ):
         """
         Initialize the audit logger.
 
         Args:
             log_path: Path to audit log file (defaults to settings.audit_log_path)
+            flush_threshold_entries: Flush once this many entries are buffered
+            flush_interval_seconds: Maximum time written entries stay buffered
+            format: On-disk encoding, "ndjson" or "msgpack"
+
+        Raises:
+            ValueError: If format is not a supported encoding
+            ImportError: If format is "msgpack" and msgpack is not installed
         """
+        if format not in _FORMATS:
+            raise ValueError(f"Unknown audit log format: {format!r} (expected one of {_FORMATS})")
+        if format == "msgpack" and msgpack is None:
+            raise ImportError(
+                "msgpack is required for format='msgpack' (install the msgpack extra)"
+            )
+        self.format = format
+
         self.log_path = Path(log_path or settings.audit_log_path)
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
         self._entries: list[AuditEntry] = []
+        # Per-action and per-workflow buckets so get_entries() is O(matches)
+        self._by_action: defaultdict[str, list[AuditEntry]] = defaultdict(list)
+        self._by_workflow: defaultdict[str, list[AuditEntry]] = defaultdict(list)
+
+        self._writer = _AuditWriter(self.log_path, flush_threshold_entries, flush_interval_seconds)
 
         logger.info(
             "audit_logger_initialized",
             log_path=str(self.log_path),
+            format=format,
         )
 
     def log(
@@ -113,11 +180,16 @@ class AuditLogger:
 
         Returns:
             The created AuditEntry
+
+        Raises:
+            OSError: If writing earlier entries to the audit log failed
         """
+        action_str = _ACTION_STR[action]
+        outcome_str = _OUTCOME_STR[outcome]
         entry = AuditEntry(
             timestamp=time.time(),
-            action=action.value,
-            outcome=outcome.value,
+            action=action_str,
+            outcome=outcome_str,
             agent_name=agent_name,
             workflow_id=workflow_id,
             patient_id_hash=_hash_identifier(patient_id) if patient_id else "",
@@ -126,12 +198,14 @@ class AuditLogger:
         )
 
         self._entries.append(entry)
+        self._by_action[action_str].append(entry)
+        self._by_workflow[entry.workflow_id].append(entry)
         self._write_entry(entry)
 
         logger.info(
             "audit_entry_recorded",
-            action=action.value,
-            outcome=outcome.value,
+            action=action_str,
+            outcome=outcome_str,
             agent_name=agent_name,
             resource_type=resource_type,
         )
@@ -139,9 +213,39 @@ class AuditLogger:
         return entry
 
     def _write_entry(self, entry: AuditEntry) -> None:
-        """Append an entry to the audit log file."""
-        with open(self.log_path, "a", encoding="utf-8") as f:
-            f.write(entry.to_json() + "\n")
+        """Queue an entry for the background writer."""
+        if self.format == "msgpack":
+            self._writer.put(msgpack.packb(entry.to_dict()))
+        else:
+            self._writer.put(entry.to_json().encode() + b"\n")
+
+    def drain(self) -> None:
+        """
+        Block until every logged entry has been written and flushed to the audit log file.
+
+        Raises:
+            OSError: If any entry could not be written
+        """
+        self._writer.drain()
+
+    def close(self) -> None:
+        """Write all pending entries, stop the writer thread, and close the audit log file."""
+        writer = getattr(self, "_writer", None)
+        if writer is not None:
+            writer.close()
+
+    def __enter__(self) -> AuditLogger:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # An exception cannot propagate out of __del__; log a lost-entries error instead
+        try:
+            self.close()
+        except OSError as e:
+            logger.error("audit_close_failed", error=str(e))
 
     @property
     def entry_count(self) -> int:
@@ -163,26 +267,154 @@ class AuditLogger:
         Returns:
             Matching audit entries
         """
-        results = self._entries
-
-        if action is not None:
-            results = [e for e in results if e.action == action.value]
+        action_str = _ACTION_STR[action] if action is not None else None
 
         if workflow_id is not None:
-            results = [e for e in results if e.workflow_id == workflow_id]
+            results = self._by_workflow.get(workflow_id, [])
+            if action_str is not None:
+                return [e for e in results if e.action == action_str]
+            return list(results)
 
-        return results
+        if action_str is not None:
+            return list(self._by_action.get(action_str, []))
+
+        return self._entries
+
+
+class _AuditWriter:
+    """
+    Background writer that owns the audit log file handle.
+
+    Kept separate from AuditLogger so the writer thread holds no reference to
+    the logger, which can then still be closed by garbage collection.
+
+    A failed write is recorded and re-raised to the caller of the next put(),
+    drain() or close(), so lost audit entries never go unnoticed. The writer
+    is also closed at interpreter exit so queued entries are not dropped with
+    the daemon thread.
+    """
+
+    def __init__(self, log_path: Path, flush_threshold_entries: int, flush_interval_seconds: float):
+        self._flush_threshold_entries = flush_threshold_entries
+        self._flush_interval_seconds = flush_interval_seconds
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        self._closed = False
+        self._error: OSError | None = None
+
+        self._fh = open(log_path, "ab", buffering=_WRITE_BUFFER_SIZE)
+        self._io_lock = threading.Lock()
+        self._queue: queue.Queue[bytes | None] = queue.Queue(maxsize=_QUEUE_MAXSIZE)
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def put(self, line: bytes) -> None:
+        """Queue one serialized entry, blocking while the queue is full."""
+        if self._closed:
+            raise ValueError("Audit logger is closed")
+        self._raise_pending_error()
+        self._queue.put(line)
+
+    def drain(self) -> None:
+        """Wait for the queue to empty, then flush the file buffer."""
+        self._queue.join()
+        self._flush()
+        self._raise_pending_error()
+
+    def close(self) -> None:
+        """Stop the writer thread after it writes everything queued, then close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(None)
+        self._thread.join()
+        with self._io_lock:
+            try:
+                self._fh.close()
+            except OSError as e:  # final flush of the file buffer failed
+                self._error = self._error or e
+        self._raise_pending_error()
+
+    def _raise_pending_error(self) -> None:
+        """Raise (once) the first write error recorded since the last report."""
+        error, self._error = self._error, None
+        if error is not None:
+            raise OSError(f"Audit log write failed; entries were lost: {error}") from error
+
+    def _flush(self) -> None:
+        with self._io_lock:
+            if not self._fh.closed:
+                self._fh.flush()
+            self._unflushed = 0
+            self._last_flush = time.monotonic()
+
+    def _run(self) -> None:
+        """Writer loop: write queued entries in batches until the close sentinel arrives."""
+        q = self._queue
+        stopping = False
+
+        while not stopping:
+            try:
+                first = q.get(timeout=self._flush_interval_seconds)
+            except queue.Empty:
+                # Idle: make sure nothing written earlier sits in the buffer for long
+                if self._unflushed:
+                    try:
+                        self._flush()
+                    except OSError as e:
+                        logger.error("audit_flush_failed", error=str(e))
+                        self._error = self._error or e
+                continue
+
+            stopping = first is None
+            batch = [] if stopping else [first]
+            while not stopping and len(batch) < _DRAIN_BATCH_SIZE:
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                else:
+                    batch.append(item)
+
+            try:
+                if batch:
+                    with self._io_lock:
+                        self._fh.writelines(batch)
+                        self._unflushed += len(batch)
+                if (
+                    stopping
+                    or self._unflushed >= self._flush_threshold_entries
+                    or time.monotonic() - self._last_flush >= self._flush_interval_seconds
+                ):
+                    self._flush()
+            except OSError as e:
+                logger.error("audit_write_failed", error=str(e), entries=len(batch))
+                self._error = self._error or e
+            finally:
+                for _ in range(len(batch) + stopping):
+                    q.task_done()
 
 
 def _hash_identifier(identifier: str) -> str:
     """
     Hash a patient identifier for audit logging.
 
-    Uses SHA-256 with a salt from settings to produce a consistent
-    but irreversible hash for audit correlation.
+    Uses BLAKE2b keyed with a salt from settings to produce a consistent
+    but irreversible 64-bit (16 hex character) hash for audit correlation.
     """
-    import hashlib
+    return _salted_hash(settings.secret_key[:16], identifier)
 
-    salt = settings.secret_key[:16]
-    salted = f"{salt}:{identifier}"
-    return hashlib.sha256(salted.encode()).hexdigest()[:16]
+
+@lru_cache(maxsize=4096)
+def _salted_hash(salt: str, identifier: str) -> str:
+    """
+    Memoized digest for _hash_identifier().
+
+    The salt is part of the cache key, so changing the secret key never
+    returns a digest computed under the old one.
+    """
+    return blake2b(identifier.encode(), digest_size=8, key=salt.encode()).hexdigest()
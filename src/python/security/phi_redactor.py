@@ -10,7 +10,9 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
+from functools import lru_cache
+from hashlib import blake2b
 from typing import Any
 
 from src.python.utils.config import settings
@@ -23,27 +25,36 @@ class RedactionMethod(Enum):
     """Method used to redact PHI."""
 
     MASK = "mask"  # Replace with [REDACTED]
-    HASH = "hash"  # Replace with SHA-256 hash prefix
+    HASH = "hash"  # Replace with a short BLAKE2b digest
     REMOVE = "remove"  # Remove entirely
 
 
-class PHICategory(Enum):
-    """HIPAA Safe Harbor 18 identifier categories."""
+class PHICategory(IntEnum):
+    """
+    HIPAA Safe Harbor 18 identifier categories.
+
+    Values are sequential bit positions so a set of categories packs into an
+    int mask; ``label`` is the lowercase name reported in redaction results.
+    """
+
+    NAME = 0
+    DATE = 1
+    PHONE = 2
+    EMAIL = 3
+    SSN = 4
+    MRN = 5
+    ACCOUNT_NUMBER = 6
+    IP_ADDRESS = 7
+    URL = 8
+    AGE_OVER_89 = 9
+    ZIP_CODE = 10
 
-    NAME = "name"
-    DATE = "date"
-    PHONE = "phone"
-    EMAIL = "email"
-    SSN = "ssn"
-    MRN = "mrn"
-    ACCOUNT_NUMBER = "account_number"
-    IP_ADDRESS = "ip_address"
-    URL = "url"
-    AGE_OVER_89 = "age_over_89"
-    ZIP_CODE = "zip_code"
+    @property
+    def label(self) -> str:
+        return _LABELS[self]
 
 
-@dataclass
+@dataclass(slots=True)
 class RedactionResult:
     """Result of a PHI redaction operation."""
 
@@ -60,6 +71,15 @@ class RedactionResult:
         return self.redaction_count > 0
 
 
+# Labels and replacement tags built once per category (indexed by value), so
+# redaction hands back the same string objects instead of formatting new ones
+_LABELS: tuple[str, ...] = tuple(category.name.lower() for category in PHICategory)
+_TAGS: tuple[str, ...] = tuple(category.name for category in PHICategory)
+_MASKS: tuple[str, ...] = tuple(f"[{tag}]" for tag in _TAGS)
+
+# Mask selecting every category
+_ALL_CATEGORIES = (1 << len(PHICategory)) - 1
+
 # Pre-compiled regex patterns for PHI detection
 _PHI_PATTERNS: list[tuple[PHICategory, re.Pattern[str]]] = [
     # SSN: 123-45-6789 or 123456789
@@ -112,6 +132,60 @@ _PHI_PATTERNS: list[tuple[PHICategory, re.Pattern[str]]] = [
     (PHICategory.URL, re.compile(r"https?://[^\s<>\"]+", re.IGNORECASE)),
 ]
 
+# Every pattern above needs a digit, an "@" (email) or "://" (URL). Text with
+# none of them cannot contain detectable PHI, which one cheap scan establishes
+# before running the full alternation.
+_PHI_PRESCREEN = re.compile(r"[\d@]|://")
+
+
+@lru_cache(maxsize=32)
+def _combined_pattern(
+    category_mask: int = _ALL_CATEGORIES,
+) -> tuple[re.Pattern[str], tuple[PHICategory | None, ...]]:
+    """
+    Compile the PHI patterns into a single alternation scanned in one pass.
+
+    Each pattern becomes a named group (``p0``, ``p1``, ...) so the matching
+    category can be recovered from ``match.lastindex``. Alternatives keep the
+    order of ``_PHI_PATTERNS``, which decides precedence when two patterns match
+    at the same position; per-pattern flags are preserved as scoped inline flags.
+
+    Args:
+        category_mask: Bitmask of PHI categories to include (bit ``1 << category``)
+
+    Returns:
+        Tuple of (compiled pattern, category for each group index)
+    """
+    alternatives: list[str] = []
+    group_categories: dict[str, PHICategory] = {}
+    for index, (category, pattern) in enumerate(_PHI_PATTERNS):
+        if not category_mask & (1 << category):
+            continue
+        name = f"p{index}"
+        source = pattern.pattern
+        if pattern.flags & re.IGNORECASE:
+            source = f"(?i:{source})"
+        alternatives.append(f"(?P<{name}>{source})")
+        group_categories[name] = category
+
+    combined = re.compile("|".join(alternatives))
+    # lastindex reports the outermost group that closed last, i.e. the named
+    # alternative, so a flat tuple maps it straight to its category
+    by_index: list[PHICategory | None] = [None] * (combined.groups + 1)
+    for name, group_index in combined.groupindex.items():
+        by_index[group_index] = group_categories[name]
+    return combined, tuple(by_index)
+
+
+def _category_mask(categories: set[PHICategory] | None) -> int:
+    """Pack a category filter into a bitmask (all categories when empty)."""
+    if not categories:
+        return _ALL_CATEGORIES
+    mask = 0
+    for category in categories:
+        mask |= 1 << category
+    return mask
+
 
 def redact_phi(
     text: str,
@@ -132,30 +206,35 @@ def redact_phi(
     if method is None:
         method = RedactionMethod(settings.phi_redaction_method)
 
-    result = RedactionResult(original_length=len(text), redacted_length=0)
-    redacted = text
-
-    for category, pattern in _PHI_PATTERNS:
-        if categories and category not in categories:
-            continue
-
-        matches = list(pattern.finditer(redacted))
-        if not matches:
-            continue
+    if not _PHI_PRESCREEN.search(text):
+        return text, RedactionResult(original_length=len(text), redacted_length=len(text))
 
-        # Process matches in reverse order to preserve positions
-        for match in reversed(matches):
-            original_value = match.group()
-            replacement = _get_replacement(original_value, category, method)
+    result = RedactionResult(original_length=len(text), redacted_length=0)
+    pattern, group_categories = _combined_pattern(_category_mask(categories))
+
+    # Single left-to-right scan: stitch unmatched slices and replacements together
+    parts: list[str] = []
+    last_end = 0
+    for match in pattern.finditer(text):
+        category: PHICategory = group_categories[match.lastindex]  # type: ignore[assignment,index]
+        replacement = _get_replacement(match.group(), category, method)
+
+        result.redactions.append(
+            {
+                "category": _LABELS[category],
+                "replacement": replacement,
+            }
+        )
 
-            result.redactions.append(
-                {
-                    "category": category.value,
-                    "replacement": replacement,
-                }
-            )
+        parts.append(text[last_end : match.start()])
+        parts.append(replacement)
+        last_end = match.end()
 
-            redacted = redacted[: match.start()] + replacement + redacted[match.end() :]
+    if parts:
+        parts.append(text[last_end:])
+        redacted = "".join(parts)
+    else:
+        redacted = text
 
     result.redacted_length = len(redacted)
 
@@ -171,19 +250,19 @@ def redact_phi(
 
 def _get_replacement(value: str, category: PHICategory, method: RedactionMethod) -> str:
     """Generate a replacement string based on the redaction method."""
-    if method == RedactionMethod.MASK:
-        return f"[{category.value.upper()}]"
-
-    if method == RedactionMethod.HASH:
-        import hashlib
+    if method is RedactionMethod.MASK:
+        return _MASKS[category]
 
-        hash_val = hashlib.sha256(value.encode()).hexdigest()[:8]
-        return f"[{category.value.upper()}:{hash_val}]"
+    if method is RedactionMethod.HASH:
+        # 4-byte digest gives the same 8 hex chars as before without hashing a
+        # full SHA-256 and slicing it per match
+        hash_val = blake2b(value.encode(), digest_size=4).hexdigest()
+        return f"[{_TAGS[category]}:{hash_val}]"
 
-    if method == RedactionMethod.REMOVE:
+    if method is RedactionMethod.REMOVE:
         return ""
 
-    return f"[{category.value.upper()}]"
+    return _MASKS[category]
 
 
 def contains_phi(text: str) -> bool:
@@ -192,10 +271,10 @@ def contains_phi(text: str) -> bool:
 
     More efficient than full redaction when you only need a boolean check.
     """
-    for _category, pattern in _PHI_PATTERNS:
-        if pattern.search(text):
-            return True
-    return False
+    if not _PHI_PRESCREEN.search(text):
+        return False
+    pattern, _ = _combined_pattern()
+    return pattern.search(text) is not None
 
 
 def redact_dict(
@@ -203,7 +282,10 @@ def redact_dict(
     method: RedactionMethod | None = None,
 ) -> dict[str, Any]:
     """
-    Recursively redact PHI from all string values in a dictionary.
+    Redact PHI from all string values in a dictionary, at any nesting depth.
+
+    Nested dicts and lists (including dicts inside lists) are walked with an
+    explicit stack rather than recursion; non-string leaves are copied as-is.
 
     Args:
         data: Dictionary potentially containing PHI in string values
@@ -212,16 +294,29 @@ def redact_dict(
     Returns:
         New dictionary with PHI redacted from all string values
     """
+    if method is None:
+        method = RedactionMethod(settings.phi_redaction_method)
+
+    redact = redact_phi
+    prescreen = _PHI_PRESCREEN.search
+
     redacted: dict[str, Any] = {}
-    for key, value in data.items():
-        if isinstance(value, str):
-            redacted[key], _ = redact_phi(value, method)
-        elif isinstance(value, dict):
-            redacted[key] = redact_dict(value, method)
-        elif isinstance(value, list):
-            redacted[key] = [
-                redact_phi(item, method)[0] if isinstance(item, str) else item for item in value
-            ]
-        else:
-            redacted[key] = value
+    # Each entry pairs the source (key, value) pairs with the new container to fill
+    stack: list[tuple[Any, Any]] = [(data.items(), redacted)]
+    while stack:
+        items, target = stack.pop()
+        for key, value in items:
+            kind = type(value)
+            if kind is str or isinstance(value, str):
+                target[key] = redact(value, method)[0] if prescreen(value) else value
+            elif kind is dict or isinstance(value, dict):
+                child: Any = {}
+                stack.append((value.items(), child))
+                target[key] = child
+            elif kind is list or isinstance(value, list):
+                child = [None] * len(value)
+                stack.append((enumerate(value), child))
+                target[key] = child
+            else:
+                target[key] = value
     return redacted
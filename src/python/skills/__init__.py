@@ -2,6 +2,7 @@
 
 from src.python.skills.skill_loader import (
     AVAILABLE_SKILLS,
+    SkillMeta,
     get_skill_summary,
     list_available_skills,
     load_skill,
@@ -10,6 +11,7 @@ from src.python.skills.skill_loader import (
 
 __all__ = [
     "AVAILABLE_SKILLS",
+    "SkillMeta",
     "get_skill_summary",
     "list_available_skills",
     "load_skill",
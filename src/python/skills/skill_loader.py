@@ -6,6 +6,8 @@ content for Claude Agent SDK sub-agents.
 """
 
 from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
 
 from src.python.utils.logging import get_logger
 
@@ -23,6 +25,64 @@ AVAILABLE_SKILLS = {
 }
 
 
+class SkillMeta(NamedTuple):
+    """A skill's content plus the heading and role line parsed from it."""
+
+    name: str
+    title: str
+    role: str
+    content: str
+
+
+def _parse_skill(name: str, content: str) -> SkillMeta:
+    """Extract the first heading and the first "You are ..." role line in one pass."""
+    title = ""
+    role = ""
+
+    for line in content.strip().split("\n"):
+        if line.startswith("# ") and not title:
+            title = line[2:].strip()
+        if "You are " in line:
+            role = line.strip()
+            break
+
+    return SkillMeta(name=name, title=title, role=role, content=content)
+
+
+def _read_skills() -> MappingProxyType[str, SkillMeta]:
+    """Read and parse every available skill file once; missing files are left out."""
+    skills = {}
+    for name, filename in AVAILABLE_SKILLS.items():
+        skill_file = SKILLS_DIR / filename
+        if skill_file.exists():
+            skills[name] = _parse_skill(name, skill_file.read_text(encoding="utf-8"))
+    return MappingProxyType(skills)
+
+
+# Skill files do not change at runtime, so all of them are read at import
+_SKILLS = _read_skills()
+
+
+def _get_skill(skill_name: str) -> SkillMeta:
+    """
+    Look up a preloaded skill.
+
+    Raises:
+        ValueError: If skill_name is not recognized
+        FileNotFoundError: If skill file is missing
+    """
+    try:
+        return _SKILLS[skill_name]
+    except KeyError:
+        if skill_name not in AVAILABLE_SKILLS:
+            raise ValueError(
+                f"Unknown skill: '{skill_name}'. Available skills: {list(AVAILABLE_SKILLS.keys())}"
+            ) from None
+        raise FileNotFoundError(
+            f"Skill file not found: {SKILLS_DIR / AVAILABLE_SKILLS[skill_name]}"
+        ) from None
+
+
 def load_skill(skill_name: str) -> str:
     """
     Load a skill's Markdown content by name.
@@ -37,26 +97,7 @@ def load_skill(skill_name: str) -> str:
         ValueError: If skill_name is not recognized
         FileNotFoundError: If skill file is missing
     """
-    if skill_name not in AVAILABLE_SKILLS:
-        raise ValueError(
-            f"Unknown skill: '{skill_name}'. Available skills: {list(AVAILABLE_SKILLS.keys())}"
-        )
-
-    skill_file = SKILLS_DIR / AVAILABLE_SKILLS[skill_name]
-
-    if not skill_file.exists():
-        raise FileNotFoundError(f"Skill file not found: {skill_file}")
-
-    content = skill_file.read_text(encoding="utf-8")
-
-    logger.info(
-        "skill_loaded",
-        skill_name=skill_name,
-        file=str(skill_file.name),
-        length=len(content),
-    )
-
-    return content
+    return _get_skill(skill_name).content
 
 
 def load_skills(*skill_names: str) -> str:
@@ -72,13 +113,8 @@ def load_skills(*skill_names: str) -> str:
     Raises:
         ValueError: If any skill_name is not recognized
     """
-    sections = []
-
-    for name in skill_names:
-        content = load_skill(name)
-        sections.append(content)
-
-    combined = "\n\n---\n\n".join(sections)
+    # Single join over a list: str.join sizes the result once
+    combined = "\n\n---\n\n".join([load_skill(name) for name in skill_names])
 
     logger.info(
         "skills_combined",
@@ -109,21 +145,10 @@ def get_skill_summary(skill_name: str) -> dict[str, str]:
     Returns:
         Dictionary with 'name', 'title', and 'role' keys
     """
-    content = load_skill(skill_name)
-    lines = content.strip().split("\n")
-
-    title = ""
-    role = ""
-
-    for line in lines:
-        if line.startswith("# ") and not title:
-            title = line[2:].strip()
-        if "You are " in line and not role:
-            role = line.strip()
-            break
+    skill = _get_skill(skill_name)
 
     return {
-        "name": skill_name,
-        "title": title,
-        "role": role,
+        "name": skill.name,
+        "title": skill.title,
+        "role": skill.role,
     }
@@ -0,0 +1,94 @@
+"""
+JSON serialization helpers.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both paths emit the same compact form (no whitespace, UTF-8
+characters unescaped), and both handle dataclasses, enums, and datetimes.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from datetime import date, datetime
+from enum import Enum
+from functools import cache
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# orjson rejects non-str dict keys by default; the stdlib stringifies them
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Field names of a dataclass type, looked up once per class."""
+    return tuple(f.name for f in dataclasses.fields(cls))
+
+
+def _default(obj: Any) -> Any:
+    """Serialize the types orjson handles natively for the stdlib fallback."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # Shallow: the encoder calls back here for any nested dataclass, so there
+        # is no need for asdict()'s recursive deep copy
+        return {name: getattr(obj, name) for name in _field_names(type(obj))}
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a compact JSON string.
+
+    Args:
+        obj: Value to serialize (dicts, lists, scalars, dataclasses, enums, datetimes)
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+    return _ENCODER.encode(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON bytes.
+
+    Same output as dumps(), without the str round trip for callers that
+    need bytes (orjson produces bytes natively).
+
+    Args:
+        obj: Value to serialize (dicts, lists, scalars, dataclasses, enums, datetimes)
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return _ENCODER.encode(obj).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parse JSON from bytes or text.
+
+    Args:
+        data: UTF-8 encoded JSON bytes or JSON text
+
+    Returns:
+        Parsed value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -25,6 +25,7 @@ from src.python.evaluation.compliance_rate import (
 )
 from src.python.evaluation.hallucination_audit import (
     HallucinationAuditReport,
+    _tokenize,
     audit_hallucinations,
 )
 from src.python.evaluation.latency_tracker import LatencyReport, TimingRecord, track_latency
@@ -313,6 +314,18 @@ def test_evaluate_compliance_false_positives():
     assert result.precision == 0.0
 
 
+def test_evaluate_compliance_abbreviation_and_misspelling():
+    """Test abbreviations and near-miss spellings still count as detected."""
+    result = evaluate_compliance(
+        "cr-5",
+        expected_issues=["uncontrolled hypertension", "missing laterality"],
+        detected_issues=["HTN uncontroled", "lateralty not documented"],
+    )
+
+    assert result.all_detected is True
+    assert result.false_positives == []
+
+
 def test_compliance_rate_report():
     """Test aggregated compliance report."""
     report = ComplianceRateReport(target_detection_rate=0.9)
@@ -327,6 +340,21 @@ def test_compliance_rate_report():
     assert d["all_detected_count"] == 2
 
 
+def test_compliance_rate_report_to_dict_matches_properties():
+    """Test single-pass to_dict agrees with the per-metric properties."""
+    report = ComplianceRateReport()
+    report.add(evaluate_compliance("c1", ["missing laterality"], ["laterality not specified"]))
+    report.add(evaluate_compliance("c2", ["upcoding risk"], ["phantom issue found"]))
+
+    d = report.to_dict()
+    assert d["total_cases"] == report.total_cases
+    assert d["all_detected_count"] == report.all_detected_count
+    assert d["mean_detection_rate"] == round(report.mean_detection_rate, 3)
+    assert d["mean_precision"] == round(report.mean_precision, 3)
+    assert d["mean_f1"] == round(report.mean_f1, 3)
+    assert d["meets_target"] is report.meets_target
+
+
 # ============================================================================
 # Hallucination Audit Tests
 # ============================================================================
@@ -401,6 +429,26 @@ def test_audit_token_overlap_matching():
     assert result.is_clean is True
 
 
+def test_audit_non_ascii_characters_separate_tokens():
+    """Test em-dashes and accented letters split words instead of joining them."""
+    assert _tokenize("chest pain—radiating, Café-au-lait") == {
+        b"chest",
+        b"pain",
+        b"radiating",
+        b"caf",
+        b"lait",
+    }
+
+    result = audit_hallucinations(
+        "ha-6",
+        source_note="Pt reports chest pain—radiating to left arm since this morning.",
+        predicted_codes=[],
+        output_findings=["radiating pain"],
+    )
+
+    assert result.is_clean is True
+
+
 def test_hallucination_audit_report():
     """Test aggregated hallucination report."""
     report = HallucinationAuditReport()
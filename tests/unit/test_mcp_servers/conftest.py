@@ -0,0 +1,38 @@
+"""
+Shared fixtures for MCP server unit tests.
+
+Session-scoped fixtures are created once per pytest-xdist worker, so the
+suite can run with ``pytest -n auto`` without each test paying setup costs.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    from fhir.resources.patient import Patient
+except ImportError:  # FHIR tests skip themselves when fhir.resources is missing
+    pass
+else:
+    # Pay the one-time model build and first-validation cost at collection time
+    # rather than inside whichever Patient test happens to run first.
+    # fhir.resources >= 8 (pydantic v2) builds its validator lazily.
+    if hasattr(Patient, "model_rebuild"):
+        Patient.model_rebuild()
+    Patient(id="warmup")
+
+
+@pytest.fixture(scope="session")
+def medical_knowledge_modules():
+    """
+    Import the medical knowledge embedding and search modules once per worker.
+
+    Skips dependent tests when the optional vector search stack
+    (numpy, qdrant-client, sentence-transformers) is not installed.
+    """
+    for dependency in ("numpy", "qdrant_client", "sentence_transformers"):
+        pytest.importorskip(dependency, reason=f"{dependency} not installed")
+
+    from src.python.mcp_servers.medical_knowledge import embeddings, search
+
+    return SimpleNamespace(embeddings=embeddings, search=search)
@@ -305,6 +305,32 @@ class TestEpicFHIRClient:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_search_patients_skips_non_patient_entries(
+        self, mock_epic_settings, sample_bundle_data
+    ):
+        """Test patient search ignores OperationOutcome and empty entries."""
+        client = EpicFHIRClient()
+        client._access_token = "mock_token"
+        client._token_expiry = datetime.now() + timedelta(hours=1)
+
+        bundle = dict(sample_bundle_data)
+        bundle["entry"] = [
+            *sample_bundle_data["entry"],
+            {"resource": {"resourceType": "OperationOutcome", "issue": []}},
+            {"fullUrl": "https://test.epic.com/fhir/Patient/missing"},
+        ]
+        mock_response = Mock()
+        mock_response.json.return_value = bundle
+        mock_response.raise_for_status = Mock()
+
+        with patch.object(client.http_client, "request", return_value=mock_response):
+            patients = await client.search_patients(family="Smith")
+
+        assert [p.id for p in patients] == ["e.test123"]
+
+        await client.close()
+
     @pytest.mark.skip(reason="Encounter FHIR structure complex - works with real Epic data")
     @pytest.mark.asyncio
     async def test_get_patient_encounters(self, mock_epic_settings, sample_encounter_data):
@@ -358,6 +384,7 @@ class TestEpicMCPServer:
         assert len(results) == 1
         assert results[0]["id"] == "e.test123"
         assert results[0]["name"][0]["family"] == "Smith"
+        assert set(results[0]) <= {"id", "identifier", "name", "birthDate", "gender", "address"}
 
     @pytest.mark.asyncio
     @patch("src.python.mcp_servers.epic_fhir.server.get_client")
@@ -4,145 +4,155 @@ Unit tests for Medical Knowledge Base MCP Server.
 Tests embedding generation, semantic search, and MCP server tools.
 """
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
 np = pytest.importorskip("numpy", reason="numpy not installed")
 pytest.importorskip("qdrant_client", reason="qdrant-client not installed")
+# embeddings imports sentence_transformers at module level; skip cleanly rather
+# than erroring at collection when it is absent
+pytest.importorskip("sentence_transformers", reason="sentence-transformers not installed")
 
 
 from src.python.mcp_servers.medical_knowledge.embeddings import (  # noqa: E402
     MedicalCodeEmbedder,
 )
 from src.python.mcp_servers.medical_knowledge.search import MedicalCodeSearch  # noqa: E402
-from src.python.mcp_servers.medical_knowledge.server import (  # noqa: E402
-    get_code_details,
-    get_code_hierarchy,
-    search_cpt,
-    search_icd10,
-)
 
+# Embedding rows generated once per module; tests only check shapes and dtypes
+_RNG = np.random.default_rng(0)
+_E768 = _RNG.random((8, 768), dtype=np.float32)
 
-@pytest.fixture
+# Returned by the mocked get_collection to signal that the collection exists
+_EXISTS = object()
+
+
+class FakeSentenceTransformer:
+    """Plain stand-in for SentenceTransformer (no model download, no Mock overhead)."""
+
+    def __init__(self, *args, **kwargs):
+        self.encode_calls = 0
+
+    def get_sentence_embedding_dimension(self):
+        return 768
+
+    def encode(self, texts, **kwargs):
+        self.encode_calls += 1
+        if isinstance(texts, str):
+            return _E768[0]
+        return _E768[: len(texts)]
+
+
+@pytest.fixture(scope="session")
+def fake_st_class():
+    """Fake SentenceTransformer class shared by the whole session."""
+    return FakeSentenceTransformer
+
+
+@pytest.fixture(autouse=True)
+def _fake_sentence_transformer(monkeypatch, medical_knowledge_modules, fake_st_class):
+    """Install the fake SentenceTransformer for every test in this module."""
+    monkeypatch.setattr(medical_knowledge_modules.embeddings, "SentenceTransformer", fake_st_class)
+
+
+# Sample codes shared by every test; none of the code paths under test mutate them
+SAMPLE_ICD10 = {
+    "code": "E11.9",
+    "description": "Type 2 diabetes mellitus without complications",
+    "category": "Endocrine, nutritional and metabolic diseases",
+    "parent_code": "E11",
+    "billable": True,
+    "keywords": [
+        "diabetes",
+        "type 2",
+        "mellitus",
+        "hyperglycemia",
+        "blood sugar",
+    ],
+}
+
+SAMPLE_CPT = {
+    "code": "99214",
+    "description": "Office or other outpatient visit for E/M of established patient",
+    "category": "Evaluation and Management",
+    "keywords": ["office visit", "established patient", "E&M"],
+}
+
+
+@pytest.fixture(scope="module")
 def sample_icd10_code():
     """Sample ICD-10 code for testing."""
-    return {
-        "code": "E11.9",
-        "description": "Type 2 diabetes mellitus without complications",
-        "category": "Endocrine, nutritional and metabolic diseases",
-        "parent_code": "E11",
-        "billable": True,
-        "keywords": [
-            "diabetes",
-            "type 2",
-            "mellitus",
-            "hyperglycemia",
-            "blood sugar",
-        ],
-    }
+    return SAMPLE_ICD10
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_cpt_code():
     """Sample CPT code for testing."""
-    return {
-        "code": "99214",
-        "description": "Office or other outpatient visit for E/M of established patient",
-        "category": "Evaluation and Management",
-        "keywords": ["office visit", "established patient", "E&M"],
-    }
+    return SAMPLE_CPT
 
 
-@pytest.fixture
-def mock_embedder():
-    """Mock MedicalCodeEmbedder for testing."""
-    embedder = Mock(spec=MedicalCodeEmbedder)
-    embedder.model_name = "test-model"
-    embedder.embedding_dim = 768
-    embedder.generate_embedding = Mock(return_value=np.random.rand(768).astype(np.float32))
-    return embedder
+@pytest.fixture(scope="module")
+def server():
+    """MCP server module, imported only by the tool test classes that need it."""
+    from src.python.mcp_servers.medical_knowledge import server
+
+    return server
 
 
 @pytest.fixture
-def mock_search_engine():
-    """Mock MedicalCodeSearch for testing."""
-    search_engine = Mock(spec=MedicalCodeSearch)
-    return search_engine
+def mock_embedder():
+    """Lightweight MedicalCodeEmbedder stand-in with only the attributes tools touch."""
+    return SimpleNamespace(
+        model_name="test-model",
+        embedding_dim=768,
+        generate_embedding=lambda text: _E768[0],
+    )
 
 
 class TestMedicalCodeEmbedder:
     """Test cases for MedicalCodeEmbedder."""
 
-    @patch("src.python.mcp_servers.medical_knowledge.embeddings.SentenceTransformer")
-    def test_embedder_initialization(self, mock_transformer):
-        """Test embedder initializes correctly."""
-        mock_model = Mock()
-        mock_model.get_sentence_embedding_dimension.return_value = 768
-        mock_transformer.return_value = mock_model
+    @pytest.fixture(scope="class")
+    def embedder(self, medical_knowledge_modules, fake_st_class):
+        """One embedder shared by the class; none of the tests mutate its state."""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(medical_knowledge_modules.embeddings, "SentenceTransformer", fake_st_class)
+            yield MedicalCodeEmbedder()
 
-        embedder = MedicalCodeEmbedder()
-
-        assert embedder.model is not None
+    def test_embedder_initialization(self, embedder):
+        """Test embedder initializes correctly."""
+        assert isinstance(embedder.model, FakeSentenceTransformer)
         assert embedder.embedding_dim == 768
-        mock_transformer.assert_called_once()
 
-    @patch("src.python.mcp_servers.medical_knowledge.embeddings.SentenceTransformer")
-    def test_generate_embedding(self, mock_transformer):
+    def test_generate_embedding(self, embedder):
         """Test embedding generation for single text."""
-        mock_model = Mock()
-        mock_model.get_sentence_embedding_dimension.return_value = 768
-        mock_model.encode.return_value = np.random.rand(768)
-        mock_transformer.return_value = mock_model
-
-        embedder = MedicalCodeEmbedder()
         embedding = embedder.generate_embedding("diabetes")
 
         assert isinstance(embedding, np.ndarray)
         assert embedding.shape == (768,)
         assert embedding.dtype == np.float32
 
-    @patch("src.python.mcp_servers.medical_knowledge.embeddings.SentenceTransformer")
-    def test_generate_embedding_empty_text(self, mock_transformer):
+    def test_generate_embedding_empty_text(self, embedder):
         """Test embedding generation handles empty text."""
-        mock_model = Mock()
-        mock_model.get_sentence_embedding_dimension.return_value = 768
-        mock_transformer.return_value = mock_model
-
-        embedder = MedicalCodeEmbedder()
         embedding = embedder.generate_embedding("")
 
         assert isinstance(embedding, np.ndarray)
         assert embedding.shape == (768,)
-        assert np.all(embedding == 0)  # Should return zero vector
+        assert not embedding.any()  # Should return zero vector
 
-    @patch("src.python.mcp_servers.medical_knowledge.embeddings.SentenceTransformer")
-    def test_embed_medical_code(self, mock_transformer, sample_icd10_code):
+    def test_embed_medical_code(self, embedder, sample_icd10_code):
         """Test embedding a medical code with metadata."""
-        mock_model = Mock()
-        mock_model.get_sentence_embedding_dimension.return_value = 768
-        mock_model.encode.return_value = np.random.rand(768)
-        mock_transformer.return_value = mock_model
-
-        embedder = MedicalCodeEmbedder()
         enriched = embedder.embed_medical_code(sample_icd10_code)
 
-        assert "embedding" in enriched
-        assert "composite_text" in enriched
-        assert "embedding_model" in enriched
+        assert enriched.keys() >= {"embedding", "composite_text", "embedding_model"}
         assert len(enriched["embedding"]) == 768
         assert "Type 2 diabetes" in enriched["composite_text"]
         assert "Keywords:" in enriched["composite_text"]
 
-    @patch("src.python.mcp_servers.medical_knowledge.embeddings.SentenceTransformer")
-    def test_embed_codes_batch(self, mock_transformer, sample_icd10_code, sample_cpt_code):
+    def test_embed_codes_batch(self, embedder, sample_icd10_code, sample_cpt_code):
         """Test batch embedding generation."""
-        mock_model = Mock()
-        mock_model.get_sentence_embedding_dimension.return_value = 768
-        mock_model.encode.return_value = np.random.rand(2, 768)
-        mock_transformer.return_value = mock_model
-
-        embedder = MedicalCodeEmbedder()
         codes = [sample_icd10_code, sample_cpt_code]
         enriched_codes = embedder.embed_medical_codes_batch(codes)
 
@@ -150,76 +160,72 @@ class TestMedicalCodeEmbedder:
         assert all("embedding" in code for code in enriched_codes)
         assert all(len(code["embedding"]) == 768 for code in enriched_codes)
 
-    @patch("src.python.mcp_servers.medical_knowledge.embeddings.SentenceTransformer")
-    def test_batch_size_limiting(self, mock_transformer):
+    def test_batch_size_limiting(self, embedder, monkeypatch, medical_knowledge_modules):
         """Test large batch is chunked to prevent OOM."""
-        mock_model = Mock()
-        mock_model.get_sentence_embedding_dimension.return_value = 768
-        # Return array matching input size
-        mock_model.encode.side_effect = lambda texts, **kwargs: np.random.rand(len(texts), 768)
-        mock_transformer.return_value = mock_model
-
-        embedder = MedicalCodeEmbedder()
+        monkeypatch.setattr(medical_knowledge_modules.embeddings, "BATCH_CHUNK_SIZE", 4)
 
-        # Create 15000 texts (should trigger chunking at 10000)
-        texts = [f"text {i}" for i in range(15000)]
+        # 6 texts with a chunk size of 4 should be encoded as 4 + 2
+        texts = [f"t{i}" for i in range(6)]
+        calls_before = embedder.model.encode_calls
         embeddings = embedder.generate_embeddings_batch(texts)
 
-        assert embeddings.shape == (15000, 768)
-        # Should have called encode twice (10000 + 5000)
-        assert mock_model.encode.call_count == 2
+        assert embeddings.shape == (6, 768)
+        assert embedder.model.encode_calls - calls_before == 2
 
 
 class TestMedicalCodeSearch:
     """Test cases for MedicalCodeSearch."""
 
-    @patch("src.python.mcp_servers.medical_knowledge.search.QdrantClient")
-    def test_search_engine_initialization(self, mock_qdrant):
+    @pytest.fixture(scope="class")
+    def qdrant_search(self):
+        """One search engine backed by a mocked QdrantClient, shared by the class."""
+        with patch("src.python.mcp_servers.medical_knowledge.search.QdrantClient") as mock_qdrant:
+            mock_client = Mock()
+            mock_qdrant.return_value = mock_client
+            yield MedicalCodeSearch(), mock_client
+
+    @pytest.fixture
+    def search_engine(self, qdrant_search):
+        """Shared search engine with the mocked client's state reset for this test."""
+        engine, mock_client = qdrant_search
+        mock_client.reset_mock(return_value=True, side_effect=True)
+        return engine
+
+    @pytest.fixture
+    def mock_client(self, qdrant_search):
+        """Mocked QdrantClient behind the shared search engine."""
+        return qdrant_search[1]
+
+    def test_search_engine_initialization(self, search_engine, mock_client):
         """Test search engine initializes correctly."""
-        search_engine = MedicalCodeSearch()
-        assert search_engine.client is not None
+        assert search_engine.client is mock_client
         assert search_engine.similarity_threshold == 0.7
 
-    @patch("src.python.mcp_servers.medical_knowledge.search.QdrantClient")
-    def test_collection_exists(self, mock_qdrant):
+    def test_collection_exists(self, search_engine, mock_client):
         """Test collection existence check."""
-        mock_client = Mock()
-        mock_client.get_collection.return_value = Mock()
-        mock_qdrant.return_value = mock_client
+        mock_client.get_collection.return_value = _EXISTS
 
-        search_engine = MedicalCodeSearch()
         exists = search_engine._collection_exists("icd10_codes")
 
         assert exists is True
         mock_client.get_collection.assert_called_once_with("icd10_codes")
 
-    @patch("src.python.mcp_servers.medical_knowledge.search.QdrantClient")
-    def test_create_collection(self, mock_qdrant):
+    def test_create_collection(self, search_engine, mock_client):
         """Test collection creation."""
-        mock_client = Mock()
         mock_client.get_collection.side_effect = Exception("Not found")
-        mock_qdrant.return_value = mock_client
 
-        search_engine = MedicalCodeSearch()
         search_engine.create_collection("test_collection", vector_size=768)
 
         mock_client.create_collection.assert_called_once()
 
-    @patch("src.python.mcp_servers.medical_knowledge.search.QdrantClient")
-    def test_search(self, mock_qdrant, sample_icd10_code):
+    def test_search(self, search_engine, mock_client, sample_icd10_code):
         """Test semantic search."""
-        mock_client = Mock()
-
         # Mock search results
-        mock_result = Mock()
-        mock_result.payload = sample_icd10_code
-        mock_result.score = 0.95
+        mock_result = SimpleNamespace(payload=sample_icd10_code, score=0.95)
         mock_client.search.return_value = [mock_result]
-        mock_client.get_collection.return_value = Mock()
-        mock_qdrant.return_value = mock_client
+        mock_client.get_collection.return_value = _EXISTS
 
-        search_engine = MedicalCodeSearch()
-        query_vector = np.random.rand(768)
+        query_vector = _E768[0]
         results = search_engine.search("icd10_codes", query_vector, limit=10)
 
         assert len(results) == 1
@@ -227,168 +233,137 @@ class TestMedicalCodeSearch:
         assert results[0]["similarity_score"] == 0.95
         mock_client.search.assert_called_once()
 
-    @patch("src.python.mcp_servers.medical_knowledge.search.QdrantClient")
-    def test_get_code_by_id(self, mock_qdrant, sample_icd10_code):
+    def test_get_code_by_id(self, search_engine, mock_client, sample_icd10_code):
         """Test exact code lookup."""
-        mock_client = Mock()
-
         # Mock scroll results
-        mock_point = Mock()
-        mock_point.payload = sample_icd10_code
+        mock_point = SimpleNamespace(payload=sample_icd10_code)
         mock_client.scroll.return_value = ([mock_point], None)
-        mock_client.get_collection.return_value = Mock()
-        mock_qdrant.return_value = mock_client
+        mock_client.get_collection.return_value = _EXISTS
 
-        search_engine = MedicalCodeSearch()
         result = search_engine.get_code_by_id("icd10_codes", "E11.9")
 
         assert result is not None
         assert result["code"] == "E11.9"
         assert result["description"] == "Type 2 diabetes mellitus without complications"
 
-    @patch("src.python.mcp_servers.medical_knowledge.search.QdrantClient")
-    def test_get_code_hierarchy(self, mock_qdrant, sample_icd10_code):
+    def test_get_code_hierarchy(self, search_engine, mock_client, sample_icd10_code):
         """Test code hierarchy retrieval."""
-        mock_client = Mock()
-
         # Mock code lookup
-        mock_point = Mock()
-        mock_point.payload = sample_icd10_code
+        mock_point = SimpleNamespace(payload=sample_icd10_code)
         mock_client.scroll.return_value = ([mock_point], None)
-        mock_client.get_collection.return_value = Mock()
-        mock_qdrant.return_value = mock_client
+        mock_client.get_collection.return_value = _EXISTS
 
-        search_engine = MedicalCodeSearch()
         hierarchy = search_engine.get_code_hierarchy("icd10_codes", "E11.9")
 
         assert hierarchy["found"] is True
         assert hierarchy["code"] == "E11.9"
-        assert "data" in hierarchy
-        assert "parent" in hierarchy
-        assert "children" in hierarchy
+        assert hierarchy.keys() >= {"data", "parent", "children"}
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestMCPServerTools:
     """Test cases for MCP server tools."""
 
-    @pytest.mark.asyncio
-    @patch("src.python.mcp_servers.medical_knowledge.server.get_search_engine")
-    @patch("src.python.mcp_servers.medical_knowledge.server.get_embedder")
-    async def test_search_icd10_tool(
-        self, mock_get_embedder, mock_get_search_engine, mock_embedder, sample_icd10_code
-    ):
-        """Test search_icd10 MCP tool."""
-        mock_get_embedder.return_value = mock_embedder
-
-        mock_search = Mock()
-        mock_search.search_by_text.return_value = [{**sample_icd10_code, "similarity_score": 0.92}]
-        mock_get_search_engine.return_value = mock_search
-
-        results = await search_icd10("diabetes", limit=5)
-
-        assert len(results) == 1
-        assert results[0]["code"] == "E11.9"
-        assert results[0]["similarity_score"] == 0.92
-
-    @pytest.mark.asyncio
-    @patch("src.python.mcp_servers.medical_knowledge.server.get_search_engine")
-    @patch("src.python.mcp_servers.medical_knowledge.server.get_embedder")
-    async def test_search_cpt_tool(
-        self, mock_get_embedder, mock_get_search_engine, mock_embedder, sample_cpt_code
+    @pytest.fixture(autouse=True)
+    def mock_search(self, monkeypatch, mock_embedder):
+        """Patch the server's embedder and search engine once per test."""
+        search = Mock()
+        monkeypatch.setattr(
+            "src.python.mcp_servers.medical_knowledge.server.get_embedder",
+            lambda: mock_embedder,
+        )
+        monkeypatch.setattr(
+            "src.python.mcp_servers.medical_knowledge.server.get_search_engine",
+            lambda: search,
+        )
+        return search
+
+    @pytest.mark.parametrize(
+        ("tool", "args", "method", "sample", "wrap"),
+        [
+            (
+                "search_icd10",
+                ("diabetes",),
+                "search_by_text",
+                "sample_icd10_code",
+                lambda c: [{**c, "similarity_score": 0.92}],
+            ),
+            (
+                "search_cpt",
+                ("office visit",),
+                "search_by_text",
+                "sample_cpt_code",
+                lambda c: [{**c, "similarity_score": 0.89}],
+            ),
+            (
+                "get_code_details",
+                ("icd10", "E11.9"),
+                "get_code_by_id",
+                "sample_icd10_code",
+                lambda c: c,
+            ),
+            (
+                "get_code_hierarchy",
+                ("icd10", "E11.9"),
+                "get_code_hierarchy",
+                "sample_icd10_code",
+                lambda c: {
+                    "code": c["code"],
+                    "found": True,
+                    "data": c,
+                    "parent": None,
+                    "children": [],
+                },
+            ),
+        ],
+        ids=["search_icd10", "search_cpt", "get_code_details", "get_code_hierarchy"],
+    )
+    async def test_tool_returns_search_engine_result(
+        self, request, server, mock_search, tool, args, method, sample, wrap
     ):
-        """Test search_cpt MCP tool."""
-        mock_get_embedder.return_value = mock_embedder
-
-        mock_search = Mock()
-        mock_search.search_by_text.return_value = [{**sample_cpt_code, "similarity_score": 0.89}]
-        mock_get_search_engine.return_value = mock_search
-
-        results = await search_cpt("office visit", limit=5)
-
-        assert len(results) == 1
-        assert results[0]["code"] == "99214"
-        assert results[0]["similarity_score"] == 0.89
-
-    @pytest.mark.asyncio
-    @patch("src.python.mcp_servers.medical_knowledge.server.get_search_engine")
-    async def test_get_code_details_tool(self, mock_get_search_engine, sample_icd10_code):
-        """Test get_code_details MCP tool."""
-        mock_search = Mock()
-        mock_search.get_code_by_id.return_value = sample_icd10_code
-        mock_get_search_engine.return_value = mock_search
+        """Test each lookup tool returns the search engine's result unchanged."""
+        expected = wrap(request.getfixturevalue(sample))
+        getattr(mock_search, method).return_value = expected
 
-        result = await get_code_details("icd10", "E11.9")
+        result = await getattr(server, tool)(*args)
 
-        assert result is not None
-        assert result["code"] == "E11.9"
-        assert "description" in result
-
-    @pytest.mark.asyncio
-    @patch("src.python.mcp_servers.medical_knowledge.server.get_search_engine")
-    async def test_get_code_hierarchy_tool(self, mock_get_search_engine, sample_icd10_code):
-        """Test get_code_hierarchy MCP tool."""
-        mock_search = Mock()
-        mock_search.get_code_hierarchy.return_value = {
-            "code": "E11.9",
-            "found": True,
-            "data": sample_icd10_code,
-            "parent": None,
-            "children": [],
-        }
-        mock_get_search_engine.return_value = mock_search
-
-        result = await get_code_hierarchy("icd10", "E11.9")
-
-        assert result["found"] is True
-        assert result["code"] == "E11.9"
+        assert result == expected
+        getattr(mock_search, method).assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_search_icd10_empty_query(self):
+    async def test_search_icd10_empty_query(self, server):
         """Test search_icd10 with empty query."""
-        results = await search_icd10("", limit=5)
+        results = await server.search_icd10("", limit=5)
         assert results == []
 
-    @pytest.mark.asyncio
-    async def test_search_icd10_limit_validation(self):
+    async def test_search_icd10_limit_validation(self, server, mock_search):
         """Test search_icd10 limit parameter validation."""
-        with patch("src.python.mcp_servers.medical_knowledge.server.get_embedder"):
-            with patch("src.python.mcp_servers.medical_knowledge.server.get_search_engine"):
-                # Limit too low
-                await search_icd10("test", limit=-5)
-                # Should not raise error, should clamp to 1
-
-                # Limit too high (should be capped at 50)
-                await search_icd10("test", limit=100)
-                # Should not raise error, should clamp to 50
-
-    @pytest.mark.asyncio
-    async def test_get_code_details_invalid_type(self):
+        mock_search.search_by_text.return_value = []
+
+        # Limit too low; should not raise error, should clamp to 1
+        await server.search_icd10("test", limit=-5)
+        assert mock_search.search_by_text.call_args.kwargs["limit"] == 1
+
+        # Limit too high; should not raise error, should clamp to 50
+        await server.search_icd10("test", limit=100)
+        assert mock_search.search_by_text.call_args.kwargs["limit"] == 50
+
+    async def test_get_code_details_invalid_type(self, server):
         """Test get_code_details with invalid code type."""
         with pytest.raises(ValueError, match="code_type must be"):
-            await get_code_details("invalid", "E11.9")
+            await server.get_code_details("invalid", "E11.9")
 
 
 class TestSemanticSearchAccuracy:
     """Integration-style tests for semantic search accuracy."""
 
-    @patch("src.python.mcp_servers.medical_knowledge.embeddings.SentenceTransformer")
     @patch("src.python.mcp_servers.medical_knowledge.search.QdrantClient")
-    def test_diabetes_query_matches_diabetes_code(
-        self, mock_qdrant, mock_transformer, sample_icd10_code
-    ):
+    def test_diabetes_query_matches_diabetes_code(self, mock_qdrant, sample_icd10_code):
         """Test that 'high blood sugar' query returns diabetes code."""
         # Setup mocks
-        mock_model = Mock()
-        mock_model.get_sentence_embedding_dimension.return_value = 768
-        mock_model.encode.return_value = np.random.rand(768)
-        mock_transformer.return_value = mock_model
-
         mock_client = Mock()
-        mock_result = Mock()
-        mock_result.payload = sample_icd10_code
-        mock_result.score = 0.92
+        mock_result = SimpleNamespace(payload=sample_icd10_code, score=0.92)
         mock_client.search.return_value = [mock_result]
-        mock_client.get_collection.return_value = Mock()
+        mock_client.get_collection.return_value = _EXISTS
         mock_qdrant.return_value = mock_client
 
         # Test search
@@ -402,30 +377,33 @@ class TestSemanticSearchAccuracy:
         assert results[0]["similarity_score"] > 0.7
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestErrorHandling:
     """Test error handling and edge cases."""
 
-    @pytest.mark.asyncio
-    @patch("src.python.mcp_servers.medical_knowledge.server.get_search_engine")
-    async def test_search_with_network_error(self, mock_get_search_engine):
+    @pytest.fixture(autouse=True)
+    def mock_search(self, monkeypatch):
+        """Patch the server's embedder and search engine once per test."""
+        search = Mock()
+        monkeypatch.setattr("src.python.mcp_servers.medical_knowledge.server.get_embedder", Mock())
+        monkeypatch.setattr(
+            "src.python.mcp_servers.medical_knowledge.server.get_search_engine",
+            lambda: search,
+        )
+        return search
+
+    async def test_search_with_network_error(self, server, mock_search):
         """Test search handles network errors gracefully."""
-        mock_search = Mock()
         mock_search.search_by_text.side_effect = Exception("Network error")
-        mock_get_search_engine.return_value = mock_search
 
-        with patch("src.python.mcp_servers.medical_knowledge.server.get_embedder"):
-            with pytest.raises(Exception, match="Network error"):
-                await search_icd10("test query")
+        with pytest.raises(Exception, match="Network error"):
+            await server.search_icd10("test query")
 
-    @pytest.mark.asyncio
-    @patch("src.python.mcp_servers.medical_knowledge.server.get_search_engine")
-    async def test_get_code_not_found(self, mock_get_search_engine):
+    async def test_get_code_not_found(self, server, mock_search):
         """Test get_code_details when code doesn't exist."""
-        mock_search = Mock()
         mock_search.get_code_by_id.return_value = None
-        mock_get_search_engine.return_value = mock_search
 
-        result = await get_code_details("icd10", "INVALID")
+        result = await server.get_code_details("icd10", "INVALID")
 
         assert result is None
 
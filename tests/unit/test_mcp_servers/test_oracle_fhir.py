@@ -5,15 +5,20 @@ Tests Oracle Health FHIR client authentication, FHIR operations, and MCP server
 using mocked HTTP responses.
 """
 
-from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, Mock, patch
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 pytest.importorskip("fhir.resources", reason="fhir.resources not installed")
 
 from fhir.resources.patient import Patient
 
+from src.python.mcp_servers.oracle_fhir import server as oracle_server
 from src.python.mcp_servers.oracle_fhir.client import (
     AuthenticationError,
     OracleHealthFHIRClient,
@@ -23,43 +28,115 @@ from src.python.mcp_servers.oracle_fhir.server import (
     search_patients,
 )
 
+# Every test in this module shares one event loop per session
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture
-def mock_oracle_settings(monkeypatch):
-    """Mock Oracle Health settings for testing."""
-    monkeypatch.setenv("ORACLE_CLIENT_ID", "test_oracle_client_id")
-    monkeypatch.setenv("ORACLE_FHIR_BASE_URL", "https://test.cerner.com/fhir")
-    monkeypatch.setenv("ORACLE_AUTH_URL", "https://test.cerner.com/oauth2/token")
-    monkeypatch.setenv("ORACLE_PRIVATE_KEY_PATH", "/tmp/test_oracle_key.pem")
+
+ORACLE_TEST_ENV = {
+    "ORACLE_CLIENT_ID": "test_oracle_client_id",
+    "ORACLE_FHIR_BASE_URL": "https://test.cerner.com/fhir",
+    "ORACLE_AUTH_URL": "https://test.cerner.com/oauth2/token",
+    "ORACLE_PRIVATE_KEY_PATH": "/tmp/test_oracle_key.pem",
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _oracle_env():
+    """Set the Oracle Health settings environment once for the whole session."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in ORACLE_TEST_ENV.items():
+            mp.setenv(name, value)
+        yield
+
+
+# Checked-in throwaway RSA key (TEST ONLY); avoids 2048-bit keygen in the suite
+_TEST_KEY_FILE = Path(__file__).parent.parent.parent / "fixtures" / "oracle_test_key.pem"
+
+
+@pytest.fixture(scope="session")
+def oracle_rsa_key_file():
+    """Path to the checked-in test RSA private key."""
+    return _TEST_KEY_FILE
+
+
+@dataclass
+class _StubResp:
+    """Minimal httpx.Response stand-in (no MagicMock attribute tree)."""
+
+    status_code: int = 200
+    payload: dict | None = None
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        pass
+
+
+class _FailingClient:
+    """Oracle client stub whose FHIR calls fail, without mock call tracking."""
+
+    async def get_patient(self, patient_id):
+        raise Exception("FHIR server error")
+
+
+@pytest.fixture(scope="session")
+def _oracle_client_pool():
+    """Single AsyncMock FHIR client, created on first use and shared by the session."""
+    return AsyncMock(spec=OracleHealthFHIRClient)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patched_get_client():
+    """Patch server.get_client once per module to return whatever the slot holds."""
+    holder = {"client": None}
+    with patch.object(oracle_server, "get_client", lambda: holder["client"]):
+        yield holder
 
 
 @pytest.fixture
+def oracle_mock_client(_patched_get_client, _oracle_client_pool):
+    """Pooled client mock, reset and installed as the MCP server's client."""
+    _oracle_client_pool.reset_mock(return_value=True, side_effect=True)
+    _patched_get_client["client"] = _oracle_client_pool
+    return _oracle_client_pool
+
+
+@pytest.fixture(scope="session")
 def sample_patient_data():
-    """Sample patient FHIR resource."""
-    return {
-        "resourceType": "Patient",
-        "id": "oracle.test456",
-        "identifier": [{"system": "urn:oid:2.16.840.1.113883", "value": "MRN789012"}],
-        "name": [
-            {
-                "use": "official",
-                "family": "Johnson",
-                "given": ["Jane", "M"],
-                "text": "Jane M Johnson",
-            }
-        ],
-        "gender": "female",
-        "birthDate": "1985-03-22",
-        "address": [
-            {
-                "use": "home",
-                "line": ["456 Oak Ave"],
-                "city": "Kansas City",
-                "state": "MO",
-                "postalCode": "64105",
-            }
-        ],
-    }
+    """Sample patient FHIR resource (read-only, shared by the session)."""
+    return MappingProxyType(
+        {
+            "resourceType": "Patient",
+            "id": "oracle.test456",
+            "identifier": [{"system": "urn:oid:2.16.840.1.113883", "value": "MRN789012"}],
+            "name": [
+                {
+                    "use": "official",
+                    "family": "Johnson",
+                    "given": ["Jane", "M"],
+                    "text": "Jane M Johnson",
+                }
+            ],
+            "gender": "female",
+            "birthDate": "1985-03-22",
+            "address": [
+                {
+                    "use": "home",
+                    "line": ["456 Oak Ave"],
+                    "city": "Kansas City",
+                    "state": "MO",
+                    "postalCode": "64105",
+                }
+            ],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_patient_obj(sample_patient_data):
+    """Validated Patient built once per session; tests do not mutate it."""
+    return Patient(**sample_patient_data)
 
 
 @pytest.fixture
@@ -127,27 +204,38 @@ def sample_condition_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_bundle_data(sample_patient_data):
-    """Sample FHIR Bundle for search results."""
-    return {
-        "resourceType": "Bundle",
-        "type": "searchset",
-        "total": 1,
-        "entry": [
-            {
-                "fullUrl": "https://test.cerner.com/fhir/Patient/oracle.test456",
-                "resource": sample_patient_data,
-            }
-        ],
-    }
+    """Sample FHIR Bundle for search results (read-only, shared by the session)."""
+    return MappingProxyType(
+        {
+            "resourceType": "Bundle",
+            "type": "searchset",
+            "total": 1,
+            "entry": [
+                {
+                    "fullUrl": "https://test.cerner.com/fhir/Patient/oracle.test456",
+                    "resource": sample_patient_data,
+                }
+            ],
+        }
+    )
+
+
+def _make_oracle_client(key_path) -> OracleHealthFHIRClient:
+    """Oracle Health client configured with the test key and auth URL."""
+    return OracleHealthFHIRClient(
+        base_url="https://test.cerner.com/fhir",
+        client_id="test_oracle_client",
+        private_key_path=str(key_path),
+        auth_url="https://test.cerner.com/oauth2/token",
+    )
 
 
 class TestOracleHealthFHIRClient:
     """Test cases for Oracle Health FHIR client."""
 
-    @pytest.mark.asyncio
-    async def test_client_initialization(self, mock_oracle_settings):
+    async def test_client_initialization(self):
         """Test Oracle Health FHIR client initializes correctly."""
         client = OracleHealthFHIRClient(
             base_url="https://test.cerner.com/fhir",
@@ -160,144 +248,64 @@ class TestOracleHealthFHIRClient:
 
         await client.close()
 
-    @pytest.mark.asyncio
-    @patch("src.python.mcp_servers.oracle_fhir.client.jwt.encode")
-    async def test_jwt_generation(self, mock_jwt_encode, mock_oracle_settings, tmp_path):
-        """Test JWT assertion generation."""
-        # Create a real RSA private key for testing
-        from cryptography.hazmat.primitives import serialization
-        from cryptography.hazmat.primitives.asymmetric import rsa
-
-        private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048,
-        )
-        pem = private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.TraditionalOpenSSL,
-            encryption_algorithm=serialization.NoEncryption(),
-        )
-
-        key_file = tmp_path / "test_oracle_key.pem"
-        key_file.write_bytes(pem)
-
-        mock_jwt_encode.return_value = "mock_jwt_token"
-
-        client = OracleHealthFHIRClient(
-            base_url="https://test.cerner.com/fhir",
-            client_id="test_oracle_client",
-            private_key_path=str(key_file),
-            auth_url="https://test.cerner.com/oauth2/token",
-        )
-
-        jwt_token = client._generate_jwt_assertion()
-
-        assert jwt_token == "mock_jwt_token"
-        mock_jwt_encode.assert_called_once()
-
-        # Verify JWT claims structure
-        call_args = mock_jwt_encode.call_args
-        claims = call_args[0][0]  # First positional argument
-        assert claims["iss"] == "test_oracle_client"
-        assert claims["sub"] == "test_oracle_client"
-        assert claims["aud"] == "https://test.cerner.com/oauth2/token"
-        assert "jti" in claims
-        assert "exp" in claims
-
-        await client.close()
-
-    @pytest.mark.asyncio
-    async def test_authentication_success(self, mock_oracle_settings, tmp_path):
-        """Test successful Oracle Health authentication."""
-        # Create a real RSA private key for testing
-        from cryptography.hazmat.primitives import serialization
-        from cryptography.hazmat.primitives.asymmetric import rsa
-
-        private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048,
-        )
-        pem = private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.TraditionalOpenSSL,
-            encryption_algorithm=serialization.NoEncryption(),
-        )
-
-        key_file = tmp_path / "test_oracle_key.pem"
-        key_file.write_bytes(pem)
-
-        client = OracleHealthFHIRClient(
-            base_url="https://test.cerner.com/fhir",
-            client_id="test_oracle_client",
-            private_key_path=str(key_file),
-            auth_url="https://test.cerner.com/oauth2/token",
-        )
-
-        # Mock HTTP response
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "access_token": "mock_oracle_access_token",
-            "token_type": "Bearer",
-            "expires_in": 3600,
-        }
-        mock_response.raise_for_status = Mock()
-
-        with patch.object(client.http_client, "post", return_value=mock_response):
-            with patch.object(client, "_generate_jwt_assertion", return_value="mock_jwt"):
-                token = await client.authenticate()
-
-        assert token == "mock_oracle_access_token"
-        assert client._access_token == "mock_oracle_access_token"
-        assert client._token_expiry is not None
-
-        await client.close()
-
-    @pytest.mark.asyncio
-    async def test_authentication_failure(self, mock_oracle_settings, tmp_path):
-        """Test Oracle Health authentication failure."""
-        # Create a real RSA private key for testing
-        from cryptography.hazmat.primitives import serialization
-        from cryptography.hazmat.primitives.asymmetric import rsa
-
-        private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048,
-        )
-        pem = private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.TraditionalOpenSSL,
-            encryption_algorithm=serialization.NoEncryption(),
-        )
+    @pytest.mark.parametrize("scenario", ["jwt", "auth_ok", "auth_fail"])
+    async def test_jwt_and_authentication(self, scenario, oracle_rsa_key_file):
+        """Test JWT assertion generation and authentication success/failure."""
+        client = _make_oracle_client(oracle_rsa_key_file)
+
+        if scenario == "jwt":
+            with patch(
+                "src.python.mcp_servers.oracle_fhir.client.jwt.encode",
+                return_value="mock_jwt_token",
+            ) as mock_jwt_encode:
+                jwt_token = client._generate_jwt_assertion()
+
+            assert jwt_token == "mock_jwt_token"
+            mock_jwt_encode.assert_called_once()
+
+            # Verify JWT claims structure
+            claims = mock_jwt_encode.call_args[0][0]  # First positional argument
+            assert claims["iss"] == "test_oracle_client"
+            assert claims["sub"] == "test_oracle_client"
+            assert claims["aud"] == "https://test.cerner.com/oauth2/token"
+            assert "jti" in claims
+            assert "exp" in claims
+
+        elif scenario == "auth_ok":
+            # Mock HTTP response
+            mock_response = _StubResp(
+                payload={
+                    "access_token": "mock_oracle_access_token",
+                    "token_type": "Bearer",
+                    "expires_in": 3600,
+                }
+            )
 
-        key_file = tmp_path / "test_oracle_key.pem"
-        key_file.write_bytes(pem)
+            with patch.object(client.http_client, "post", return_value=mock_response):
+                with patch.object(client, "_generate_jwt_assertion", return_value="mock_jwt"):
+                    token = await client.authenticate()
 
-        client = OracleHealthFHIRClient(
-            base_url="https://test.cerner.com/fhir",
-            client_id="test_oracle_client",
-            private_key_path=str(key_file),
-            auth_url="https://test.cerner.com/oauth2/token",
-        )
-
-        # Mock HTTP error
-        import httpx
+            assert token == "mock_oracle_access_token"
+            assert client._access_token == "mock_oracle_access_token"
+            assert client._token_expiry is not None
 
-        mock_error = httpx.HTTPStatusError(
-            "401 Unauthorized",
-            request=Mock(),
-            response=Mock(status_code=401),
-        )
+        else:
+            # Mock HTTP error
+            mock_error = httpx.HTTPStatusError(
+                "401 Unauthorized",
+                request=httpx.Request("POST", "https://test.cerner.com/oauth2/token"),
+                response=_StubResp(status_code=401),
+            )
 
-        with patch.object(client.http_client, "post", side_effect=mock_error):
-            with patch.object(client, "_generate_jwt_assertion", return_value="mock_jwt"):
-                with pytest.raises(AuthenticationError):
-                    await client.authenticate()
+            with patch.object(client.http_client, "post", side_effect=mock_error):
+                with patch.object(client, "_generate_jwt_assertion", return_value="mock_jwt"):
+                    with pytest.raises(AuthenticationError):
+                        await client.authenticate()
 
         await client.close()
 
     @pytest.mark.skip(reason="Mock response.json() issue - MCP server tests verify functionality")
-    @pytest.mark.asyncio
-    async def test_get_patient(self, mock_oracle_settings, sample_patient_data):
+    async def test_get_patient(self, sample_patient_data):
         """Test retrieving a patient by ID."""
         client = OracleHealthFHIRClient()
 
@@ -307,10 +315,7 @@ class TestOracleHealthFHIRClient:
 
         # Create mock response with proper json() method
         async def mock_make_request(method, endpoint, params=None, **kwargs):
-            mock_response = Mock()
-            mock_response.json.return_value = sample_patient_data
-            mock_response.raise_for_status = Mock()
-            return mock_response
+            return _StubResp(payload=sample_patient_data)
 
         with patch.object(client, "_make_request", side_effect=mock_make_request):
             patient = await client.get_patient("oracle.test456")
@@ -323,8 +328,7 @@ class TestOracleHealthFHIRClient:
         await client.close()
 
     @pytest.mark.skip(reason="Mock response.json() issue - MCP server tests verify functionality")
-    @pytest.mark.asyncio
-    async def test_search_patients(self, mock_oracle_settings, sample_bundle_data):
+    async def test_search_patients(self, sample_bundle_data):
         """Test patient search."""
         client = OracleHealthFHIRClient()
 
@@ -334,10 +338,7 @@ class TestOracleHealthFHIRClient:
 
         # Create mock response with proper json() method
         async def mock_make_request(method, endpoint, params=None, **kwargs):
-            mock_response = Mock()
-            mock_response.json.return_value = sample_bundle_data
-            mock_response.raise_for_status = Mock()
-            return mock_response
+            return _StubResp(payload=sample_bundle_data)
 
         with patch.object(client, "_make_request", side_effect=mock_make_request):
             patients = await client.search_patients(
@@ -356,16 +357,9 @@ class TestOracleHealthFHIRClient:
 class TestOracleHealthMCPServer:
     """Test cases for Oracle Health FHIR MCP server tools."""
 
-    @pytest.mark.asyncio
-    @patch("src.python.mcp_servers.oracle_fhir.server.get_client")
-    async def test_search_patients_tool(self, mock_get_client, sample_bundle_data):
+    async def test_search_patients_tool(self, oracle_mock_client, sample_patient_obj):
         """Test search_patients MCP tool."""
-        # Mock client
-        mock_client = AsyncMock()
-        mock_client.search_patients.return_value = [
-            Patient(**sample_bundle_data["entry"][0]["resource"])
-        ]
-        mock_get_client.return_value = mock_client
+        oracle_mock_client.search_patients.return_value = [sample_patient_obj]
 
         results = await search_patients(
             family="Johnson",
@@ -377,66 +371,49 @@ class TestOracleHealthMCPServer:
         assert results[0]["id"] == "oracle.test456"
         assert results[0]["name"][0]["family"] == "Johnson"
 
-    @pytest.mark.asyncio
-    @patch("src.python.mcp_servers.oracle_fhir.server.get_client")
-    async def test_get_patient_tool(self, mock_get_client, sample_patient_data):
+    async def test_get_patient_tool(self, oracle_mock_client, sample_patient_obj):
         """Test get_patient MCP tool."""
-        # Mock client
-        mock_client = AsyncMock()
-        mock_client.get_patient.return_value = Patient(**sample_patient_data)
-        mock_get_client.return_value = mock_client
+        oracle_mock_client.get_patient.return_value = sample_patient_obj
 
         result = await get_patient("oracle.test456")
 
         assert result["id"] == "oracle.test456"
         assert result["name"][0]["family"] == "Johnson"
         # birthDate is returned as date object by FHIR library
-        from datetime import date
-
         assert result["birthDate"] == date(1985, 3, 22) or str(result["birthDate"]) == "1985-03-22"
 
-    @pytest.mark.asyncio
-    @patch("src.python.mcp_servers.oracle_fhir.server.get_client")
-    async def test_search_patients_no_criteria(self, mock_get_client):
+    async def test_search_patients_no_criteria(self, oracle_mock_client):
         """Test search_patients with no search criteria."""
         # Mock client that returns empty list
-        mock_client = AsyncMock()
-        mock_client.search_patients.return_value = []
-        mock_get_client.return_value = mock_client
+        oracle_mock_client.search_patients.return_value = []
 
         results = await search_patients(limit=10)
 
         # Should return empty list when no criteria provided
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_get_patient_empty_id(self):
         """Test get_patient with empty ID."""
         with pytest.raises(ValueError, match="patient_id is required"):
             await get_patient("")
 
-    @pytest.mark.asyncio
-    async def test_search_patients_limit_validation(self):
+    async def test_search_patients_limit_validation(self, oracle_mock_client):
         """Test search_patients limit parameter validation."""
-        with patch("src.python.mcp_servers.oracle_fhir.server.get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.search_patients.return_value = []
-            mock_get_client.return_value = mock_client
+        oracle_mock_client.search_patients.return_value = []
 
-            # Test limit capping
-            await search_patients(family="Test", limit=100)
+        # Test limit capping
+        await search_patients(family="Test", limit=100)
 
-            # Verify client was called with capped limit
-            call_args = mock_client.search_patients.call_args
-            assert call_args.kwargs["limit"] == 50  # Should be capped at 50
+        # Verify client was called with capped limit
+        call_args = oracle_mock_client.search_patients.call_args
+        assert call_args.kwargs["limit"] == 50  # Should be capped at 50
 
 
 class TestOracleHealthFHIRIntegration:
     """Integration-style tests for Oracle Health FHIR operations."""
 
     @pytest.mark.skip(reason="Mock response.json() issue - MCP server tests verify functionality")
-    @pytest.mark.asyncio
-    async def test_patient_workflow(self, mock_oracle_settings, sample_patient_data):
+    async def test_patient_workflow(self, sample_patient_data):
         """Test complete patient data retrieval workflow."""
         client = OracleHealthFHIRClient()
 
@@ -446,10 +423,7 @@ class TestOracleHealthFHIRIntegration:
 
         # Create mock response with proper json() method
         async def mock_make_request(method, endpoint, params=None, **kwargs):
-            mock_response = Mock()
-            mock_response.json.return_value = sample_patient_data
-            mock_response.raise_for_status = Mock()
-            return mock_response
+            return _StubResp(payload=sample_patient_data)
 
         with patch.object(client, "_make_request", side_effect=mock_make_request):
             # Step 1: Get patient
@@ -466,8 +440,7 @@ class TestOracleHealthFHIRIntegration:
 class TestErrorHandling:
     """Test error handling and edge cases."""
 
-    @pytest.mark.asyncio
-    async def test_missing_private_key(self, mock_oracle_settings):
+    async def test_missing_private_key(self):
         """Test error when private key file is missing."""
         client = OracleHealthFHIRClient(
             base_url="https://test.cerner.com/fhir",
@@ -480,14 +453,10 @@ class TestErrorHandling:
 
         await client.close()
 
-    @pytest.mark.asyncio
-    @patch("src.python.mcp_servers.oracle_fhir.server.get_client")
-    async def test_mcp_tool_error_handling(self, mock_get_client):
+    async def test_mcp_tool_error_handling(self, _patched_get_client):
         """Test MCP tool error handling."""
-        # Mock client that raises error
-        mock_client = AsyncMock()
-        mock_client.get_patient.side_effect = Exception("FHIR server error")
-        mock_get_client.return_value = mock_client
+        # Plain stub client that raises error; no call assertions needed
+        _patched_get_client["client"] = _FailingClient()
 
         with pytest.raises(Exception, match="FHIR server error"):
             await get_patient("oracle.test456")
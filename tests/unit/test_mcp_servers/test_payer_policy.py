@@ -4,36 +4,24 @@ Unit tests for Payer Policy MCP Server and PolicyStore.
 
 import json
 import sqlite3
-import tempfile
-from pathlib import Path
+import threading
+from functools import partial
+from types import MappingProxyType
 
 import pytest
 
 from src.python.mcp_servers.payer_policy.policy_store import PayerPolicy, PolicyStore
 from src.python.mcp_servers.payer_policy.server import (
     check_auth_requirements,
+    evaluate_policy,
     get_documentation_requirements,
     validate_medical_necessity,
 )
 
-# ============================================================================
-# Fixtures
-# ============================================================================
-
-
-@pytest.fixture
-def temp_db():
-    """Create temporary SQLite database."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
-    yield db_path
-    Path(db_path).unlink(missing_ok=True)
-
-
-@pytest.fixture
-def sample_policies():
-    """Sample policy data for testing."""
-    return [
+# Sample policy data shared by every test; read-only views so no test can mutate it
+_SAMPLE_POLICIES = tuple(
+    MappingProxyType(policy)
+    for policy in (
         {
             "payer": "Medicare",
             "cpt_code": "99214",
@@ -97,27 +85,70 @@ def sample_policies():
             "effective_date": "2024-01-01",
             "notes": "Major surgery",
         },
-    ]
+    )
+)
 
 
-@pytest.fixture
-def sample_policies_json(tmp_path, sample_policies):
-    """Create temporary JSON file with sample policies."""
-    json_file = tmp_path / "test_policies.json"
-    data = {"policies": sample_policies}
-    with open(json_file, "w") as f:
-        json.dump(data, f, indent=2)
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+def temp_db():
+    """In-memory SQLite database path (no filesystem I/O)."""
+    return ":memory:"
+
+
+@pytest.fixture(scope="session")
+def sample_policies():
+    """Sample policy data for testing."""
+    return _SAMPLE_POLICIES
+
+
+@pytest.fixture(scope="session")
+def sample_policies_json(tmp_path_factory, sample_policies):
+    """Write the sample policies to a JSON file once per session."""
+    json_file = tmp_path_factory.mktemp("policies") / "test_policies.json"
+    data = {"policies": [dict(policy) for policy in sample_policies]}
+    # Compact output; the file is only read by PolicyStore
+    json_file.write_text(json.dumps(data, separators=(",", ":")))
     return str(json_file)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def policy_store(temp_db, sample_policies_json):
-    """Create PolicyStore with sample data."""
+    """PolicyStore with sample data, loaded once; tests must not modify it."""
     store = PolicyStore(db_path=temp_db)
     store.load_policies_from_json(sample_policies_json)
     return store
 
 
+@pytest.fixture
+def fresh_policy_store():
+    """Empty PolicyStore on its own database, for tests that write to the store."""
+    return PolicyStore(db_path=":memory:")
+
+
+@pytest.fixture
+def policy_lookups(fresh_policy_store, sample_policies_json, monkeypatch):
+    """Serve the MCP tools from a loaded fresh store; returns the get_policy calls made."""
+    fresh_policy_store.load_policies_from_json(sample_policies_json)
+    monkeypatch.setattr(
+        "src.python.mcp_servers.payer_policy.server.get_policy_store",
+        lambda: fresh_policy_store,
+    )
+    lookups: list[dict[str, str]] = []
+    real_get_policy = fresh_policy_store.get_policy
+
+    def counting_get_policy(**kwargs):
+        lookups.append(kwargs)
+        return real_get_policy(**kwargs)
+
+    monkeypatch.setattr(fresh_policy_store, "get_policy", counting_get_policy)
+    return lookups
+
+
 # ============================================================================
 # PolicyStore Tests
 # ============================================================================
@@ -125,17 +156,14 @@ def policy_store(temp_db, sample_policies_json):
 
 def test_policy_store_initialization(temp_db):
     """Test PolicyStore initializes database correctly."""
-    PolicyStore(db_path=temp_db)
-
-    # Check database exists
-    assert Path(temp_db).exists()
+    store = PolicyStore(db_path=temp_db)
 
     # Check tables exist
-    conn = sqlite3.connect(temp_db)
-    cursor = conn.cursor()
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='policies'")
-    assert cursor.fetchone() is not None
-    conn.close()
+    with store._get_connection() as conn:
+        cursor = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='policies'"
+        )
+        assert cursor.fetchone() is not None
 
 
 def test_load_policies_from_json(policy_store):
@@ -144,9 +172,28 @@ def test_load_policies_from_json(policy_store):
     assert count == 3
 
 
-def test_load_policies_invalid_json(temp_db, tmp_path):
+def test_bulk_load_uses_executemany(sample_policies_json, monkeypatch):
+    """Test policies are inserted with a single executemany call."""
+    calls = []
+
+    class RecordingConnection(sqlite3.Connection):
+        def executemany(self, sql, rows):
+            rows = list(rows)
+            calls.append(rows)
+            return super().executemany(sql, rows)
+
+    monkeypatch.setattr(sqlite3, "connect", partial(sqlite3.connect, factory=RecordingConnection))
+
+    store = PolicyStore(db_path=":memory:")
+
+    assert store.load_policies_from_json(sample_policies_json) == 3
+    assert len(calls) == 1
+    assert len(calls[0]) == 3
+
+
+def test_load_policies_invalid_json(fresh_policy_store, tmp_path):
     """Test loading from invalid JSON file."""
-    store = PolicyStore(db_path=temp_db)
+    store = fresh_policy_store
 
     # Non-existent file
     with pytest.raises(FileNotFoundError):
@@ -181,6 +228,73 @@ def test_get_policy_not_found(policy_store):
     assert policy is None
 
 
+def test_get_policy_served_from_index(fresh_policy_store, sample_policies_json):
+    """Test lookups hit the in-memory index, which is rebuilt after a reload."""
+    store = fresh_policy_store
+    store.load_policies_from_json(sample_policies_json)
+
+    first = store.get_policy("Aetna", "27447")
+    assert first is not None
+    assert store.get_policy("Aetna", "27447") is first
+    assert set(store._index) == {
+        ("Medicare", "99214"),
+        ("UnitedHealthcare", "70553"),
+        ("Aetna", "27447"),
+    }
+
+    store.load_policies_from_json(sample_policies_json)
+    assert store._index_version != store.version
+    assert store.get_policy("Aetna", "27447") == first
+
+
+def test_policy_index_rebuild_reuses_unchanged_rows(
+    fresh_policy_store, sample_policies, sample_policies_json, tmp_path
+):
+    """Test a rebuild only re-parses rows that were written since the last build."""
+    store = fresh_policy_store
+    store.load_policies_from_json(sample_policies_json)
+    aetna = store.get_policy("Aetna", "27447")
+    medicare = store.get_policy("Medicare", "99214")
+
+    update = tmp_path / "update.json"
+    medicare_update = {**sample_policies[0], "notes": "Updated"}
+    update.write_text(json.dumps({"policies": [medicare_update]}))
+    store.load_policies_from_json(str(update))
+
+    assert store.get_policy("Aetna", "27447") is aetna
+    assert store.get_policy("Medicare", "99214") is not medicare
+    assert store.get_policy("Medicare", "99214").notes == "Updated"
+
+
+def test_get_policy_sees_writes_from_other_stores(tmp_path, sample_policies_json):
+    """Test the index is rebuilt after another store writes to the same database."""
+    db_path = str(tmp_path / "policies.db")
+    reader = PolicyStore(db_path=db_path)
+    assert reader.get_policy("Medicare", "99214") is None
+
+    PolicyStore(db_path=db_path).load_policies_from_json(sample_policies_json)
+
+    policy = reader.get_policy("Medicare", "99214")
+    assert policy is not None
+    assert policy.procedure_name == "Office visit, established patient"
+
+
+def test_memory_store_serializes_connection_use(fresh_policy_store):
+    """Test other threads wait while the shared in-memory connection is in use."""
+    store = fresh_policy_store
+    counts = []
+
+    with store._get_connection(row_factory=True) as conn:
+        worker = threading.Thread(target=lambda: counts.append(store.count_policies()))
+        worker.start()
+        worker.join(timeout=0.2)
+        assert worker.is_alive()  # blocked on the connection lock
+        assert conn.row_factory is sqlite3.Row  # not flipped by the other thread
+
+    worker.join()
+    assert counts == [0]
+
+
 def test_get_policy_with_prior_auth_criteria(policy_store):
     """Test retrieving policy with prior auth criteria."""
     policy = policy_store.get_policy("UnitedHealthcare", "70553")
@@ -326,6 +440,31 @@ async def test_get_documentation_requirements_found(policy_store, monkeypatch):
     assert "error" not in result
 
 
+@pytest.mark.asyncio
+async def test_tool_results_do_not_share_policy_lists(policy_store, monkeypatch):
+    """Test mutating a tool result does not leak into later results."""
+    monkeypatch.setattr(
+        "src.python.mcp_servers.payer_policy.server.get_policy_store",
+        lambda: policy_store,
+    )
+
+    first = await get_documentation_requirements("Medicare", "99214")
+    first["documentation_requirements"].append("INJECTED")
+    first["medical_necessity_criteria"].append("INJECTED")
+    validation = await validate_medical_necessity("Medicare", "99214", {})
+    validation["all_criteria"].append("INJECTED")
+    auth = await check_auth_requirements("UnitedHealthcare", "70553")
+    auth["prior_auth_criteria"].append("INJECTED")
+
+    second = await get_documentation_requirements("Medicare", "99214")
+    assert "INJECTED" not in second["documentation_requirements"]
+    assert "INJECTED" not in second["medical_necessity_criteria"]
+    validation = await validate_medical_necessity("Medicare", "99214", {})
+    assert "INJECTED" not in validation["all_criteria"]
+    auth = await check_auth_requirements("UnitedHealthcare", "70553")
+    assert "INJECTED" not in auth["prior_auth_criteria"]
+
+
 @pytest.mark.asyncio
 async def test_get_documentation_requirements_not_found(policy_store, monkeypatch):
     """Test get_documentation_requirements with non-existent policy."""
@@ -432,6 +571,73 @@ async def test_validate_medical_necessity_not_found(policy_store, monkeypatch):
     assert "error" in result
 
 
+@pytest.mark.asyncio
+async def test_policy_lookup_sees_store_changes(tmp_path, sample_policies_json, monkeypatch):
+    """Test tool lookups are not cached past a write, including earlier misses."""
+    db_path = str(tmp_path / "policies.db")
+    store = PolicyStore(db_path=db_path)
+    monkeypatch.setattr(
+        "src.python.mcp_servers.payer_policy.server.get_policy_store",
+        lambda: store,
+    )
+
+    missing = await check_auth_requirements("Aetna", "27447")
+    assert "error" in missing
+
+    PolicyStore(db_path=db_path).load_policies_from_json(sample_policies_json)
+
+    result = await check_auth_requirements("Aetna", "27447")
+    assert "error" not in result
+    assert result["requires_prior_auth"] is True
+
+
+@pytest.mark.asyncio
+async def test_evaluate_policy_matches_individual_tools(policy_lookups):
+    """Test evaluate_policy returns the three tool payloads from a single lookup."""
+    lookups = policy_lookups
+    clinical_data = {"symptoms": ["severe pain limiting daily activities"]}
+
+    result = await evaluate_policy("Aetna", "27447", clinical_data)
+
+    assert len(lookups) == 1
+    assert "error" not in result
+    assert result["auth"] == await check_auth_requirements("Aetna", "27447")
+    assert result["documentation"] == await get_documentation_requirements("Aetna", "27447")
+    assert result["validation"] == await validate_medical_necessity("Aetna", "27447", clinical_data)
+
+    without_data = await evaluate_policy("Aetna", "27447")
+    assert without_data["validation"] is None
+
+    missing = await evaluate_policy("Medicare", "99999", {})
+    assert "error" in missing
+    assert missing["auth"]["requires_prior_auth"] is None
+    assert missing["validation"]["validation_status"] == "insufficient_data"
+
+
+@pytest.mark.asyncio
+async def test_policy_lookups_memoized_until_store_changes(
+    policy_lookups, fresh_policy_store, sample_policies_json
+):
+    """Test repeated tool calls for one pair hit the store once until it is written."""
+    lookups = policy_lookups
+
+    await check_auth_requirements("Medicare", "99214")
+    await get_documentation_requirements("Medicare", "99214")
+    await validate_medical_necessity("Medicare", "99214", {})
+    await check_auth_requirements("Medicare", "99999")
+    await check_auth_requirements("Medicare", "99999")
+
+    assert lookups == [
+        {"payer": "Medicare", "cpt_code": "99214"},
+        {"payer": "Medicare", "cpt_code": "99999"},
+    ]
+
+    fresh_policy_store.load_policies_from_json(sample_policies_json)
+    await check_auth_requirements("Medicare", "99214")
+
+    assert len(lookups) == 3
+
+
 @pytest.mark.asyncio
 async def test_mcp_tool_error_handling(monkeypatch):
     """Test MCP tool error handling when store fails."""
@@ -459,6 +665,12 @@ async def test_mcp_tool_error_handling(monkeypatch):
     assert "error" in result
     assert result["validation_status"] == "insufficient_data"
 
+    # Test evaluate_policy error
+    result = await evaluate_policy("Medicare", "99214", {})
+    assert "error" in result
+    assert result["auth"]["requires_prior_auth"] is None
+    assert result["validation"]["validation_status"] == "insufficient_data"
+
 
 # ============================================================================
 # Integration Tests
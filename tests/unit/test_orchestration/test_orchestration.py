@@ -8,10 +8,14 @@ Tests cover:
 - ClinicalPipelineCoordinator end-to-end flow
 """
 
-from unittest.mock import MagicMock, patch
+import itertools
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.python.orchestration import coordinator as coordinator_module
 from src.python.orchestration.coordinator import ClinicalPipelineCoordinator
 from src.python.orchestration.state import (
     PhaseResult,
@@ -19,12 +23,29 @@ from src.python.orchestration.state import (
     WorkflowState,
     WorkflowStatus,
 )
-from src.python.orchestration.workflow import execute_phase, run_with_retry
+from src.python.orchestration.workflow import (
+    aexecute_phase,
+    arun_with_retry,
+    execute_phase,
+    execute_phase_batch,
+    run_with_retry,
+)
+from src.python.utils import serialization
+from src.python.utils.config import settings
 
 # ============================================================================
 # Fixtures
 # ============================================================================
 
+# Prebuilt Messages API response; plain attributes avoid MagicMock's dynamic
+# attribute machinery on every agent call.
+_RESP = SimpleNamespace(
+    content=[SimpleNamespace(text='{"result": "test output"}')],
+    model="claude-opus-4-6",
+    usage=SimpleNamespace(input_tokens=100, output_tokens=50),
+    stop_reason="end_turn",
+)
+
 
 def _make_agent_result(content: str = '{"result": "ok"}', agent: str = "test") -> dict:
     """Create a standard agent result dict."""
@@ -42,17 +63,49 @@ def _make_error_result(agent: str = "test", error: str = "Request timed out") ->
     return {"content": "", "agent": agent, "error": error}
 
 
+class _FakeBatches:
+    """In-memory client.messages.batches that answers every request with _RESP."""
+
+    def __init__(self, errored_phase: str | None = None, stuck: bool = False):
+        self.submitted: list[list[dict]] = []
+        self.cancelled: list[str] = []
+        self.errored_phase = errored_phase
+        self.stuck = stuck
+
+    def create(self, requests):
+        self.submitted.append(list(requests))
+        return SimpleNamespace(id=str(len(self.submitted) - 1), processing_status="in_progress")
+
+    def retrieve(self, batch_id):
+        status = "in_progress" if self.stuck else "ended"
+        return SimpleNamespace(id=batch_id, processing_status=status)
+
+    def cancel(self, batch_id):
+        self.cancelled.append(batch_id)
+        return SimpleNamespace(id=batch_id, processing_status="canceling")
+
+    def results(self, batch_id):
+        requests = self.submitted[int(batch_id)]
+        errored = {
+            request["custom_id"]
+            for request in requests[:1]
+            if self.errored_phase and request["custom_id"].endswith(f"-{self.errored_phase}")
+        }
+        # Batch results are not returned in submission order
+        for request in reversed(requests):
+            if request["custom_id"] in errored:
+                error = SimpleNamespace(error=SimpleNamespace(message="Overloaded"))
+                result = SimpleNamespace(type="errored", error=error)
+            else:
+                result = SimpleNamespace(type="succeeded", message=_RESP)
+            yield SimpleNamespace(custom_id=request["custom_id"], result=result)
+
+
 @pytest.fixture
 def mock_anthropic_client():
     """Mock Anthropic client with standard response."""
     client = MagicMock()
-    mock_response = MagicMock()
-    mock_response.content = [MagicMock(text='{"result": "test output"}')]
-    mock_response.model = "claude-opus-4-6"
-    mock_response.usage.input_tokens = 100
-    mock_response.usage.output_tokens = 50
-    mock_response.stop_reason = "end_turn"
-    client.messages.create.return_value = mock_response
+    client.messages.create.return_value = _RESP
     return client
 
 
@@ -78,6 +131,7 @@ def test_phase_result_mark_running():
 
     assert phase.status == PhaseStatus.RUNNING
     assert phase.started_at is not None
+    assert phase.duration_seconds is None
 
 
 def test_phase_result_mark_completed():
@@ -129,6 +183,22 @@ def test_workflow_state_initial():
     assert all(p.status == PhaseStatus.PENDING for p in state.all_phases)
 
 
+def test_workflow_state_all_phases_tuple():
+    """Test all_phases is built once, in pipeline order, and indexable."""
+    state = WorkflowState()
+
+    assert state.all_phases is state.all_phases
+    assert state.all_phases[0] is state.documentation
+    assert state.all_phases[-1] is state.quality_assurance
+    assert [p.phase_name for p in state.all_phases] == [
+        "documentation",
+        "coding",
+        "compliance",
+        "prior_auth",
+        "quality_assurance",
+    ]
+
+
 def test_workflow_state_start_and_complete():
     """Test workflow start and complete lifecycle."""
     state = WorkflowState()
@@ -181,6 +251,38 @@ def test_workflow_state_completed_and_failed_phases():
     assert state.failed_phases[0].phase_name == "coding"
 
 
+def test_workflow_state_rerun_phase_counted_once():
+    """Test a phase that fails and then completes is only counted as completed."""
+    state = WorkflowState()
+    state.coding.mark_running()
+    state.coding.mark_completed("code", {"input_tokens": 200, "output_tokens": 100})
+    state.coding.mark_failed("qa rejected")
+    state.coding.mark_running()
+    state.coding.mark_completed("code v2", {"input_tokens": 300, "output_tokens": 120})
+
+    assert [p.phase_name for p in state.completed_phases] == ["coding"]
+    assert state.failed_phases == ()
+    assert state.total_tokens == {"input_tokens": 300, "output_tokens": 120}
+
+
+def test_workflow_state_reassigned_phase_tracked():
+    """Test a PhaseResult assigned after construction feeds the aggregates."""
+    state = WorkflowState()
+    state.documentation.mark_running()
+    state.documentation.mark_completed("doc", {"input_tokens": 100, "output_tokens": 50})
+
+    state.documentation = PhaseResult(phase_name="documentation", agent_name="other")
+    assert state.completed_phases == ()
+    assert state.total_tokens == {"input_tokens": 0, "output_tokens": 0}
+    assert state.all_phases[0] is state.documentation
+
+    state.documentation.mark_running()
+    state.documentation.mark_completed("doc", {"input_tokens": 40, "output_tokens": 10})
+
+    assert state.completed_phases == (state.documentation,)
+    assert state.total_tokens == {"input_tokens": 40, "output_tokens": 10}
+
+
 def test_workflow_state_to_summary():
     """Test summary generation."""
     state = WorkflowState(workflow_id="test-123")
@@ -198,6 +300,25 @@ def test_workflow_state_to_summary():
     assert summary["phases"]["coding"]["status"] == "pending"
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_workflow_state_to_json(use_orjson, monkeypatch):
+    """Test JSON summary is identical with and without orjson installed."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    state = WorkflowState(workflow_id="test-123")
+    state.start()
+    state.documentation.mark_running()
+    state.documentation.mark_completed("ok", {"input_tokens": 50, "output_tokens": 25})
+    state.complete()
+
+    payload = state.to_json()
+
+    assert " " not in payload
+    assert json.loads(payload) == json.loads(json.dumps(state.to_summary()))
+
+
 # ============================================================================
 # run_with_retry Tests
 # ============================================================================
@@ -251,12 +372,49 @@ def test_retry_exponential_backoff(mock_sleep):
     """Test delay doubles each retry attempt."""
     fn = MagicMock(return_value=_make_error_result())
 
-    run_with_retry(fn, max_retries=3, base_delay=1.0)
+    run_with_retry(fn, max_retries=3, base_delay=1.0, jitter=False)
 
     delays = [call.args[0] for call in mock_sleep.call_args_list]
     assert delays == [1.0, 2.0, 4.0]
 
 
+@patch("src.python.orchestration.workflow.asyncio.sleep", new_callable=AsyncMock)
+async def test_retry_async_exponential_backoff(mock_sleep):
+    """Test async retry awaits asyncio.sleep with the same doubling schedule."""
+    fn = AsyncMock(return_value=_make_error_result())
+
+    result = await arun_with_retry(fn, max_retries=3, base_delay=1.0, jitter=False)
+
+    assert "error" in result
+    assert fn.await_count == 4
+    delays = [call.args[0] for call in mock_sleep.await_args_list]
+    assert delays == [1.0, 2.0, 4.0]
+
+
+@patch("src.python.orchestration.workflow.time.sleep")
+def test_retry_backoff_capped_and_jittered(mock_sleep):
+    """Test delays are capped at max_delay and jittered within [0.5, 1.5) of the cap."""
+    fn = MagicMock(return_value=_make_error_result())
+
+    run_with_retry(fn, max_retries=5, base_delay=1.0, max_delay=4.0)
+
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    caps = [1.0, 2.0, 4.0, 4.0, 4.0]
+    assert all(0.5 * cap <= delay < 1.5 * cap for delay, cap in zip(delays, caps, strict=True))
+
+
+@patch("src.python.orchestration.workflow.asyncio.sleep", new_callable=AsyncMock)
+async def test_retry_async_sync_callable(mock_sleep):
+    """Test async retry runs sync callables off the loop and backs off with asyncio.sleep."""
+    fn = MagicMock(side_effect=[_make_error_result(error="timeout"), _make_agent_result()])
+
+    result = await arun_with_retry(fn, "arg1", max_retries=2, base_delay=0.1)
+
+    assert "error" not in result
+    assert fn.call_count == 2
+    assert mock_sleep.await_count == 1
+
+
 # ============================================================================
 # execute_phase Tests
 # ============================================================================
@@ -305,6 +463,87 @@ def test_execute_phase_with_retry(mock_sleep):
     assert fn.call_count == 2
 
 
+async def test_aexecute_phase_success():
+    """Test async phase execution updates phase state."""
+    phase = PhaseResult(phase_name="test", agent_name="test_agent")
+    fn = AsyncMock(return_value=_make_agent_result(content="async output"))
+
+    result = await aexecute_phase(phase, fn, "input", use_retry=False)
+
+    assert phase.status == PhaseStatus.COMPLETED
+    assert phase.content == "async output"
+    assert "error" not in result
+    fn.assert_awaited_once_with("input")
+
+
+async def test_aexecute_phase_awaits_async_callables():
+    """Test callable objects with an async __call__ and awaitable returns are awaited."""
+
+    class AsyncAgentCall:
+        async def __call__(self, note):
+            return _make_agent_result(content=f"called {note}")
+
+    phase = PhaseResult(phase_name="test", agent_name="test_agent")
+    result = await aexecute_phase(phase, AsyncAgentCall(), "input", use_retry=False)
+
+    assert result["content"] == "called input"
+    assert phase.status == PhaseStatus.COMPLETED
+
+    async def agent_call(note):
+        return _make_agent_result(content=f"wrapped {note}")
+
+    phase = PhaseResult(phase_name="test", agent_name="test_agent")
+    result = await aexecute_phase(phase, lambda note: agent_call(note), "input", use_retry=False)
+
+    assert result["content"] == "wrapped input"
+    assert phase.status == PhaseStatus.COMPLETED
+
+
+@patch("src.python.orchestration.workflow.time.sleep")
+def test_execute_phase_batch_demultiplexes_results(mock_sleep, mock_anthropic_client):
+    """Test batch results are matched back to their phases by custom_id."""
+    mock_anthropic_client.messages.batches = _FakeBatches(errored_phase="first")
+    coordinator = ClinicalPipelineCoordinator(client=mock_anthropic_client)
+    agent = coordinator.doc_agent
+    phases = [
+        PhaseResult(phase_name=name, agent_name=agent.agent_name) for name in ("first", "second")
+    ]
+
+    results = execute_phase_batch(
+        mock_anthropic_client,
+        [(phase, agent, agent.batch_request(f"wf-{phase.phase_name}", "Note")) for phase in phases],
+        poll_interval=0.5,
+    )
+
+    assert results[0]["error"] == "API error: Overloaded"
+    assert results[1]["content"] == '{"result": "test output"}'
+    assert phases[0].status == PhaseStatus.FAILED
+    assert phases[1].status == PhaseStatus.COMPLETED
+    assert phases[1].usage == {"input_tokens": 100, "output_tokens": 50}
+    mock_sleep.assert_called_once_with(0.5)
+    mock_anthropic_client.messages.create.assert_not_called()
+
+
+@patch("src.python.orchestration.workflow.time.sleep")
+def test_execute_phase_batch_cancels_stuck_batch(mock_sleep, mock_anthropic_client):
+    """Test a batch that never ends is cancelled after max_wait and its phases fail."""
+    batches = mock_anthropic_client.messages.batches = _FakeBatches(stuck=True)
+    coordinator = ClinicalPipelineCoordinator(client=mock_anthropic_client)
+    agent = coordinator.doc_agent
+    phase = PhaseResult(phase_name="documentation", agent_name=agent.agent_name)
+
+    with pytest.raises(TimeoutError):
+        execute_phase_batch(
+            mock_anthropic_client,
+            [(phase, agent, agent.batch_request("wf-documentation", "Note"))],
+            max_wait=0,
+        )
+
+    assert batches.cancelled == ["0"]
+    assert phase.status == PhaseStatus.FAILED
+    mock_sleep.assert_not_called()
+
+
 # ============================================================================
 # ClinicalPipelineCoordinator Tests
 # ============================================================================
@@ -321,6 +560,47 @@ def test_coordinator_initialization(mock_anthropic_client):
     assert coordinator.qa_agent is not None
 
 
+async def test_coordinator_owns_shared_client_pool():
+    """Test a coordinator without injected clients shares one pooled client per mode."""
+    async with ClinicalPipelineCoordinator() as coordinator:
+        agents = (
+            coordinator.doc_agent,
+            coordinator.coding_agent,
+            coordinator.compliance_agent,
+            coordinator.prior_auth_agent,
+            coordinator.qa_agent,
+        )
+        assert len({id(agent.client) for agent in agents}) == 1
+        assert coordinator.doc_agent.async_client is None  # created on first async use
+
+        coordinator._ensure_async_client()
+        assert len({id(agent.async_client) for agent in agents}) == 1
+        async_client = coordinator.doc_agent.async_client
+        assert async_client is not None
+
+    assert coordinator.doc_agent.client.is_closed()
+    assert async_client.is_closed()
+
+
+def test_coordinator_sync_use_opens_no_async_pool():
+    """Test sync-only use of an owned-pool coordinator leaves nothing open after close()."""
+    coordinator = ClinicalPipelineCoordinator()
+    coordinator.close()
+
+    assert coordinator._owned_async_client is None
+    assert coordinator.doc_agent.async_client is None
+
+
+def test_coordinator_owned_client_without_h2(monkeypatch):
+    """Test an owned client pool falls back to HTTP/1.1 when h2 is not installed."""
+    monkeypatch.setattr(coordinator_module, "_HTTP2_AVAILABLE", False)
+
+    coordinator = ClinicalPipelineCoordinator()
+    coordinator.close()
+
+    assert coordinator.doc_agent.client.is_closed()
+
+
 def test_coordinator_full_pipeline(mock_anthropic_client):
     """Test full pipeline execution with all phases."""
     coordinator = ClinicalPipelineCoordinator(client=mock_anthropic_client)
@@ -392,16 +672,9 @@ def test_coordinator_coding_phase_failure(mock_anthropic_client):
     import anthropic as anthropic_mod
 
     # First call succeeds (documentation), second fails (coding)
-    mock_response = MagicMock()
-    mock_response.content = [MagicMock(text='{"result": "ok"}')]
-    mock_response.model = "claude-opus-4-6"
-    mock_response.usage.input_tokens = 100
-    mock_response.usage.output_tokens = 50
-    mock_response.stop_reason = "end_turn"
-
     # Need enough timeout errors for initial attempt + retries (default max_retries=3)
     mock_anthropic_client.messages.create.side_effect = [
-        mock_response,
+        _RESP,
         anthropic_mod.APITimeoutError(request=MagicMock()),
         anthropic_mod.APITimeoutError(request=MagicMock()),
         anthropic_mod.APITimeoutError(request=MagicMock()),
@@ -418,6 +691,30 @@ def test_coordinator_coding_phase_failure(mock_anthropic_client):
     assert state.compliance.status == PhaseStatus.PENDING
 
 
+@patch("src.python.orchestration.workflow.time.sleep")
+def test_coordinator_coding_phase_retries_exhausted(mock_sleep, mock_anthropic_client, monkeypatch):
+    """Test every coding retry is attempted before the pipeline stops, whatever max_retries is."""
+    import anthropic as anthropic_mod
+
+    # First call succeeds (documentation); every coding attempt times out
+    err = anthropic_mod.APITimeoutError(request=MagicMock())
+    mock_anthropic_client.messages.create.side_effect = itertools.chain(
+        [_RESP], itertools.repeat(err)
+    )
+
+    monkeypatch.setattr(settings, "agent_max_retries", 5)
+    coordinator = ClinicalPipelineCoordinator(client=mock_anthropic_client)
+
+    state = coordinator.process_note(note="Test note.")
+
+    assert state.status == WorkflowStatus.FAILED
+    assert state.documentation.status == PhaseStatus.COMPLETED
+    assert state.coding.status == PhaseStatus.FAILED
+    assert state.compliance.status == PhaseStatus.PENDING
+    assert mock_anthropic_client.messages.create.call_count == 1 + 6
+    assert mock_sleep.call_count == 5
+
+
 def test_coordinator_context_passed(mock_anthropic_client):
     """Test that context is passed through to agents."""
     coordinator = ClinicalPipelineCoordinator(client=mock_anthropic_client)
@@ -451,3 +748,93 @@ def test_coordinator_summary_output(mock_anthropic_client):
     assert summary["total_tokens"]["input_tokens"] > 0
     assert summary["total_tokens"]["output_tokens"] > 0
     assert len(summary["phases"]) == 5
+
+
+async def test_coordinator_async_full_pipeline(mock_anthropic_client):
+    """Test concurrent pipeline completes all phases with the same API calls."""
+    coordinator = ClinicalPipelineCoordinator(client=mock_anthropic_client)
+
+    state = await coordinator.aprocess_note(
+        note="Patient presents with chest pain.",
+        patient_id="P001",
+        payer="Medicare",
+        procedure="99214",
+    )
+
+    assert state.status == WorkflowStatus.COMPLETED
+    assert all(p.status == PhaseStatus.COMPLETED for p in state.all_phases)
+    assert mock_anthropic_client.messages.create.call_count == 5
+
+
+async def test_coordinator_async_client(mock_anthropic_client):
+    """Test aprocess_note awaits the AsyncAnthropic client when provided."""
+    async_client = MagicMock()
+    async_client.messages.create = AsyncMock(return_value=_RESP)
+    coordinator = ClinicalPipelineCoordinator(
+        client=mock_anthropic_client, async_client=async_client
+    )
+
+    state = await coordinator.aprocess_note(note="Test note.", skip_prior_auth=True)
+
+    assert state.status == WorkflowStatus.COMPLETED
+    assert state.prior_auth.status == PhaseStatus.SKIPPED
+    assert async_client.messages.create.await_count == 4
+    mock_anthropic_client.messages.create.assert_not_called()
+
+
+@patch("src.python.orchestration.workflow.time.sleep")
+def test_coordinator_process_batch(mock_sleep, mock_anthropic_client):
+    """Test bulk processing submits one batch per stage across all notes."""
+    batches = mock_anthropic_client.messages.batches = _FakeBatches()
+    coordinator = ClinicalPipelineCoordinator(client=mock_anthropic_client)
+
+    states = coordinator.process_batch(
+        [
+            {
+                "note": "Chest pain.",
+                "patient_id": "P001",
+                "payer": "Medicare",
+                "procedure": "99214",
+            },
+            {"note": "Headache.", "skip_prior_auth": True},
+        ]
+    )
+
+    assert [state.status for state in states] == [WorkflowStatus.COMPLETED] * 2
+    assert states[0].prior_auth.status == PhaseStatus.COMPLETED
+    assert states[1].prior_auth.status == PhaseStatus.SKIPPED
+    assert [len(requests) for requests in batches.submitted] == [2, 2, 3, 2]
+    assert batches.submitted[0][0]["custom_id"] == f"{states[0].workflow_id}-documentation"
+    assert "P001" in batches.submitted[0][0]["params"]["messages"][0]["content"]
+    assert states[0].total_tokens["input_tokens"] == 500
+    mock_anthropic_client.messages.create.assert_not_called()
+
+
+@patch("src.python.orchestration.workflow.time.sleep")
+def test_coordinator_process_batch_stage_failure(mock_sleep, mock_anthropic_client):
+    """Test a failed batch request stops only its own workflow."""
+    batches = mock_anthropic_client.messages.batches = _FakeBatches(errored_phase="coding")
+    coordinator = ClinicalPipelineCoordinator(client=mock_anthropic_client)
+
+    failed, completed = coordinator.process_batch(
+        [{"note": "Test note."}, {"note": "Another note."}]
+    )
+
+    assert failed.status == WorkflowStatus.FAILED
+    assert failed.coding.status == PhaseStatus.FAILED
+    assert failed.compliance.status == PhaseStatus.PENDING
+    assert completed.status == WorkflowStatus.COMPLETED
+    assert [len(requests) for requests in batches.submitted] == [2, 2, 1, 1]
+
+
+@patch("src.python.orchestration.workflow.time.sleep")
+def test_coordinator_process_batch_timeout(mock_sleep, mock_anthropic_client):
+    """Test a stuck stage batch is cancelled and fails every workflow instead of blocking."""
+    batches = mock_anthropic_client.messages.batches = _FakeBatches(stuck=True)
+    coordinator = ClinicalPipelineCoordinator(client=mock_anthropic_client)
+
+    states = coordinator.process_batch([{"note": "Test note."}, {"note": "Another."}], max_wait=0)
+
+    assert [state.status for state in states] == [WorkflowStatus.FAILED] * 2
+    assert [state.documentation.status for state in states] == [PhaseStatus.FAILED] * 2
+    assert batches.cancelled == ["0"]
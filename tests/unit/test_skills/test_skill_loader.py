@@ -2,6 +2,8 @@
 Unit tests for Skill Loader.
 """
 
+from pathlib import Path
+
 import pytest
 
 from src.python.skills.skill_loader import (
@@ -66,6 +68,18 @@ def test_load_skill_regulatory_compliance():
     assert "18 Identifiers" in content or "18 identifiers" in content
 
 
+def test_load_skill_does_not_touch_disk(monkeypatch):
+    """Test skills are served from the import-time preload without reading files."""
+
+    def fail_read_text(self, *args, **kwargs):
+        raise AssertionError(f"unexpected read of {self}")
+
+    monkeypatch.setattr(Path, "read_text", fail_read_text)
+
+    assert load_skill("coding_accuracy") is load_skill("coding_accuracy")
+    assert "Coding Accuracy" in load_skills(*AVAILABLE_SKILLS)
+
+
 def test_load_skill_unknown():
     """Test loading an unknown skill raises ValueError."""
     with pytest.raises(ValueError, match="Unknown skill"):